@@ -12,6 +12,8 @@ from fastapi.responses import JSONResponse
 
 from apps.api.routers import papers, search, graph, predictions, health, ingestion, system
 from apps.api.dependencies import get_neo4j_client, get_chromadb_client
+from packages.knowledge.index_optimizer import index_optimizer
+from packages.knowledge.neo4j_client import neo4j_client
 from packages.observability import (
     configure_logging,
     get_logger,
@@ -45,6 +47,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("✓ Neo4j connection verified")
     except Exception as e:
         logger.error(f"✗ Neo4j connection failed: {e}")
+
+    try:
+        if await index_optimizer.ensure_paper_arxiv_id_index():
+            logger.info("✓ Paper.arxiv_id index present")
+    except Exception as e:
+        logger.error(f"✗ Neo4j index check failed: {e}")
     
     try:
         chroma = await get_chromadb_client()
@@ -61,6 +69,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         neo4j = await get_neo4j_client()
         await neo4j.close()
+        # Shared driver used by packages.knowledge.hybrid_search
+        await neo4j_client.close()
         logger.info("✓ Neo4j connection closed")
     except Exception:
         pass
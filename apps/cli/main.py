@@ -81,31 +81,36 @@ def fetch(
 
     async def run_fetch() -> None:
         api_key = os.getenv("S2_API_KEY")
-        client = S2Client(api_key=api_key)
-
         results = []
-        with Progress(console=console) as progress:
-            task = progress.add_task("Fetching papers...", total=len(arxiv_ids))
-
-            for arxiv_id in arxiv_ids:
-                paper = await client.get_paper_by_arxiv_id(arxiv_id)
-                if paper:
-                    metadata = client.paper_to_metadata(paper)
-                    result = metadata.model_dump()
-
-                    if with_citations:
-                        citations = await client.get_paper_citations(arxiv_id, limit=20)
-                        result["citations"] = citations
-
-                    if with_references:
-                        references = await client.get_paper_references(arxiv_id, limit=20)
-                        result["references"] = references
-
-                    results.append(result)
-                    progress.update(task, advance=1)
-                else:
-                    console.print(f"[yellow]Paper not found: {arxiv_id}[/yellow]")
-                    progress.update(task, advance=1)
+        async with S2Client(api_key=api_key) as client:
+            with Progress(console=console) as progress:
+                task = progress.add_task("Fetching papers...", total=len(arxiv_ids))
+
+                for arxiv_id in arxiv_ids:
+                    try:
+                        paper = await client.get_paper_by_arxiv_id(arxiv_id)
+                    except Exception as e:
+                        console.print(f"[red]Failed to fetch {arxiv_id}: {e}[/red]")
+                        progress.update(task, advance=1)
+                        continue
+
+                    if paper:
+                        metadata = client.paper_to_metadata(paper)
+                        result = metadata.model_dump()
+
+                        if with_citations:
+                            citations = await client.get_paper_citations(arxiv_id, limit=20)
+                            result["citations"] = citations
+
+                        if with_references:
+                            references = await client.get_paper_references(arxiv_id, limit=20)
+                            result["references"] = references
+
+                        results.append(result)
+                        progress.update(task, advance=1)
+                    else:
+                        console.print(f"[yellow]Paper not found: {arxiv_id}[/yellow]")
+                        progress.update(task, advance=1)
 
         if not results:
             console.print("[red]No papers found[/red]")
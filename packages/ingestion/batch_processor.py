@@ -343,9 +343,8 @@ class PDFBatchParser:
 
         async def parse_pdf(pdf_path: Path) -> None:
             """Parse single PDF file."""
-            # Run sync parsing in thread pool
-            loop = asyncio.get_event_loop()
-            parsed = await loop.run_in_executor(None, parse_pdf_file, pdf_path)
+            # Run sync parsing in a worker thread
+            parsed = await asyncio.to_thread(parse_pdf_file, pdf_path)
 
             # Save output
             output_file = output_dir / f"{parsed.arxiv_id.replace('/', '_')}.json"
@@ -383,21 +382,22 @@ async def batch_fetch_from_s2(
     config = BatchConfig(batch_size=10, max_concurrent=5)
     processor = BatchProcessor(config)
 
-    client = S2Client()
     papers: list[dict[str, Any]] = []
 
-    async def fetch_paper(arxiv_id: str) -> None:
-        """Fetch single paper from S2."""
-        paper = await client.get_paper_by_arxiv_id(arxiv_id)
-        if paper:
-            metadata = client.paper_to_metadata(paper)
-            papers.append(metadata.model_dump())
-
-    result = await processor.process_items(
-        arxiv_ids,
-        fetch_paper,
-        desc="Fetching from S2",
-    )
+    async with S2Client() as client:
+
+        async def fetch_paper(arxiv_id: str) -> None:
+            """Fetch single paper from S2."""
+            paper = await client.get_paper_by_arxiv_id(arxiv_id)
+            if paper:
+                metadata = client.paper_to_metadata(paper)
+                papers.append(metadata.model_dump())
+
+        result = await processor.process_items(
+            arxiv_ids,
+            fetch_paper,
+            desc="Fetching from S2",
+        )
 
     # Save results if requested
     if output_file and papers:
@@ -8,22 +8,74 @@ Grobid is specialized for extracting structured metadata from scientific PDFs:
 """
 
 import asyncio
+import hashlib
+import tempfile
+from collections.abc import AsyncIterator
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import aiofiles
 import aiohttp
 import structlog
 from bs4 import BeautifulSoup
+from lxml import etree
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from packages.ingestion.models import ArxivPaper, Citation, CitationIntent, ParsedPaper
 
+# Optional: compress cached TEI (installed with the llm dependency group)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = structlog.get_logger()
 
 # Grobid service configuration
 DEFAULT_GROBID_URL = "http://localhost:8070"
 GROBID_TIMEOUT = 300  # 5 minutes for large papers
+GROBID_HEALTH_TIMEOUT = 5  # Seconds for the isalive probe
+GROBID_MAX_CONNECTIONS = 32  # Size of the keep-alive connection pool
+GROBID_KEEPALIVE_TIMEOUT = 60  # Seconds to keep idle connections open
+GROBID_BATCH_CONCURRENCY = 8  # Default PDFs in flight for batch parsing
+PDF_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads when streaming PDFs to Grobid
+
+# xml:id attribute in Clark notation (used by lxml)
+XML_ID_ATTR = "{http://www.w3.org/XML/1998/namespace}id"
+
+
+def _local_name(elem: etree._Element) -> str:
+    """Get an element's tag without its namespace."""
+    tag = elem.tag
+    if not isinstance(tag, str):  # Comments and processing instructions
+        return ""
+    return tag.rpartition("}")[2]
+
+
+async def _pdf_chunks(
+    pdf_path: Path, chunk_size: int = PDF_UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Read a PDF in chunks without blocking the event loop."""
+    async with aiofiles.open(pdf_path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
+def _pdf_digest(pdf_path: Path) -> str:
+    """Hash a PDF's contents without reading it fully into memory."""
+    with open(pdf_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _clear_element(elem: etree._Element) -> None:
+    """Free an already-processed element and its preceding siblings."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
 
 
 class GrobidConfig:
@@ -36,6 +88,8 @@ class GrobidConfig:
         timeout: int = GROBID_TIMEOUT,
         consolidate_citations: bool = True,
         consolidate_header: bool = True,
+        max_connections: int = GROBID_MAX_CONNECTIONS,
+        cache_dir: Path | None = None,
     ):
         """Initialize Grobid configuration.
 
@@ -44,11 +98,22 @@ class GrobidConfig:
             timeout: Request timeout in seconds
             consolidate_citations: Consolidate citations with external services
             consolidate_header: Consolidate header metadata
+            max_connections: Size of the HTTP connection pool
+            cache_dir: Directory for TEI output cached by PDF content hash
+                (None to disable caching)
         """
         self.service_url = service_url.rstrip("/")
         self.timeout = timeout
         self.consolidate_citations = consolidate_citations
         self.consolidate_header = consolidate_header
+        self.max_connections = max_connections
+        self.cache_dir = cache_dir
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the options that affect Grobid's TEI output."""
+        options = f"{int(self.consolidate_citations)}{int(self.consolidate_header)}"
+        return hashlib.sha256(options.encode()).hexdigest()[:12]
 
 
 class GrobidParser:
@@ -62,12 +127,18 @@ class GrobidParser:
         """
         self.config = config or GrobidConfig()
         self._session: aiohttp.ClientSession | None = None
+        self._health_timeout = aiohttp.ClientTimeout(total=GROBID_HEALTH_TIMEOUT)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections,
+                keepalive_timeout=GROBID_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
 
     async def close(self) -> None:
@@ -84,7 +155,7 @@ class GrobidParser:
         try:
             session = await self._get_session()
             url = f"{self.config.service_url}/api/isalive"
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            async with session.get(url, timeout=self._health_timeout) as response:
                 return response.status == 200
         except Exception as e:
             logger.warning("grobid_health_check_failed", error=str(e))
@@ -116,11 +187,12 @@ class GrobidParser:
         session = await self._get_session()
         url = f"{self.config.service_url}/api/processFulltextDocument"
 
-        # Prepare form data
+        # Prepare form data; the PDF is streamed so large files are never
+        # read on the event loop thread (and no file handle is leaked)
         data = aiohttp.FormData()
         data.add_field(
             "input",
-            open(pdf_path, "rb"),
+            _pdf_chunks(pdf_path),
             filename=pdf_path.name,
             content_type="application/pdf",
         )
@@ -146,6 +218,84 @@ class GrobidParser:
             logger.error("grobid_processing_failed", error=str(e), pdf_path=str(pdf_path))
             raise
 
+    def _tei_cache_path(self, pdf_path: Path) -> Path:
+        """Get the cache file for a PDF's TEI output."""
+        assert self.config.cache_dir is not None
+        key = f"{_pdf_digest(pdf_path)}-{self.config.fingerprint}"
+        suffix = ".tei.xml.zst" if zstandard is not None else ".tei.xml"
+        return self.config.cache_dir / f"{key}{suffix}"
+
+    def _read_cached_tei(self, cache_path: Path) -> str | None:
+        """Read cached TEI XML, or None on a cache miss."""
+        if not cache_path.exists():
+            return None
+        data = cache_path.read_bytes()
+        if cache_path.suffix == ".zst":
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode("utf-8")
+
+    def _write_cached_tei(self, cache_path: Path, tei_xml: str) -> None:
+        """Write TEI XML to the cache.
+
+        The data goes to a uniquely named temp file that is then renamed into
+        place, so concurrent writers of the same entry never share a file.
+        """
+        data = tei_xml.encode("utf-8")
+        if cache_path.suffix == ".zst":
+            data = zstandard.ZstdCompressor().compress(data)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp", delete=False
+        )
+        tmp_path = Path(tmp.name)
+        try:
+            with tmp:
+                tmp.write(data)
+            tmp_path.replace(cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    async def _process_pdf_cached(self, pdf_path: Path) -> str:
+        """Return TEI XML for a PDF, using the content-hash cache if enabled.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            TEI XML string
+
+        Raises:
+            RuntimeError: If the Grobid service is unavailable on a cache miss
+        """
+        cache_path = None
+        if self.config.cache_dir is not None:
+            cache_path = await asyncio.to_thread(self._tei_cache_path, pdf_path)
+            tei_xml = await asyncio.to_thread(self._read_cached_tei, cache_path)
+            if tei_xml is not None:
+                logger.debug("grobid_cache_hit", pdf_path=str(pdf_path))
+                return tei_xml
+
+        # Check service health
+        if not await self.check_service_health():
+            raise RuntimeError(
+                f"Grobid service not available at {self.config.service_url}. "
+                "Start with: docker compose up -d grobid"
+            )
+
+        tei_xml = await self.process_pdf(pdf_path)
+
+        if cache_path is not None:
+            # The cache is an optimization; a failed write must not fail the parse
+            try:
+                await asyncio.to_thread(self._write_cached_tei, cache_path, tei_xml)
+            except Exception as e:
+                logger.warning(
+                    "grobid_cache_write_failed", cache_path=str(cache_path), error=str(e)
+                )
+
+        return tei_xml
+
     def _extract_metadata_from_tei(self, tei_xml: str) -> dict[str, Any]:
         """Extract metadata from TEI XML.
 
@@ -188,48 +338,83 @@ class GrobidParser:
     def _extract_citations_from_tei(self, tei_xml: str) -> list[Citation]:
         """Extract citations with context from TEI XML.
 
+        Streams the document with ``iterparse`` instead of building the
+        full DOM: bibliography entries are cleared as soon as they have been
+        read, and body text a whole top-level section at a time, so memory
+        stays bounded on book-length papers.
+
         Args:
             tei_xml: TEI XML string
 
         Returns:
             List of citations
         """
-        soup = BeautifulSoup(tei_xml, "xml")
-        citations: list[Citation] = []
-
-        # Find all reference pointers in text
-        for ref in soup.find_all("ref", {"type": "bibr"}):
-            target = ref.get("target", "")
-            if not target:
+        # [ref_id, context] in document order; contexts are filled in when
+        # the ref's parent closes, and bibls are resolved at the end
+        refs: list[list[str]] = []
+        # id(parent) -> (parent, indexes into refs) for refs waiting on their
+        # parent to close, so each parent's text is materialised once however
+        # many refs it holds. Keeping the element referenced keeps its id stable.
+        pending: dict[int, tuple[etree._Element, list[int]]] = {}
+        bibls_by_id: dict[str, tuple[str, str | None, str | None]] = {}
+
+        events = etree.iterparse(
+            BytesIO(tei_xml.encode("utf-8")), events=("end",), recover=True
+        )
+        for _, elem in events:
+            name = _local_name(elem)
+
+            if name == "ref":
+                target = elem.get("target", "")
+                if elem.get("type") == "bibr" and target:
+                    parent = elem.getparent()
+                    if parent is None:
+                        parent = elem
+                    pending.setdefault(id(parent), (parent, []))[1].append(len(refs))
+                    refs.append([target.lstrip("#"), ""])
                 continue
 
-            # Get surrounding context
-            parent = ref.parent
-            if parent:
-                context = parent.get_text(strip=True)
-            else:
-                context = ref.get_text(strip=True)
+            if name == "biblStruct":
+                bib_id = elem.get(XML_ID_ATTR)
+                if bib_id:
+                    # Extract identifiers
+                    arxiv_id = None
+                    doi = None
+                    for idno in elem.iter("{*}idno"):
+                        idno_type = idno.get("type", "").lower()
+                        if idno_type == "arxiv":
+                            arxiv_id = "".join(idno.itertext()).strip()
+                        elif idno_type == "doi":
+                            doi = "".join(idno.itertext()).strip()
+
+                    # Get raw reference text
+                    raw_text = " ".join(
+                        t.strip() for t in elem.itertext() if t.strip()
+                    )
+                    bibls_by_id[bib_id] = (raw_text, arxiv_id, doi)
+                _clear_element(elem)
+                continue
 
-            # Find the referenced bibliography entry
-            ref_id = target.lstrip("#")
-            bib_entry = soup.find("biblStruct", {"xml:id": ref_id})
+            # Resolve context for refs whose enclosing element just closed
+            waiting = pending.pop(id(elem), None) if pending else None
+            if waiting is not None:
+                context = "".join(t.strip() for t in elem.itertext())
+                for index in waiting[1]:
+                    refs[index][1] = context
+
+            # Inline elements (hi, emph, s) and paragraphs may still be part of
+            # an enclosing element's context, so body text is only freed once
+            # a top-level section closes with no refs left waiting
+            if name == "div" and not pending:
+                parent = elem.getparent()
+                if parent is not None and _local_name(parent) != "div":
+                    _clear_element(elem)
 
+        citations: list[Citation] = []
+        for ref_id, context in refs:
+            bib_entry = bibls_by_id.get(ref_id)
             if bib_entry:
-                # Extract identifiers
-                arxiv_id = None
-                doi = None
-
-                # Check for arXiv ID
-                for idno in bib_entry.find_all("idno"):
-                    idno_type = idno.get("type", "").lower()
-                    if idno_type == "arxiv":
-                        arxiv_id = idno.get_text(strip=True)
-                    elif idno_type == "doi":
-                        doi = idno.get_text(strip=True)
-
-                # Get raw reference text
-                raw_text = bib_entry.get_text(separator=" ", strip=True)
-
+                raw_text, arxiv_id, doi = bib_entry
                 citation = Citation(
                     raw_text=raw_text[:200],  # Limit length
                     arxiv_id=arxiv_id,
@@ -245,28 +430,56 @@ class GrobidParser:
     def _extract_sections_from_tei(self, tei_xml: str) -> list[dict[str, Any]]:
         """Extract section structure from TEI XML.
 
+        Section levels come from a running depth counter maintained while
+        walking the tree, so no ancestor chains are rebuilt per div.
+
         Args:
             tei_xml: TEI XML string
 
         Returns:
             List of section dictionaries
         """
-        soup = BeautifulSoup(tei_xml, "xml")
+        root = etree.fromstring(
+            tei_xml.encode("utf-8"), etree.XMLParser(recover=True, remove_comments=True)
+        )
         sections = []
+        if root is None:
+            return sections
+
+        # Paragraph text by element: nested divs share their descendants'
+        # paragraphs, so each is only materialised once. Keying on the
+        # element keeps its proxy alive, so lookups return the same object.
+        paragraph_text: dict[etree._Element, str] = {}
+
+        # Running element depth; the root element is at depth 1
+        depth = 0
+        for event, elem in etree.iterwalk(root, events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                continue
+            depth += 1
 
-        # Find all div elements (sections)
-        for div in soup.find_all("div"):
-            head = div.find("head")
-            if head:
-                title = head.get_text(strip=True)
+            if _local_name(elem) != "div":
+                continue
 
-                # Get section content
-                paragraphs = div.find_all("p")
-                content = "\n\n".join(p.get_text(strip=True) for p in paragraphs)
+            head = next(elem.iter("{*}head"), None)
+            if head is not None:
+                title = "".join(t.strip() for t in head.itertext())
 
-                # Determine level from nesting
-                level = len(list(div.parents)) - len(list(soup.parents))
-                level = max(1, min(level, 6))
+                # Get section content
+                texts = []
+                for p in elem.iter("{*}p"):
+                    text = paragraph_text.get(p)
+                    if text is None:
+                        text = paragraph_text[p] = "".join(
+                            t.strip() for t in p.itertext()
+                        )
+                    texts.append(text)
+                content = "\n\n".join(texts)
+
+                # Determine level from nesting (number of ancestors,
+                # counting the document node)
+                level = max(1, min(depth, 6))
 
                 sections.append({"title": title, "content": content, "level": level})
 
@@ -292,17 +505,10 @@ class GrobidParser:
         if not paper.pdf_path or not paper.pdf_path.exists():
             raise ValueError(f"No PDF available for {paper.arxiv_id}")
 
-        # Check service health
-        if not await self.check_service_health():
-            raise RuntimeError(
-                f"Grobid service not available at {self.config.service_url}. "
-                "Start with: docker compose up -d grobid"
-            )
-
         logger.info("parsing_paper_with_grobid", arxiv_id=paper.arxiv_id)
 
-        # Process PDF
-        tei_xml = await self.process_pdf(paper.pdf_path)
+        # Process PDF (served from the TEI cache when configured)
+        tei_xml = await self._process_pdf_cached(paper.pdf_path)
 
         # Save TEI XML if output directory provided
         if output_dir:
@@ -311,10 +517,13 @@ class GrobidParser:
             xml_path.write_text(tei_xml, encoding="utf-8")
             logger.debug("saved_tei_xml", path=str(xml_path))
 
-        # Extract structured data
-        metadata = self._extract_metadata_from_tei(tei_xml)
-        citations = self._extract_citations_from_tei(tei_xml)
-        sections = self._extract_sections_from_tei(tei_xml)
+        # Extract structured data off the event loop; the extractors are
+        # independent, so run them concurrently
+        metadata, citations, sections = await asyncio.gather(
+            asyncio.to_thread(self._extract_metadata_from_tei, tei_xml),
+            asyncio.to_thread(self._extract_citations_from_tei, tei_xml),
+            asyncio.to_thread(self._extract_sections_from_tei, tei_xml),
+        )
 
         parsed_data = {
             "metadata": metadata,
@@ -345,4 +554,56 @@ async def parse_with_grobid(
     try:
         return await parser.parse(paper, output_dir)
     finally:
-        await parser.close()
\ No newline at end of file
+        await parser.close()
+
+
+async def parse_papers_with_grobid(
+    papers: list[ArxivPaper],
+    *,
+    concurrency: int = GROBID_BATCH_CONCURRENCY,
+    output_dir: Path | None = None,
+    config: GrobidConfig | None = None,
+    skip_errors: bool = True,
+) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Parse multiple papers with Grobid concurrently.
+
+    All papers share one parser (and so one keep-alive HTTP session);
+    at most ``concurrency`` PDFs are in flight against the server.
+
+    Args:
+        papers: Papers with pdf_path set
+        concurrency: Maximum number of simultaneous Grobid requests
+        output_dir: Optional directory to save TEI XML
+        config: Optional parser configuration
+        skip_errors: If True, continue on individual failures
+
+    Returns:
+        Dictionary mapping arXiv ID to (tei_xml, parsed_data_dict)
+    """
+    config = config or GrobidConfig(max_connections=concurrency)
+    parser = GrobidParser(config)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _parse_one(paper: ArxivPaper) -> tuple[str, dict[str, Any]]:
+        async with semaphore:
+            return await parser.parse(paper, output_dir)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(_parse_one(paper) for paper in papers),
+            return_exceptions=True,
+        )
+    finally:
+        await parser.close()
+
+    results: dict[str, tuple[str, dict[str, Any]]] = {}
+    for paper, outcome in zip(papers, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error("grobid_batch_parse_failed", arxiv_id=paper.arxiv_id, error=str(outcome))
+            if not skip_errors:
+                raise outcome
+            continue
+        results[paper.arxiv_id] = outcome
+
+    logger.info("grobid_batch_complete", parsed=len(results), total=len(papers))
+    return results
@@ -7,17 +7,48 @@ This module provides utilities to:
 - Create subsets for initial development
 """
 
+import gzip
+import io
 import json
-from collections.abc import Generator, Iterator
+import os
+import re
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import TextIO
+from typing import Any, BinaryIO, TextIO, TypeVar
 
 import structlog
 
 from packages.ingestion.models import ArxivCategory, PaperMetadata
 
+# orjson is much faster on the multi-GB dump; it is installed with the
+# graph/llm dependency groups, so fall back to the stdlib when absent.
+# Both accept bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional: zstd-compressed snapshots (installed with the llm dependency group)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
+# Buffered binary reads used by the streaming loaders
+KAGGLE_READ_BUFFER_BYTES = 1 << 20
+KAGGLE_READ_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Byte range handed to each worker by stream_kaggle_metadata_parallel
+KAGGLE_PARALLEL_CHUNK_BYTES = 64 * 1024 * 1024
+
 # Physics and math category prefixes to include
 PHYSICS_MATH_PREFIXES = (
     "hep-",  # High-energy physics
@@ -32,6 +63,17 @@ PHYSICS_MATH_PREFIXES = (
     "physics.",  # General physics
 )
 
+# Cheap raw-bytes check run before JSON decoding. It matches a superset of
+# is_physics_math_paper, so lines it rejects can be skipped unparsed.
+_PHYSICS_MATH_LINE_RE = re.compile(
+    rb'"categories"\s*:\s*"[^"]*\b(?:'
+    + b"|".join(re.escape(prefix.encode()) for prefix in PHYSICS_MATH_PREFIXES)
+    + rb")"
+)
+
+# Captures the raw categories string; arXiv categories never contain escapes
+_CATEGORIES_FIELD_RE = re.compile(rb'"categories"\s*:\s*"([^"\\]*)"')
+
 
 def is_physics_math_paper(categories: str) -> bool:
     """Check if paper belongs to physics or math categories.
@@ -42,30 +84,81 @@ def is_physics_math_paper(categories: str) -> bool:
     Returns:
         True if any category matches physics/math prefixes
     """
-    for category in categories.split():
-        for prefix in PHYSICS_MATH_PREFIXES:
-            if category.startswith(prefix):
-                return True
-    return False
+    return any(category.startswith(PHYSICS_MATH_PREFIXES) for category in categories.split())
 
 
-def stream_kaggle_metadata(
+def _open_kaggle_file(file_path: Path) -> BinaryIO:
+    """Open a Kaggle snapshot for binary reading, decompressing if needed.
+
+    ``.gz`` files are read with gzip and ``.zst`` files with zstandard;
+    anything else is opened as plain JSON Lines. Compressing the snapshot
+    with ``zstd --long`` shrinks it roughly 4x, so streaming becomes bound
+    by decompression CPU rather than disk bandwidth.
+
+    Args:
+        file_path: Path to the (possibly compressed) snapshot
+
+    Returns:
+        Binary file object yielding uncompressed JSON Lines
+    """
+    suffix = file_path.suffix
+    if suffix == ".gz":
+        return gzip.open(file_path, "rb")
+    if suffix == ".zst":
+        if zstandard is None:
+            raise ImportError("zstandard not installed. Install with: pip install zstandard")
+        fh = open(file_path, "rb")
+        # Allow frames written with --long (window up to 2 GiB)
+        decompressor = zstandard.ZstdDecompressor(max_window_size=1 << 31)
+        reader = decompressor.stream_reader(fh, closefd=True)
+        return io.BufferedReader(reader, buffer_size=KAGGLE_READ_BUFFER_BYTES)
+    return open(file_path, "rb", buffering=KAGGLE_READ_BUFFER_BYTES)
+
+
+def _iter_lines(
+    f: BinaryIO, chunk_size: int = KAGGLE_READ_CHUNK_BYTES
+) -> Iterator[bytes]:
+    """Yield newline-delimited lines from a binary file using large reads.
+
+    Lines are yielded without their trailing newline; blank lines are skipped.
+
+    Args:
+        f: File opened in binary mode
+        chunk_size: Bytes to read per call
+
+    Yields:
+        Raw line bytes
+    """
+    partial = b""
+    while chunk := f.read(chunk_size):
+        lines = (partial + chunk).split(b"\n")
+        partial = lines.pop()
+        for line in lines:
+            if line:
+                yield line
+    if partial:
+        yield partial
+
+
+def _stream_kaggle_records(
     file_path: Path,
+    build: Callable[[dict[str, Any]], T],
     *,
-    filter_physics_math: bool = True,
-    limit: int | None = None,
-) -> Generator[PaperMetadata, None, None]:
-    """Stream paper metadata from Kaggle JSON Lines file.
+    filter_physics_math: bool,
+    limit: int | None,
+) -> Generator[T, None, None]:
+    """Stream decoded records from a Kaggle JSON Lines file.
 
-    Efficiently processes large files without loading everything into memory.
+    Shared loop behind the public streaming functions.
 
     Args:
         file_path: Path to arxiv-metadata-oai-snapshot.json
+        build: Converts each decoded JSON dict into the yielded record
         filter_physics_math: If True, only yield physics/math papers
-        limit: Maximum number of papers to yield (None for all)
+        limit: Maximum number of records to yield (None for all)
 
     Yields:
-        PaperMetadata objects for matching papers
+        Records produced by ``build`` for matching papers
     """
     if not file_path.exists():
         raise FileNotFoundError(f"Kaggle dataset not found: {file_path}")
@@ -75,21 +168,26 @@ def stream_kaggle_metadata(
 
     logger.info("streaming_kaggle_metadata", path=str(file_path), filter=filter_physics_math)
 
-    with open(file_path, encoding="utf-8") as f:
-        for line in f:
+    # Read raw bytes in large chunks: the JSON parser decodes UTF-8 itself
+    with _open_kaggle_file(file_path) as f:
+        for line in _iter_lines(f):
             if limit and count >= limit:
                 break
 
+            if filter_physics_math and not _PHYSICS_MATH_LINE_RE.search(line):
+                filtered_count += 1
+                continue
+
             try:
-                data = json.loads(line)
+                data = _json_loads(line)
                 categories = data.get("categories", "")
 
                 if filter_physics_math and not is_physics_math_paper(categories):
                     filtered_count += 1
                     continue
 
-                metadata = PaperMetadata.model_validate(data)
-                yield metadata
+                record = build(data)
+                yield record
                 count += 1
 
                 if count % 10000 == 0:
@@ -107,6 +205,227 @@ def stream_kaggle_metadata(
     )
 
 
+# Keys a record must carry for PaperMetadata (by alias where one is set)
+_REQUIRED_METADATA_KEYS = tuple(
+    field.alias or name
+    for name, field in PaperMetadata.model_fields.items()
+    if field.is_required()
+)
+
+
+def _construct_metadata(data: dict[str, Any]) -> PaperMetadata:
+    """Build PaperMetadata from a trusted record without full validation.
+
+    Keeps the cheap checks Pydantic would otherwise do: required keys must be
+    present and categories are normalized to a space-separated list.
+
+    Raises:
+        ValueError: If a required key is missing
+    """
+    missing = [key for key in _REQUIRED_METADATA_KEYS if key not in data]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    data["categories"] = data["categories"].replace(",", " ").strip()
+    return PaperMetadata.model_construct(**data)
+
+
+def stream_kaggle_metadata(
+    file_path: Path,
+    *,
+    filter_physics_math: bool = True,
+    limit: int | None = None,
+    validate: bool = False,
+) -> Generator[PaperMetadata, None, None]:
+    """Stream paper metadata from Kaggle JSON Lines file.
+
+    Efficiently processes large files without loading everything into memory.
+    ``.gz`` and ``.zst`` snapshots are decompressed on the fly.
+    The Kaggle dump is well-formed, so by default records are built with
+    ``model_construct`` and skip Pydantic type validation (required keys and
+    category normalization are still applied). Pass ``validate=True`` for a
+    fully checked pass.
+
+    Args:
+        file_path: Path to arxiv-metadata-oai-snapshot.json (optionally .gz/.zst)
+        filter_physics_math: If True, only yield physics/math papers
+        limit: Maximum number of papers to yield (None for all)
+        validate: If True, validate each record with Pydantic
+
+    Yields:
+        PaperMetadata objects for matching papers
+    """
+    build = PaperMetadata.model_validate if validate else _construct_metadata
+    yield from _stream_kaggle_records(
+        file_path,
+        build,
+        filter_physics_math=filter_physics_math,
+        limit=limit,
+    )
+
+
+def stream_kaggle_records_raw(
+    file_path: Path,
+    *,
+    filter_physics_math: bool = True,
+    limit: int | None = None,
+) -> Generator[dict[str, Any], None, None]:
+    """Stream raw record dicts from Kaggle JSON Lines file.
+
+    For consumers that only need a few fields (e.g. ``id``, ``categories``,
+    ``abstract``) and don't need PaperMetadata objects at all.
+
+    Args:
+        file_path: Path to arxiv-metadata-oai-snapshot.json
+        filter_physics_math: If True, only yield physics/math papers
+        limit: Maximum number of records to yield (None for all)
+
+    Yields:
+        Decoded JSON dicts for matching papers
+    """
+    yield from _stream_kaggle_records(
+        file_path,
+        lambda data: data,
+        filter_physics_math=filter_physics_math,
+        limit=limit,
+    )
+
+
+def _parse_kaggle_byte_range(
+    file_path: Path,
+    start: int,
+    end: int,
+    filter_physics_math: bool,
+    validate: bool,
+) -> list[PaperMetadata]:
+    """Parse the lines that start within ``[start, end)`` of a Kaggle file.
+
+    Runs in a worker process for stream_kaggle_metadata_parallel.
+    """
+    build = PaperMetadata.model_validate if validate else _construct_metadata
+    papers: list[PaperMetadata] = []
+
+    with open(file_path, "rb") as f:
+        # Align on a line boundary: a line belongs to the range it starts in
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+
+            if filter_physics_math and not _PHYSICS_MATH_LINE_RE.search(line):
+                continue
+
+            try:
+                data = _json_loads(line)
+                if filter_physics_math and not is_physics_math_paper(
+                    data.get("categories", "")
+                ):
+                    continue
+                papers.append(build(data))
+            except json.JSONDecodeError as e:
+                logger.warning("json_decode_error", error=str(e))
+            except Exception as e:
+                logger.warning("metadata_parse_error", error=str(e), data=data.get("id"))
+
+    return papers
+
+
+def stream_kaggle_metadata_parallel(
+    file_path: Path,
+    *,
+    filter_physics_math: bool = True,
+    limit: int | None = None,
+    validate: bool = False,
+    workers: int | None = None,
+    chunk_size: int = KAGGLE_PARALLEL_CHUNK_BYTES,
+) -> Generator[PaperMetadata, None, None]:
+    """Stream paper metadata using a pool of worker processes.
+
+    The file is split into byte ranges that are decoded in parallel;
+    results are yielded in file order, with only a few ranges in flight
+    at once to bound memory. Compressed snapshots cannot be split, so they
+    fall back to stream_kaggle_metadata.
+
+    Args:
+        file_path: Path to arxiv-metadata-oai-snapshot.json
+        filter_physics_math: If True, only yield physics/math papers
+        limit: Maximum number of papers to yield (None for all)
+        validate: If True, validate each record with Pydantic
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Bytes of input per work unit
+
+    Yields:
+        PaperMetadata objects for matching papers
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Kaggle dataset not found: {file_path}")
+
+    if file_path.suffix in (".gz", ".zst"):
+        yield from stream_kaggle_metadata(
+            file_path,
+            filter_physics_math=filter_physics_math,
+            limit=limit,
+            validate=validate,
+        )
+        return
+
+    workers = workers or os.cpu_count() or 1
+    file_size = file_path.stat().st_size
+    ranges = deque(
+        (start, min(start + chunk_size, file_size))
+        for start in range(0, file_size, chunk_size)
+    )
+
+    logger.info(
+        "streaming_kaggle_metadata_parallel",
+        path=str(file_path),
+        filter=filter_physics_math,
+        workers=workers,
+        chunks=len(ranges),
+    )
+
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[PaperMetadata]]] = deque()
+
+        def _submit_next() -> None:
+            start, end = ranges.popleft()
+            pending.append(
+                executor.submit(
+                    _parse_kaggle_byte_range,
+                    file_path,
+                    start,
+                    end,
+                    filter_physics_math,
+                    validate,
+                )
+            )
+
+        while ranges and len(pending) < workers * 2:
+            _submit_next()
+
+        try:
+            while pending:
+                papers = pending.popleft().result()
+                if ranges:
+                    _submit_next()
+
+                for paper in papers:
+                    if limit and count >= limit:
+                        return
+                    yield paper
+                    count += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            logger.info("streaming_complete", total_loaded=count)
+
+
 def load_kaggle_metadata(
     file_path: Path,
     *,
@@ -147,14 +466,13 @@ def filter_by_categories(
     Yields:
         Papers matching any of the specified categories
     """
-    category_set = {
+    category_set = frozenset(
         c.value if isinstance(c, ArxivCategory) else c
         for c in categories
-    }
+    )
 
     for paper in papers:
-        paper_categories = set(paper.category_list)
-        if paper_categories & category_set:
+        if any(c in category_set for c in paper.category_list):
             yield paper
 
 
@@ -170,13 +488,66 @@ def get_category_counts(file_path: Path, limit: int | None = None) -> dict[str,
     Returns:
         Dictionary mapping category to paper count
     """
-    counts: dict[str, int] = {}
+    counts: Counter[str] = Counter()
 
     for paper in stream_kaggle_metadata(file_path, filter_physics_math=False, limit=limit):
-        for category in paper.category_list:
-            counts[category] = counts.get(category, 0) + 1
+        counts.update(paper.category_list)
 
-    return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+    return dict(counts.most_common())
+
+
+def _stream_raw_lines_filtered(
+    file_path: Path,
+    filter_physics_math: bool,
+    categories: list[str | ArxivCategory] | None = None,
+) -> Generator[bytes, None, None]:
+    """Stream raw JSON lines whose categories match, without building models.
+
+    The categories field is read straight from the line bytes; the line is
+    only JSON-decoded if that field can't be located.
+
+    Args:
+        file_path: Path to Kaggle dataset
+        filter_physics_math: If True, only yield physics/math papers
+        categories: Specific categories to require (None for no restriction)
+
+    Yields:
+        Raw line bytes (without trailing newline)
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Kaggle dataset not found: {file_path}")
+
+    category_set = (
+        frozenset(c.value if isinstance(c, ArxivCategory) else c for c in categories)
+        if categories
+        else None
+    )
+
+    with _open_kaggle_file(file_path) as f:
+        for line in _iter_lines(f):
+            if filter_physics_math and not _PHYSICS_MATH_LINE_RE.search(line):
+                continue
+            if not filter_physics_math and category_set is None:
+                yield line
+                continue
+
+            match = _CATEGORIES_FIELD_RE.search(line)
+            if match:
+                paper_categories = match.group(1).decode()
+            else:
+                try:
+                    paper_categories = _json_loads(line).get("categories", "")
+                except json.JSONDecodeError as e:
+                    logger.warning("json_decode_error", error=str(e))
+                    continue
+            paper_categories = paper_categories.replace(",", " ")
+
+            if filter_physics_math and not is_physics_math_paper(paper_categories):
+                continue
+            if category_set is not None and category_set.isdisjoint(paper_categories.split()):
+                continue
+
+            yield line
 
 
 def create_subset(
@@ -188,6 +559,9 @@ def create_subset(
 ) -> int:
     """Create a filtered subset of the Kaggle dataset.
 
+    Matching records are copied verbatim, so the subset keeps the original
+    Kaggle schema and can be read back with stream_kaggle_metadata.
+
     Args:
         input_path: Path to full Kaggle dataset
         output_path: Path for filtered output (JSON Lines)
@@ -199,17 +573,14 @@ def create_subset(
     """
     count = 0
 
-    papers = stream_kaggle_metadata(input_path, filter_physics_math=True, limit=None)
-
-    if categories:
-        papers = filter_by_categories(papers, categories)
+    lines = _stream_raw_lines_filtered(input_path, True, categories)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for paper in papers:
+    with open(output_path, "wb") as f:
+        for line in lines:
             if limit and count >= limit:
                 break
 
-            f.write(paper.model_dump_json() + "\n")
+            f.write(line + b"\n")
             count += 1
 
     logger.info("subset_created", path=str(output_path), count=count)
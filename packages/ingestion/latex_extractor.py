@@ -8,7 +8,12 @@ Extracts and identifies:
 - Mathematical constants
 """
 
+import dataclasses
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -16,9 +21,14 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Texts shorter than this are cheap to rescan and not worth caching
+EXTRACT_ALL_CACHE_MIN_CHARS = 1024
+# extract_all results kept, keyed on a digest of the text (not the text itself)
+EXTRACT_ALL_CACHE_SIZE = 32
+
 # Equation patterns
 DISPLAY_EQUATION_PATTERNS = [
-    re.compile(r"\$\$(.+?)\$\$", re.DOTALL),  # $$...$$
+    re.compile(r"\$\$([^$]+)\$\$"),  # $$...$$
     re.compile(r"\\\[(.+?)\\\]", re.DOTALL),  # \[...\]
     re.compile(r"\\begin\{equation\}(.+?)\\end\{equation\}", re.DOTALL),
     re.compile(r"\\begin\{equation\*\}(.+?)\\end\{equation\*\}", re.DOTALL),
@@ -28,7 +38,15 @@ DISPLAY_EQUATION_PATTERNS = [
     re.compile(r"\\begin\{gather\}(.+?)\\end\{gather\}", re.DOTALL),
 ]
 
-INLINE_EQUATION_PATTERN = re.compile(r"\$([^$]+?)\$")
+# All display forms in one alternation, so the text is scanned once; each
+# alternative has exactly one capturing group (the equation body)
+DISPLAY_EQUATION_UNION = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in DISPLAY_EQUATION_PATTERNS), re.DOTALL
+)
+
+# Inline math may wrap across lines in LaTeX source and extracted PDF text;
+# the negated class already stops at the next $, so it needs no lazy scan
+INLINE_EQUATION_PATTERN = re.compile(r"\$([^$]+)\$")
 
 # Named equation patterns (physics/math specific)
 NAMED_EQUATIONS = {
@@ -50,20 +68,28 @@ NAMED_EQUATIONS = {
     r"Bose-Einstein\s+distribution": "Bose-Einstein distribution",
 }
 
-# Theorem patterns
+NAMED_EQUATION_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), name) for pattern, name in NAMED_EQUATIONS.items()
+]
+
+# Theorem-like LaTeX environments (names match case-insensitively). These
+# are located with str.find rather than a DOTALL regex scan per environment.
+THEOREM_ENVIRONMENTS = ("theorem", "lemma", "proposition", "corollary")
+CONJECTURE_ENVIRONMENTS = ("conjecture",)
+_ENV_END_PATTERNS = {
+    name: re.compile(rf"\\end\{{{name}\}}", re.IGNORECASE)
+    for name in THEOREM_ENVIRONMENTS + CONJECTURE_ENVIRONMENTS
+}
+
+# Numbered statements run to the next blank line; the body is a possessive
+# tempered token, so it never backtracks over long paragraphs.
 THEOREM_PATTERNS = [
-    re.compile(r"\\begin\{theorem\}(.+?)\\end\{theorem\}", re.DOTALL | re.IGNORECASE),
-    re.compile(r"\\begin\{lemma\}(.+?)\\end\{lemma\}", re.DOTALL | re.IGNORECASE),
-    re.compile(r"\\begin\{proposition\}(.+?)\\end\{proposition\}", re.DOTALL | re.IGNORECASE),
-    re.compile(r"\\begin\{corollary\}(.+?)\\end\{corollary\}", re.DOTALL | re.IGNORECASE),
-    re.compile(r"Theorem\s+(\d+(?:\.\d+)?)[:.]\s*(.+?)(?=\\n\\n|\Z)", re.DOTALL),
-    re.compile(r"Lemma\s+(\d+(?:\.\d+)?)[:.]\s*(.+?)(?=\\n\\n|\Z)", re.DOTALL),
+    re.compile(r"Theorem\s+(\d+(?:\.\d+)?)[:.]\s*((?:(?!\n\n).)++)", re.DOTALL),
+    re.compile(r"Lemma\s+(\d+(?:\.\d+)?)[:.]\s*((?:(?!\n\n).)++)", re.DOTALL),
 ]
 
-# Conjecture patterns
 CONJECTURE_PATTERNS = [
-    re.compile(r"\\begin\{conjecture\}(.+?)\\end\{conjecture\}", re.DOTALL | re.IGNORECASE),
-    re.compile(r"Conjecture\s+(\d+(?:\.\d+)?)[:.]\s*(.+?)(?=\\n\\n|\Z)", re.DOTALL),
+    re.compile(r"Conjecture\s+(\d+(?:\.\d+)?)[:.]\s*((?:(?!\n\n).)++)", re.DOTALL),
 ]
 
 # Physical constants (common in physics papers)
@@ -77,8 +103,107 @@ PHYSICAL_CONSTANTS = {
     r"fine[\s-]structure\s+constant": "fine-structure constant",
 }
 
+PHYSICAL_CONSTANT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), name) for pattern, name in PHYSICAL_CONSTANTS.items()
+]
+
+def _keyword_trie_pattern(keywords: list[tuple[str, str]]) -> str:
+    """Build one alternation over keyword patterns, branched on first character.
+
+    A flat alternation makes the regex engine try every keyword at every
+    position. Grouping keywords under their (case-folded) first character
+    turns that into a one-level trie, as an Aho-Corasick automaton would:
+    most positions are rejected by a single character test.
+
+    Args:
+        keywords: (group name, regex pattern) pairs; each pattern must start
+            with a literal character or an escaped backslash
+
+    Returns:
+        Regex source with one named group per keyword
+    """
+    branches: dict[str, list[str]] = {}
+    for group, pattern in keywords:
+        head = pattern[:2] if pattern.startswith("\\") else pattern[0].lower()
+        branches.setdefault(head, []).append(f"(?P<{group}>{pattern[len(head):]})")
+    return "|".join(f"{head}(?:{'|'.join(tails)})" for head, tails in branches.items())
+
+
+# Named equations and constants in one scan, dispatched on the name of the
+# group that matched (named_<i> / constant_<i>)
+KEYWORD_UNION = re.compile(
+    _keyword_trie_pattern(
+        [(f"named_{i}", p.pattern) for i, (p, _) in enumerate(NAMED_EQUATION_PATTERNS)]
+        + [(f"constant_{i}", p.pattern) for i, (p, _) in enumerate(PHYSICAL_CONSTANT_PATTERNS)]
+    ),
+    re.IGNORECASE,
+)
+KEYWORD_GROUPS: dict[str, tuple[str, str]] = {
+    **{f"named_{i}": ("named", name) for i, (_, name) in enumerate(NAMED_EQUATION_PATTERNS)},
+    **{f"constant_{i}": ("constant", name) for i, (_, name) in enumerate(PHYSICAL_CONSTANT_PATTERNS)},
+}
+
+# Equation numbers like (1), (2.1)
+EQUATION_NUMBER_PATTERN = re.compile(r"\((\d+(?:\.\d+)?)\)")
+
+
+def _span_context(text: str, start: int, end: int, window: int = 100) -> str:
+    """Get the text around ``text[start:end]`` as a single line.
+
+    Args:
+        text: Document text
+        start: Start offset of the entity
+        end: End offset of the entity
+        window: Characters to include before and after the entity
 
-@dataclass
+    Returns:
+        Context string with newlines flattened to spaces
+    """
+    return text[max(0, start - window) : end + window].replace("\n", " ").strip()
+
+
+def _context(text: str, match: re.Match[str], window: int = 100) -> str:
+    """Get the text around a match as a single line."""
+    return _span_context(text, match.start(), match.end(), window)
+
+
+def _iter_environments(text: str, names: tuple[str, ...]) -> Iterator[tuple[int, int, str]]:
+    """Find ``\\begin{name}...\\end{name}`` blocks for the given environments.
+
+    Walks the ``\\begin{`` markers with str.find and only searches for the
+    matching ``\\end`` of environments we care about. Matches the semantics
+    of a lazy ``\\begin\\{name\\}(.+?)\\end\\{name\\}`` scan per name.
+
+    Args:
+        text: Document text
+        names: Lowercase environment names to extract
+
+    Yields:
+        (start, end, body) for each environment, in document order
+    """
+    # Per environment, where the previous block ended (blocks don't overlap)
+    resume = dict.fromkeys(names, 0)
+    begin = text.find("\\begin{")
+    while begin != -1:
+        name_start = begin + len("\\begin{")
+        name_end = text.find("}", name_start)
+        if name_end == -1:
+            break
+
+        name = text[name_start:name_end].lower()
+        if name in resume and begin >= resume[name]:
+            # The body must be non-empty, as with (.+?)
+            end_match = _ENV_END_PATTERNS[name].search(text, name_end + 2)
+            if end_match is None:
+                resume[name] = len(text)  # No closing tag further on
+            else:
+                yield begin, end_match.end(), text[name_end + 1 : end_match.start()]
+                resume[name] = end_match.end()
+
+        begin = text.find("\\begin{", name_start)
+
+
+@dataclass(slots=True)
 class MathEntity:
     """A mathematical entity extracted from text."""
 
@@ -99,7 +224,7 @@ class LaTeXExtractor:
         pass
 
     def extract_display_equations(self, text: str) -> list[MathEntity]:
-        """Extract display (block) equations.
+        """Extract display (block) equations in document order.
 
         Args:
             text: Document text
@@ -107,36 +232,37 @@ class LaTeXExtractor:
         Returns:
             List of equation entities
         """
+        # Cheap substring checks before running the regex engine
+        if "$$" not in text and "\\[" not in text and "\\begin{" not in text:
+            return []
+
         equations: list[MathEntity] = []
         seen: set[str] = set()
 
-        for pattern in DISPLAY_EQUATION_PATTERNS:
-            for match in pattern.finditer(text):
-                content = match.group(1).strip()
+        for match in DISPLAY_EQUATION_UNION.finditer(text):
+            content = match.group(match.lastindex).strip()
 
-                # Skip if empty or already seen
-                if not content or content in seen:
-                    continue
+            # Skip if empty or already seen
+            if not content or content in seen:
+                continue
 
-                seen.add(content)
+            seen.add(content)
 
-                # Extract context (100 chars before and after)
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end].replace("\n", " ").strip()
+            # Extract context (100 chars before and after)
+            context = _context(text, match)
 
-                # Check for equation number
-                number = self._extract_equation_number(context)
+            # Check for equation number
+            number = self._extract_equation_number(context)
 
-                equations.append(
-                    MathEntity(
-                        type="equation",
-                        content=content,
-                        context=context,
-                        number=number,
-                        metadata={"display": True},
-                    )
+            equations.append(
+                MathEntity(
+                    type="equation",
+                    content=content,
+                    context=context,
+                    number=number,
+                    metadata={"display": True},
                 )
+            )
 
         logger.debug("extracted_display_equations", count=len(equations))
         return equations
@@ -151,31 +277,27 @@ class LaTeXExtractor:
         Returns:
             List of equation entities
         """
-        equations: list[MathEntity] = []
-        seen: set[str] = set()
+        if "$" not in text:
+            return []
 
+        # First occurrence of each distinct equation; papers repeat the same
+        # few symbols many times, so filter only the unique ones afterwards
+        first_matches: dict[str, re.Match[str]] = {}
+        keep_first = first_matches.setdefault
         for match in INLINE_EQUATION_PATTERN.finditer(text):
-            content = match.group(1).strip()
+            keep_first(match.group(1).strip(), match)
 
+        equations: list[MathEntity] = []
+        for content, match in first_matches.items():
             # Skip short or numeric-only matches
             if len(content) < min_length or content.isdigit():
                 continue
 
-            if content in seen:
-                continue
-
-            seen.add(content)
-
-            # Extract context
-            start = max(0, match.start() - 100)
-            end = min(len(text), match.end() + 100)
-            context = text[start:end].replace("\n", " ").strip()
-
             equations.append(
                 MathEntity(
                     type="equation",
                     content=content,
-                    context=context,
+                    context=_context(text, match),
                     metadata={"display": False},
                 )
             )
@@ -192,26 +314,7 @@ class LaTeXExtractor:
         Returns:
             List of named equation entities
         """
-        entities: list[MathEntity] = []
-
-        for pattern, name in NAMED_EQUATIONS.items():
-            regex = re.compile(pattern, re.IGNORECASE)
-            for match in regex.finditer(text):
-                # Extract context
-                start = max(0, match.start() - 200)
-                end = min(len(text), match.end() + 200)
-                context = text[start:end].replace("\n", " ").strip()
-
-                entities.append(
-                    MathEntity(
-                        type="equation",
-                        content=match.group(0),
-                        name=name,
-                        context=context,
-                        metadata={"named": True},
-                    )
-                )
-
+        entities, _ = self._extract_keyword_entities(text)
         logger.debug("extracted_named_equations", count=len(entities))
         return entities
 
@@ -224,43 +327,42 @@ class LaTeXExtractor:
         Returns:
             List of theorem entities
         """
+        if "\\begin{" not in text and "Theorem" not in text and "Lemma" not in text:
+            return []
+
         theorems: list[MathEntity] = []
 
+        # Environment format
+        spans: list[tuple[int, int, str, str | None]] = [
+            (start, end, body, None)
+            for start, end, body in _iter_environments(text, THEOREM_ENVIRONMENTS)
+        ]
+
+        # Numbered format
         for pattern in THEOREM_PATTERNS:
             for match in pattern.finditer(text):
-                if len(match.groups()) == 1:
-                    # Environment format
-                    content = match.group(1).strip()
-                    number = None
-                else:
-                    # Numbered format
-                    number = match.group(1)
-                    content = match.group(2).strip()
-
-                # Extract context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end].replace("\n", " ").strip()
-
-                # Determine type from match
-                match_text = match.group(0).lower()
-                if "lemma" in match_text:
-                    entity_type = "lemma"
-                elif "proposition" in match_text:
-                    entity_type = "proposition"
-                elif "corollary" in match_text:
-                    entity_type = "corollary"
-                else:
-                    entity_type = "theorem"
-
-                theorems.append(
-                    MathEntity(
-                        type=entity_type,
-                        content=content,
-                        context=context,
-                        number=number,
-                    )
+                spans.append((match.start(), match.end(), match.group(2), match.group(1)))
+
+        for start, end, body, number in spans:
+            # Determine type from match
+            match_text = text[start:end].lower()
+            if "lemma" in match_text:
+                entity_type = "lemma"
+            elif "proposition" in match_text:
+                entity_type = "proposition"
+            elif "corollary" in match_text:
+                entity_type = "corollary"
+            else:
+                entity_type = "theorem"
+
+            theorems.append(
+                MathEntity(
+                    type=entity_type,
+                    content=body.strip(),
+                    context=_span_context(text, start, end),
+                    number=number,
                 )
+            )
 
         logger.debug("extracted_theorems", count=len(theorems))
         return theorems
@@ -274,30 +376,28 @@ class LaTeXExtractor:
         Returns:
             List of conjecture entities
         """
+        if "\\begin{" not in text and "Conjecture" not in text:
+            return []
+
         conjectures: list[MathEntity] = []
 
+        spans: list[tuple[int, int, str, str | None]] = [
+            (start, end, body, None)
+            for start, end, body in _iter_environments(text, CONJECTURE_ENVIRONMENTS)
+        ]
         for pattern in CONJECTURE_PATTERNS:
             for match in pattern.finditer(text):
-                if len(match.groups()) == 1:
-                    content = match.group(1).strip()
-                    number = None
-                else:
-                    number = match.group(1)
-                    content = match.group(2).strip()
-
-                # Extract context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end].replace("\n", " ").strip()
-
-                conjectures.append(
-                    MathEntity(
-                        type="conjecture",
-                        content=content,
-                        context=context,
-                        number=number,
-                    )
+                spans.append((match.start(), match.end(), match.group(2), match.group(1)))
+
+        for start, end, body, number in spans:
+            conjectures.append(
+                MathEntity(
+                    type="conjecture",
+                    content=body.strip(),
+                    context=_span_context(text, start, end),
+                    number=number,
                 )
+            )
 
         logger.debug("extracted_conjectures", count=len(conjectures))
         return conjectures
@@ -311,15 +411,40 @@ class LaTeXExtractor:
         Returns:
             List of constant entities
         """
+        _, constants = self._extract_keyword_entities(text)
+        logger.debug("extracted_constants", count=len(constants))
+        return constants
+
+    def _extract_keyword_entities(
+        self, text: str
+    ) -> tuple[list[MathEntity], list[MathEntity]]:
+        """Extract named equations and physical constants in a single scan.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Tuple of (named equation entities, constant entities)
+        """
+        named: list[MathEntity] = []
         constants: list[MathEntity] = []
 
-        for pattern, name in PHYSICAL_CONSTANTS.items():
-            regex = re.compile(pattern, re.IGNORECASE)
-            for match in regex.finditer(text):
-                # Extract context
-                start = max(0, match.start() - 150)
-                end = min(len(text), match.end() + 150)
-                context = text[start:end].replace("\n", " ").strip()
+        for match in KEYWORD_UNION.finditer(text):
+            kind, name = KEYWORD_GROUPS[match.lastgroup]
+            if kind == "named":
+                context = _context(text, match, 200)
+
+                named.append(
+                    MathEntity(
+                        type="equation",
+                        content=match.group(0),
+                        name=name,
+                        context=context,
+                        metadata={"named": True},
+                    )
+                )
+            else:
+                context = _context(text, match, 150)
 
                 constants.append(
                     MathEntity(
@@ -330,12 +455,15 @@ class LaTeXExtractor:
                     )
                 )
 
-        logger.debug("extracted_constants", count=len(constants))
-        return constants
+        return named, constants
 
     def extract_all(self, text: str, section: str = "") -> dict[str, list[MathEntity]]:
         """Extract all mathematical entities from text.
 
+        Results for texts of at least EXTRACT_ALL_CACHE_MIN_CHARS are memoized,
+        so re-extracting the same paper or section skips the scan. Every call
+        returns its own copies of the entities, so callers may modify them.
+
         Args:
             text: Document text
             section: Optional section name for context
@@ -343,13 +471,42 @@ class LaTeXExtractor:
         Returns:
             Dictionary mapping entity types to lists of entities
         """
+        if len(text) < EXTRACT_ALL_CACHE_MIN_CHARS:
+            return self._extract_all(text, section)
+
+        key = (
+            type(self),
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            section,
+        )
+        with _EXTRACT_ALL_CACHE_LOCK:
+            cached = _EXTRACT_ALL_CACHE.get(key)
+            if cached is not None:
+                _EXTRACT_ALL_CACHE.move_to_end(key)
+
+        if cached is None:
+            cached = self._extract_all(text, section)
+            with _EXTRACT_ALL_CACHE_LOCK:
+                _EXTRACT_ALL_CACHE[key] = cached
+                while len(_EXTRACT_ALL_CACHE) > EXTRACT_ALL_CACHE_SIZE:
+                    _EXTRACT_ALL_CACHE.popitem(last=False)
+
+        return {
+            entity_type: [_copy_entity(entity) for entity in entities]
+            for entity_type, entities in cached.items()
+        }
+
+    def _extract_all(self, text: str, section: str) -> dict[str, list[MathEntity]]:
+        """Run every extractor over the text (uncached extract_all)."""
+        named_equations, constants = self._extract_keyword_entities(text)
+
         entities: dict[str, list[MathEntity]] = {
             "display_equations": self.extract_display_equations(text),
             "inline_equations": self.extract_inline_equations(text),
-            "named_equations": self.extract_named_equations(text),
+            "named_equations": named_equations,
             "theorems": self.extract_theorems(text),
             "conjectures": self.extract_conjectures(text),
-            "constants": self.extract_physical_constants(text),
+            "constants": constants,
         }
 
         # Add section context to all entities
@@ -374,8 +531,21 @@ class LaTeXExtractor:
             Equation number or None
         """
         # Look for patterns like (1), (2.1), etc.
-        number_pattern = re.compile(r"\((\d+(?:\.\d+)?)\)")
-        match = number_pattern.search(context)
+        match = EQUATION_NUMBER_PATTERN.search(context)
         if match:
             return match.group(1)
-        return None
\ No newline at end of file
+        return None
+
+
+def _copy_entity(entity: MathEntity) -> MathEntity:
+    """Copy an entity, including its metadata dict, for handing to a caller."""
+    metadata = dict(entity.metadata) if entity.metadata is not None else None
+    return dataclasses.replace(entity, metadata=metadata)
+
+
+# (extractor class, text digest, section) -> extract_all result, most recently
+# used last. Entries are never handed out directly, only copies of them.
+_EXTRACT_ALL_CACHE: OrderedDict[
+    tuple[type[LaTeXExtractor], bytes, str], dict[str, list[MathEntity]]
+] = OrderedDict()
+_EXTRACT_ALL_CACHE_LOCK = threading.Lock()
@@ -7,6 +7,10 @@ Marker is optimized for converting PDFs to Markdown while preserving:
 - Section structure
 """
 
+import importlib.util
+import re
+import threading
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -22,6 +26,43 @@ from packages.ingestion.models import (
 
 logger = structlog.get_logger()
 
+# Equation patterns in Marker's markdown output
+# Negated classes can't run past a closing $ (or, inline, a line end), so
+# unbalanced delimiters fail fast instead of backtracking to EOF
+_DISPLAY_EQ_RE = re.compile(r"\$\$([^$]+)\$\$")  # $$...$$
+_INLINE_EQ_RE = re.compile(r"\$([^$\n]+)\$")  # $...$
+
+# Markdown header lines: any line starting with '#'
+HEADER_RE = re.compile(r"^(#+)(.*)$", re.MULTILINE)
+
+# Marker's models are expensive to load, so they are created on first use
+# and shared by every parser in the process
+_MODEL_DICT: dict[str, Any] | None = None
+_MODEL_DICT_LOCK = threading.Lock()
+
+MARKER_INSTALL_HINT = "Marker not installed. Install with: poetry install --with parsing"
+
+# Conversions allowed to run at once across the whole process (one per GPU),
+# so concurrent pipelines can't exhaust VRAM
+MARKER_MAX_CONCURRENT_JOBS = 1
+_MARKER_JOB_SLOTS = threading.BoundedSemaphore(MARKER_MAX_CONCURRENT_JOBS)
+
+# Parsers handed out by get_shared_marker, keyed by config signature
+_SHARED_PARSERS: dict[tuple[Any, ...], "MarkerParser"] = {}
+_SHARED_PARSERS_LOCK = threading.Lock()
+
+
+def _get_model_dict() -> dict[str, Any]:
+    """Get Marker's model artifacts, loading them once per process."""
+    global _MODEL_DICT
+    if _MODEL_DICT is None:
+        with _MODEL_DICT_LOCK:
+            if _MODEL_DICT is None:
+                from marker.models import create_model_dict
+
+                _MODEL_DICT = create_model_dict()
+    return _MODEL_DICT
+
 
 class MarkerConfig:
     """Configuration for Marker PDF parser."""
@@ -50,6 +91,17 @@ class MarkerConfig:
         self.output_format = output_format
         self.langs = langs or ["en"]
 
+    @property
+    def signature(self) -> tuple[Any, ...]:
+        """Hashable summary of the settings, for sharing parsers."""
+        return (
+            self.max_pages,
+            self.extract_images,
+            self.preserve_latex,
+            self.output_format,
+            tuple(self.langs),
+        )
+
 
 class MarkerParser:
     """PDF parser using Marker for high-quality extraction.
@@ -69,13 +121,13 @@ class MarkerParser:
         self._check_marker_available()
 
     def _check_marker_available(self) -> None:
-        """Check if Marker is available."""
-        try:
-            import marker  # noqa: F401
-        except ImportError as e:
-            raise ImportError(
-                "Marker not installed. Install with: poetry install --with parsing"
-            ) from e
+        """Check if Marker is available without importing it.
+
+        Importing marker pulls in torch and its models, so that is deferred
+        until a PDF is actually converted.
+        """
+        if importlib.util.find_spec("marker") is None:
+            raise ImportError(MARKER_INSTALL_HINT)
 
     def extract_markdown(self, pdf_path: Path) -> tuple[str, dict[str, Any]]:
         """Extract markdown from PDF using Marker.
@@ -97,29 +149,33 @@ class MarkerParser:
 
         try:
             from marker.converters.pdf import PdfConverter
-            from marker.models import create_model_dict
-
-            # Create models (cached on first run)
-            model_dict = create_model_dict()
+        except ImportError as e:
+            raise ImportError(MARKER_INSTALL_HINT) from e
 
-            # Convert PDF
+        try:
+            # Convert PDF (models are loaded on first use, then reused)
             converter = PdfConverter(
-                artifact_dict=model_dict,
+                artifact_dict=_get_model_dict(),
                 config={
                     "languages": self.config.langs,
                     "max_pages": self.config.max_pages,
+                    # Don't render and hold page images we won't keep
+                    "disable_image_extraction": not self.config.extract_images,
                 },
             )
 
-            rendered = converter(str(pdf_path))
+            with _MARKER_JOB_SLOTS:
+                rendered = converter(str(pdf_path))
 
-            # Extract markdown and metadata
+            # Extract markdown and metadata, then drop the rendered document
+            # (pages and images) so it can be freed before we return
             markdown_text = rendered.markdown
             metadata = {
                 "pages": len(rendered.pages),
                 "images": len(rendered.images) if self.config.extract_images else 0,
                 "languages": rendered.languages,
             }
+            del rendered, converter
 
             logger.info(
                 "marker_parse_complete",
@@ -144,48 +200,47 @@ class MarkerParser:
         Returns:
             List of sections
         """
+        sections, _ = self._extract_sections_with_spans(markdown)
+        return sections
+
+    def _extract_sections_with_spans(
+        self, markdown: str
+    ) -> tuple[list[Section], list[tuple[int, int]]]:
+        """Extract sections along with the span each covers in the markdown.
+
+        Only header lines are visited; section content is sliced straight
+        out of the markdown between consecutive headers.
+
+        Args:
+            markdown: Markdown text from Marker
+
+        Returns:
+            Tuple of (sections, [start, end) offsets of each section,
+            from its header line to the next header)
+        """
         sections: list[Section] = []
-        lines = markdown.split("\n")
-
-        current_section: str | None = None
-        current_level = 1
-        current_content: list[str] = []
-
-        for line in lines:
-            # Check for markdown headers
-            if line.startswith("#"):
-                # Save previous section
-                if current_section:
-                    sections.append(
-                        Section(
-                            title=current_section,
-                            content="\n".join(current_content).strip(),
-                            level=current_level,
-                        )
-                    )
-
-                # Start new section
-                level = len(line) - len(line.lstrip("#"))
-                current_level = min(level, 6)  # Max level 6
-                current_section = line.lstrip("#").strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Don't forget last section
-        if current_section:
+        spans: list[tuple[int, int]] = []
+        headers = list(HEADER_RE.finditer(markdown))
+
+        for i, header in enumerate(headers):
+            title = header.group(2).strip()
+            if not title:
+                continue
+
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(markdown)
             sections.append(
                 Section(
-                    title=current_section,
-                    content="\n".join(current_content).strip(),
-                    level=current_level,
+                    title=title,
+                    content=markdown[header.end() : end].strip(),
+                    level=min(len(header.group(1)), 6),  # Max level 6
                 )
             )
+            spans.append((header.start(), end))
 
-        return sections
+        return sections, spans
 
-    def _extract_equations_from_markdown(self, markdown: str) -> list[str]:
-        """Extract LaTeX equations from Marker markdown.
+    def _find_equations_in_markdown(self, markdown: str) -> list[tuple[int, str]]:
+        """Find LaTeX equations in Marker markdown with their offsets.
 
         Marker preserves equations in LaTeX format.
 
@@ -193,28 +248,36 @@ class MarkerParser:
             markdown: Markdown text
 
         Returns:
-            List of equation strings
+            List of (offset, equation string) pairs
         """
-        import re
-
-        equations: list[str] = []
+        equations: list[tuple[int, str]] = []
 
         # Display equations: $$...$$
-        display_pattern = re.compile(r"\$\$(.+?)\$\$", re.DOTALL)
-        for match in display_pattern.finditer(markdown):
+        for match in _DISPLAY_EQ_RE.finditer(markdown):
             eq = match.group(1).strip()
             if eq and len(eq) > 2:
-                equations.append(eq)
+                equations.append((match.start(), eq))
 
         # Inline equations: $...$
-        inline_pattern = re.compile(r"\$(.+?)\$")
-        for match in inline_pattern.finditer(markdown):
+        for match in _INLINE_EQ_RE.finditer(markdown):
             eq = match.group(1).strip()
             # Filter out short matches that might be false positives
             if eq and len(eq) > 3 and not eq.isdigit():
-                equations.append(eq)
+                equations.append((match.start(), eq))
 
-        return list(set(equations))  # Deduplicate
+        return equations
+
+    def _extract_equations_from_markdown(self, markdown: str) -> list[str]:
+        """Extract LaTeX equations from Marker markdown.
+
+        Args:
+            markdown: Markdown text
+
+        Returns:
+            List of equation strings
+        """
+        # Deduplicate, keeping first-seen order
+        return list(dict.fromkeys(eq for _, eq in self._find_equations_in_markdown(markdown)))
 
     def parse(self, paper: ArxivPaper, output_dir: Path | None = None) -> ParsedPaper:
         """Parse paper with Marker.
@@ -247,12 +310,24 @@ class MarkerParser:
             logger.debug("saved_markdown", path=str(markdown_path))
 
         # Extract structured content
-        sections = self._extract_sections_from_markdown(markdown)
-        equations = self._extract_equations_from_markdown(markdown)
+        sections, section_spans = self._extract_sections_with_spans(markdown)
+        section_starts = [start for start, _ in section_spans]
+        equations: list[str] = []
+        seen: set[str] = set()
+
+        # Add equations to sections: bucket the single full-text scan by
+        # offset instead of rescanning each section's content
+        section_seen: list[set[str]] = [set() for _ in sections]
+        for offset, eq in self._find_equations_in_markdown(markdown):
+            # Deduplicate, keeping first-seen order
+            if eq not in seen:
+                seen.add(eq)
+                equations.append(eq)
 
-        # Add equations to sections
-        for section in sections:
-            section.equations = self._extract_equations_from_markdown(section.content)
+            index = bisect_right(section_starts, offset) - 1
+            if index >= 0 and offset < section_spans[index][1] and eq not in section_seen[index]:
+                section_seen[index].add(eq)
+                sections[index].equations.append(eq)
 
         # Calculate confidence based on metadata
         confidence = 0.95  # Marker is high quality
@@ -276,6 +351,32 @@ class MarkerParser:
         )
 
 
+def get_shared_marker(config: MarkerConfig | None = None) -> MarkerParser:
+    """Get the process-wide Marker parser for a configuration.
+
+    Parsers are created once per distinct config and reused, so short-lived
+    pipelines don't pay for setup again.
+
+    Args:
+        config: Parser configuration
+
+    Returns:
+        Shared MarkerParser
+
+    Raises:
+        ImportError: If Marker is not installed
+    """
+    config = config or MarkerConfig()
+    key = config.signature
+    parser = _SHARED_PARSERS.get(key)
+    if parser is None:
+        with _SHARED_PARSERS_LOCK:
+            parser = _SHARED_PARSERS.get(key)
+            if parser is None:
+                parser = _SHARED_PARSERS[key] = MarkerParser(config)
+    return parser
+
+
 def parse_with_marker(
     paper: ArxivPaper,
     output_dir: Path | None = None,
@@ -291,5 +392,5 @@ def parse_with_marker(
     Returns:
         ParsedPaper with extracted content
     """
-    parser = MarkerParser(config)
+    parser = get_shared_marker(config)
     return parser.parse(paper, output_dir)
\ No newline at end of file
@@ -6,6 +6,8 @@ These models represent papers at different stages of processing:
 - ParsedPaper: Paper with extracted text and sections
 """
 
+import sys
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -13,6 +15,26 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+# Timestamp shared by models created within the same second; bulk ingestion
+# builds thousands of ParsedPaper objects per batch
+_NOW_MAX_AGE_SECONDS = 1.0
+_now_cache: tuple[float, datetime] | None = None
+
+
+def _cached_now() -> datetime:
+    """Get the current time, reusing a value taken less than a second ago."""
+    global _now_cache
+    tick = time.monotonic()
+    if _now_cache is None or tick - _now_cache[0] >= _NOW_MAX_AGE_SECONDS:
+        _now_cache = (tick, datetime.now())
+    return _now_cache[1]
+
+
+def refresh_now() -> None:
+    """Discard the cached timestamp so the next model gets a fresh one."""
+    global _now_cache
+    _now_cache = None
+
 
 class ArxivCategory(str, Enum):
     """Primary arXiv categories for physics and mathematics."""
@@ -100,8 +122,12 @@ class PaperMetadata(BaseModel):
 
     @property
     def category_list(self) -> list[str]:
-        """Get list of all categories."""
-        return self.categories.split()
+        """Get list of all categories.
+
+        Category names are interned: there are only a few hundred distinct
+        ones, shared by millions of papers.
+        """
+        return [sys.intern(c) for c in self.categories.split()]
 
     @property
     def author_list(self) -> list[str]:
@@ -176,7 +202,7 @@ class ParsedPaper(BaseModel):
     # Parsing metadata
     parser_used: ParserType = ParserType.PYMUPDF
     parse_confidence: float = Field(1.0, ge=0.0, le=1.0)
-    parsed_at: datetime = Field(default_factory=datetime.now)
+    parsed_at: datetime = Field(default_factory=_cached_now)
 
     # File references
     pdf_path: Path | None = None
@@ -5,22 +5,32 @@ a complete ParsedPaper with maximum information extraction.
 """
 
 import asyncio
+import re
+import time
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
 from packages.ingestion.grobid_parser import GrobidConfig, GrobidParser
-from packages.ingestion.latex_extractor import LaTeXExtractor
-from packages.ingestion.marker_parser import MarkerConfig, MarkerParser
+from packages.ingestion.latex_extractor import LaTeXExtractor, MathEntity
+from packages.ingestion.marker_parser import MarkerConfig, MarkerParser, get_shared_marker
 from packages.ingestion.models import ArxivPaper, Citation, ParsedPaper, ParserType, Section
 from packages.ingestion.semantic_chunker import PaperChunk, SemanticChunker
 from packages.ingestion.text_extractor import PyMuPDFExtractor
 
 logger = structlog.get_logger()
 
+PARSE_BATCH_CONCURRENCY = 8  # Default papers in flight for batch parsing
+MARKER_CONCURRENCY = 1  # Marker is GPU/CPU-bound; run one conversion at a time
+
+# Display math Marker does not report (it only recognises $...$ / $$...$$)
+_LATEX_DISPLAY_ENV_RE = re.compile(
+    r"\\\[|\\begin\{(?:equation|align|eqnarray|gather|multline|displaymath)\*?\}"
+)
+
 
 @dataclass
 class ParsingQuality:
@@ -39,6 +49,98 @@ class ParsingQuality:
     errors: list[str]
 
 
+class ParsingQualityBatch:
+    """Quality metrics for many papers, stored column-wise.
+
+    Each metric is a compact typed array, so batch statistics run over
+    contiguous values instead of walking one ParsingQuality per paper.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.arxiv_ids: list[str] = []
+        self.marker_success = array("b")
+        self.grobid_success = array("b")
+        self.pymupdf_fallback = array("b")
+        self.section_count = array("l")
+        self.equation_count = array("l")
+        self.citation_count = array("l")
+        self.parse_time_seconds = array("d")
+
+    def __len__(self) -> int:
+        return len(self.arxiv_ids)
+
+    def append(self, quality: ParsingQuality) -> None:
+        """Add one paper's metrics.
+
+        Args:
+            quality: Metrics from ParsingPipeline.parse
+        """
+        self.arxiv_ids.append(quality.arxiv_id)
+        self.marker_success.append(quality.marker_success)
+        self.grobid_success.append(quality.grobid_success)
+        self.pymupdf_fallback.append(quality.pymupdf_fallback)
+        self.section_count.append(quality.section_count)
+        self.equation_count.append(quality.equation_count)
+        self.citation_count.append(quality.citation_count)
+        self.parse_time_seconds.append(quality.parse_time_seconds)
+
+    def summary(self) -> dict[str, float]:
+        """Aggregate statistics over the batch.
+
+        Returns:
+            Dictionary of rates (0-1), means and totals
+        """
+        n = len(self)
+        if n == 0:
+            return {"papers": 0}
+
+        total_time = sum(self.parse_time_seconds)
+        return {
+            "papers": n,
+            "marker_success_rate": sum(self.marker_success) / n,
+            "grobid_success_rate": sum(self.grobid_success) / n,
+            "pymupdf_fallback_rate": sum(self.pymupdf_fallback) / n,
+            "mean_sections": sum(self.section_count) / n,
+            "mean_equations": sum(self.equation_count) / n,
+            "mean_citations": sum(self.citation_count) / n,
+            "total_parse_time": total_time,
+            "mean_parse_time": total_time / n,
+        }
+
+
+def _citation_key(citation: Citation) -> tuple[str | None, str | None, str]:
+    """Identity used to deduplicate citations from different parsers."""
+    return (citation.arxiv_id, citation.doi, citation.raw_text[:50])
+
+
+def _merge_citations(citations: list[Citation], new: list[Citation]) -> None:
+    """Merge citations in place, dropping duplicates and keeping first occurrences.
+
+    Existing citations are compacted within their own list and new ones
+    appended, so no replacement list is built.
+
+    Args:
+        citations: Citations already on the paper (e.g. from Marker); modified
+        new: Citations to add (e.g. from Grobid)
+    """
+    seen: set[tuple[str | None, str | None, str]] = set()
+    write_idx = 0
+    for citation in citations:
+        key = _citation_key(citation)
+        if key not in seen:
+            seen.add(key)
+            citations[write_idx] = citation
+            write_idx += 1
+    del citations[write_idx:]
+
+    for citation in new:
+        key = _citation_key(citation)
+        if key not in seen:
+            seen.add(key)
+            citations.append(citation)
+
+
 class ParsingPipelineConfig:
     """Configuration for parsing pipeline."""
 
@@ -54,6 +156,9 @@ class ParsingPipelineConfig:
         extract_latex: bool = True,
         create_chunks: bool = True,
         max_chunk_size: int = 2000,
+        marker_concurrency: int = MARKER_CONCURRENCY,
+        pymupdf_page_margin: float = 0.0,
+        pymupdf_workers: int = 1,
     ):
         """Initialize pipeline configuration.
 
@@ -67,6 +172,10 @@ class ParsingPipelineConfig:
             extract_latex: Extract LaTeX entities
             create_chunks: Create semantic chunks
             max_chunk_size: Maximum chunk size in characters
+            marker_concurrency: Maximum simultaneous Marker conversions
+            pymupdf_page_margin: Points trimmed from the top and bottom of each
+                page by the PyMuPDF fallback (drops running headers/footers)
+            pymupdf_workers: Processes the PyMuPDF fallback uses on long PDFs
         """
         self.use_marker = use_marker
         self.use_grobid = use_grobid
@@ -77,6 +186,9 @@ class ParsingPipelineConfig:
         self.extract_latex = extract_latex
         self.create_chunks = create_chunks
         self.max_chunk_size = max_chunk_size
+        self.marker_concurrency = marker_concurrency
+        self.pymupdf_page_margin = pymupdf_page_margin
+        self.pymupdf_workers = pymupdf_workers
 
 
 class ParsingPipeline:
@@ -91,14 +203,19 @@ class ParsingPipeline:
         self.config = config or ParsingPipelineConfig()
         self.marker_parser: MarkerParser | None = None
         self.grobid_parser: GrobidParser | None = None
-        self.pymupdf_extractor = PyMuPDFExtractor()
+        self.pymupdf_extractor = PyMuPDFExtractor(
+            page_margin=self.config.pymupdf_page_margin,
+            workers=self.config.pymupdf_workers,
+        )
         self.latex_extractor = LaTeXExtractor()
         self.chunker = SemanticChunker(max_chunk_size=self.config.max_chunk_size)
+        # Serializes Marker across concurrent parse() calls
+        self._marker_semaphore = asyncio.Semaphore(self.config.marker_concurrency)
 
         # Initialize parsers based on config
         if self.config.use_marker:
             try:
-                self.marker_parser = MarkerParser(self.config.marker_config)
+                self.marker_parser = get_shared_marker(self.config.marker_config)
             except ImportError:
                 logger.warning("marker_not_available", fallback="pymupdf")
                 self.marker_parser = None
@@ -127,7 +244,7 @@ class ParsingPipeline:
         if not paper.pdf_path or not paper.pdf_path.exists():
             raise ValueError(f"No PDF available for {paper.arxiv_id}")
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         warnings: list[str] = []
         errors: list[str] = []
 
@@ -135,16 +252,17 @@ class ParsingPipeline:
 
         # Initialize result tracking
         marker_success = False
-        grobid_success = False
         pymupdf_fallback = False
         parsed_paper: ParsedPaper | None = None
-        grobid_data: dict[str, Any] | None = None
 
         # Step 1: Try Marker for high-quality full-text extraction
         if self.config.use_marker and self.marker_parser:
             try:
                 logger.info("attempting_marker_parse", arxiv_id=paper.arxiv_id)
-                parsed_paper = self.marker_parser.parse(paper, self.config.output_dir)
+                async with self._marker_semaphore:
+                    parsed_paper = await asyncio.to_thread(
+                        self.marker_parser.parse, paper, self.config.output_dir
+                    )
                 marker_success = True
                 logger.info("marker_parse_success", arxiv_id=paper.arxiv_id)
             except Exception as e:
@@ -156,7 +274,9 @@ class ParsingPipeline:
         if not parsed_paper and self.config.use_pymupdf_fallback:
             try:
                 logger.info("attempting_pymupdf_parse", arxiv_id=paper.arxiv_id)
-                parsed_paper = self.pymupdf_extractor.parse(paper)
+                # Safe from concurrent batch parses: the extractor holds a
+                # process-wide lock while PyMuPDF runs
+                parsed_paper = await asyncio.to_thread(self.pymupdf_extractor.parse, paper)
                 pymupdf_fallback = True
                 warnings.append("Using PyMuPDF fallback (lower quality)")
                 logger.info("pymupdf_parse_success", arxiv_id=paper.arxiv_id)
@@ -167,57 +287,109 @@ class ParsingPipeline:
         if not parsed_paper:
             raise RuntimeError(f"All parsing methods failed for {paper.arxiv_id}")
 
-        # Step 3: Try Grobid for citation extraction (parallel with Marker/PyMuPDF)
-        if self.config.use_grobid and self.grobid_parser:
-            try:
-                logger.info("attempting_grobid_parse", arxiv_id=paper.arxiv_id)
-                _, grobid_data = await self.grobid_parser.parse(paper, self.config.output_dir)
-                grobid_success = True
-                logger.info("grobid_parse_success", arxiv_id=paper.arxiv_id)
-
-                # Merge Grobid citations with parsed paper
-                if grobid_data and "citations" in grobid_data:
-                    parsed_paper.citations.extend(grobid_data["citations"])
-                    # Deduplicate citations
-                    seen = set()
-                    unique_citations = []
-                    for cit in parsed_paper.citations:
-                        key = (cit.arxiv_id, cit.doi, cit.raw_text[:50])
-                        if key not in seen:
-                            seen.add(key)
-                            unique_citations.append(cit)
-                    parsed_paper.citations = unique_citations
+        # Steps 3 and 4 only read the PDF / full text, so Grobid's HTTP round-trip
+        # overlaps with the CPU-bound LaTeX extraction. Results are merged back
+        # here on the event loop once both have finished.
+        grobid_task = (
+            self._run_grobid(paper)
+            if self.config.use_grobid and self.grobid_parser
+            else asyncio.sleep(0, result=None)
+        )
+        # Marker already emits the $/$$ equations it found; only rescan the text
+        # when it didn't produce any, the text came from PyMuPDF, or the text
+        # holds \[...\] / \begin{equation}-style blocks Marker never reports
+        run_latex = self.config.extract_latex and (
+            not (marker_success and parsed_paper.equations)
+            or _LATEX_DISPLAY_ENV_RE.search(parsed_paper.full_text) is not None
+        )
+        latex_task = (
+            asyncio.to_thread(self._run_latex, paper.arxiv_id, parsed_paper.full_text)
+            if run_latex
+            else asyncio.sleep(0, result=None)
+        )
+        grobid_result, latex_result = await asyncio.gather(
+            grobid_task, latex_task, return_exceptions=True
+        )
 
-            except Exception as e:
-                logger.warning("grobid_parse_failed", arxiv_id=paper.arxiv_id, error=str(e))
-                warnings.append(f"Grobid failed: {e}")
+        quality = self._finalize(
+            paper,
+            parsed_paper,
+            grobid_result,
+            latex_result,
+            marker_success=marker_success,
+            pymupdf_fallback=pymupdf_fallback,
+            parse_time=time.perf_counter() - start_time,
+            warnings=warnings,
+            errors=errors,
+        )
 
-        # Step 4: Extract LaTeX entities if requested
-        if self.config.extract_latex:
-            try:
-                logger.info("extracting_latex_entities", arxiv_id=paper.arxiv_id)
-                math_entities = self.latex_extractor.extract_all(parsed_paper.full_text)
-
-                # Add equations from LaTeX extractor to parsed paper
-                if "display_equations" in math_entities:
-                    for entity in math_entities["display_equations"]:
-                        if entity.content not in parsed_paper.equations:
-                            parsed_paper.equations.append(entity.content)
-
-                logger.debug(
-                    "latex_extraction_complete",
-                    equations=len(math_entities.get("display_equations", [])),
-                    theorems=len(math_entities.get("theorems", [])),
-                )
-            except Exception as e:
-                logger.warning("latex_extraction_failed", arxiv_id=paper.arxiv_id, error=str(e))
-                warnings.append(f"LaTeX extraction incomplete: {e}")
+        logger.info(
+            "parse_pipeline_complete",
+            arxiv_id=paper.arxiv_id,
+            quality=marker_success and not pymupdf_fallback,
+            parse_time=quality.parse_time_seconds,
+            sections=quality.section_count,
+            equations=quality.equation_count,
+            citations=quality.citation_count,
+        )
 
-        # Calculate parsing time
-        parse_time = (datetime.now() - start_time).total_seconds()
+        return parsed_paper, quality
 
-        # Create quality metrics
-        quality = ParsingQuality(
+    def _finalize(
+        self,
+        paper: ArxivPaper,
+        parsed_paper: ParsedPaper,
+        grobid_result: dict[str, Any] | BaseException | None,
+        latex_result: dict[str, list[MathEntity]] | BaseException | None,
+        *,
+        marker_success: bool,
+        pymupdf_fallback: bool,
+        parse_time: float,
+        warnings: list[str],
+        errors: list[str],
+    ) -> ParsingQuality:
+        """Merge Grobid and LaTeX results into the paper and score it.
+
+        Each merge walks only the incoming items against one dedup set, and
+        the counts come from the merged lists directly.
+
+        Args:
+            paper: Paper being parsed
+            parsed_paper: Marker/PyMuPDF result; citations and equations are extended
+            grobid_result: Grobid data, the exception it raised, or None if skipped
+            latex_result: LaTeX entities, the exception raised, or None if skipped
+            marker_success: Whether Marker produced the text
+            pymupdf_fallback: Whether PyMuPDF produced the text
+            parse_time: Seconds spent parsing
+            warnings: Warnings so far; failures here are appended
+            errors: Errors so far
+
+        Returns:
+            Quality metrics for the paper
+        """
+        # Step 3: Merge Grobid citations
+        grobid_success = False
+        if isinstance(grobid_result, BaseException):
+            logger.warning("grobid_parse_failed", arxiv_id=paper.arxiv_id, error=str(grobid_result))
+            warnings.append(f"Grobid failed: {grobid_result}")
+        elif grobid_result is not None:
+            grobid_success = True
+            if "citations" in grobid_result:
+                _merge_citations(parsed_paper.citations, grobid_result["citations"])
+
+        # Step 4: Merge LaTeX equations
+        if isinstance(latex_result, BaseException):
+            logger.warning("latex_extraction_failed", arxiv_id=paper.arxiv_id, error=str(latex_result))
+            warnings.append(f"LaTeX extraction incomplete: {latex_result}")
+        elif latex_result and "display_equations" in latex_result:
+            equations = parsed_paper.equations
+            existing = set(equations)
+            for entity in latex_result["display_equations"]:
+                if entity.content not in existing:
+                    existing.add(entity.content)
+                    equations.append(entity.content)
+
+        return ParsingQuality(
             arxiv_id=paper.arxiv_id,
             marker_success=marker_success,
             grobid_success=grobid_success,
@@ -231,17 +403,39 @@ class ParsingPipeline:
             errors=errors,
         )
 
-        logger.info(
-            "parse_pipeline_complete",
-            arxiv_id=paper.arxiv_id,
-            quality=marker_success and not pymupdf_fallback,
-            parse_time=parse_time,
-            sections=quality.section_count,
-            equations=quality.equation_count,
-            citations=quality.citation_count,
-        )
+    async def _run_grobid(self, paper: ArxivPaper) -> dict[str, Any]:
+        """Run Grobid on the paper's PDF.
 
-        return parsed_paper, quality
+        Args:
+            paper: ArxivPaper with pdf_path
+
+        Returns:
+            Parsed Grobid data (metadata, citations, sections)
+        """
+        assert self.grobid_parser is not None
+        logger.info("attempting_grobid_parse", arxiv_id=paper.arxiv_id)
+        _, grobid_data = await self.grobid_parser.parse(paper, self.config.output_dir)
+        logger.info("grobid_parse_success", arxiv_id=paper.arxiv_id)
+        return grobid_data
+
+    def _run_latex(self, arxiv_id: str, full_text: str) -> dict[str, list[MathEntity]]:
+        """Extract LaTeX entities (runs in a worker thread).
+
+        Args:
+            arxiv_id: Paper identifier, for logging
+            full_text: Text to scan
+
+        Returns:
+            Entities by kind, as returned by LaTeXExtractor.extract_all
+        """
+        logger.info("extracting_latex_entities", arxiv_id=arxiv_id)
+        math_entities = self.latex_extractor.extract_all(full_text)
+        logger.debug(
+            "latex_extraction_complete",
+            equations=len(math_entities.get("display_equations", [])),
+            theorems=len(math_entities.get("theorems", [])),
+        )
+        return math_entities
 
     def create_chunks(self, parsed_paper: ParsedPaper) -> list[PaperChunk]:
         """Create semantic chunks from parsed paper.
@@ -285,34 +479,62 @@ async def parse_batch(
     config: ParsingPipelineConfig | None = None,
     *,
     skip_errors: bool = True,
+    concurrency: int = PARSE_BATCH_CONCURRENCY,
+    quality_batch: ParsingQualityBatch | None = None,
 ) -> list[tuple[ParsedPaper, ParsingQuality]]:
-    """Parse multiple papers sequentially.
+    """Parse multiple papers concurrently.
+
+    All papers share one pipeline, so Grobid requests for some papers
+    overlap with Marker/PyMuPDF work on others. Marker itself stays
+    limited by ``config.marker_concurrency``.
 
     Args:
         papers: List of papers to parse
         config: Optional pipeline configuration
         skip_errors: Continue on individual failures
+        concurrency: Maximum number of papers parsed at once
+        quality_batch: Optional collector that receives each paper's metrics
 
     Returns:
-        List of (parsed_paper, quality) tuples
+        List of (parsed_paper, quality) tuples, in input order
     """
+    if config is None:
+        config = ParsingPipelineConfig(grobid_config=GrobidConfig(max_connections=concurrency))
     pipeline = ParsingPipeline(config)
-    results: list[tuple[ParsedPaper, ParsingQuality]] = []
-
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+
+    async def _parse_one(paper: ArxivPaper) -> tuple[ParsedPaper, ParsingQuality]:
+        nonlocal completed
+        async with semaphore:
+            result = await pipeline.parse(paper)
+        completed += 1
+        if completed % 10 == 0:
+            logger.info("batch_parse_progress", completed=completed, total=len(papers))
+        return result
+
+    tasks = [asyncio.create_task(_parse_one(paper)) for paper in papers]
     try:
-        for i, paper in enumerate(papers):
-            try:
-                parsed_paper, quality = await pipeline.parse(paper)
-                results.append((parsed_paper, quality))
-
-                if (i + 1) % 10 == 0:
-                    logger.info("batch_parse_progress", completed=i + 1, total=len(papers))
+        outcomes = await asyncio.gather(*tasks, return_exceptions=skip_errors)
+    except BaseException:
+        # Stop the sibling parses before the shared pipeline is closed under them
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        await pipeline.close()
 
-            except Exception as e:
-                logger.error("batch_parse_failed", arxiv_id=paper.arxiv_id, error=str(e))
-                if not skip_errors:
-                    raise
+    if quality_batch is None:
+        quality_batch = ParsingQualityBatch()
 
-        return results
-    finally:
-        await pipeline.close()
\ No newline at end of file
+    results: list[tuple[ParsedPaper, ParsingQuality]] = []
+    for paper, outcome in zip(papers, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error("batch_parse_failed", arxiv_id=paper.arxiv_id, error=str(outcome))
+            continue
+        results.append(outcome)
+        quality_batch.append(outcome[1])
+
+    logger.info("batch_parse_complete", total=len(papers), **quality_batch.summary())
+    return results
@@ -7,9 +7,13 @@ Respects arXiv's rate limits and politeness policies:
 """
 
 import asyncio
+import os
+import tempfile
+import zlib
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import aiohttp
 import structlog
@@ -24,15 +28,28 @@ from packages.ingestion.models import ArxivPaper, PaperMetadata
 
 logger = structlog.get_logger()
 
-# arXiv rate limit: 1 request per 3 seconds
+# arXiv rate limit: 1 request per 3 seconds (applied per host)
 ARXIV_RATE_LIMIT_SECONDS = 3.0
 
+# Hosts serving arXiv PDFs at /pdf/<id>.pdf; downloads are spread across them
+ARXIV_MIRRORS = ("https://arxiv.org",)
+
 # User-Agent as recommended by arXiv
 USER_AGENT = "arxiv-cosci/0.1.0 (https://github.com/yourusername/arxiv-cosci; mailto:your@email.com)"
 
 # Connection settings
 TIMEOUT_SECONDS = 60
 MAX_RETRIES = 3
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per read when streaming PDFs to disk
+DOWNLOAD_WRITE_BUFFER = 1 << 20  # Coalesce reads into 1 MiB write() calls
+PDF_MAGIC = b"%PDF"
+DOWNLOAD_BATCH_CONCURRENCY = 8  # Downloads (and open .part files) in flight per batch
+
+
+def _sync_file(f: BinaryIO) -> None:
+    """Flush a file's buffer and fsync it to disk."""
+    f.flush()
+    os.fsync(f.fileno())
 
 
 class RateLimiter:
@@ -46,11 +63,11 @@ class RateLimiter:
     async def acquire(self) -> None:
         """Wait until a request is allowed."""
         async with self._lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._last_request
+            loop = asyncio.get_running_loop()
+            elapsed = loop.time() - self._last_request
             if elapsed < self.min_interval:
                 await asyncio.sleep(self.min_interval - elapsed)
-            self._last_request = asyncio.get_event_loop().time()
+            self._last_request = loop.time()
 
 
 class ArxivDownloader:
@@ -61,18 +78,27 @@ class ArxivDownloader:
         output_dir: Path,
         *,
         rate_limit: float = ARXIV_RATE_LIMIT_SECONDS,
+        mirrors: Sequence[str] = ARXIV_MIRRORS,
     ):
+        if not mirrors:
+            raise ValueError("At least one mirror is required")
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.rate_limiter = RateLimiter(rate_limit)
+        self.mirrors = [mirror.rstrip("/") for mirror in mirrors]
+        # Each host gets its own politeness budget
+        self.rate_limiters: dict[str, RateLimiter] = {
+            mirror: RateLimiter(rate_limit) for mirror in self.mirrors
+        }
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
+            connector = aiohttp.TCPConnector(limit=len(self.mirrors), limit_per_host=1)
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
+                connector=connector,
                 headers={"User-Agent": USER_AGENT},
             )
         return self._session
@@ -93,23 +119,32 @@ class ArxivDownloader:
         subdir.mkdir(exist_ok=True)
         return subdir / f"{arxiv_id.replace('/', '_')}.pdf"
 
+    def _get_mirror(self, arxiv_id: str) -> str:
+        """Pick the host to download a paper from.
+
+        Uses a stable hash of the ID, so a retried paper goes to the same host.
+        """
+        if len(self.mirrors) == 1:
+            return self.mirrors[0]
+        return self.mirrors[zlib.crc32(arxiv_id.encode()) % len(self.mirrors)]
+
     @retry(
         retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
         stop=stop_after_attempt(MAX_RETRIES),
         wait=wait_exponential(multiplier=1, min=4, max=60),
     )
     async def _download_pdf(self, arxiv_id: str) -> Path:
-        """Download a single PDF with retry logic."""
-        pdf_path = self._get_pdf_path(arxiv_id)
+        """Download a single PDF with retry logic.
 
-        # Skip if already downloaded
-        if pdf_path.exists() and pdf_path.stat().st_size > 0:
-            logger.debug("pdf_exists", arxiv_id=arxiv_id, path=str(pdf_path))
-            return pdf_path
+        Callers check for an existing copy first (see ``download``), so
+        retries never spend rate-limiter slots on files already on disk.
+        """
+        pdf_path = self._get_pdf_path(arxiv_id)
 
-        await self.rate_limiter.acquire()
+        mirror = self._get_mirror(arxiv_id)
+        await self.rate_limiters[mirror].acquire()
 
-        url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+        url = f"{mirror}/pdf/{arxiv_id}.pdf"
         session = await self._get_session()
 
         logger.debug("downloading_pdf", arxiv_id=arxiv_id, url=url)
@@ -127,14 +162,47 @@ class ArxivDownloader:
 
             response.raise_for_status()
 
-            content = await response.read()
-
-            # Validate PDF
-            if not content.startswith(b"%PDF"):
-                raise ValueError(f"Invalid PDF content for {arxiv_id}")
-
-            pdf_path.write_bytes(content)
-            logger.info("pdf_downloaded", arxiv_id=arxiv_id, size=len(content))
+            # Stream to a partial file so a failed download never leaves a
+            # truncated PDF behind (which the exists() check would then skip).
+            # Each download gets its own uniquely named partial file, so
+            # concurrent downloads of one paper never write to the same file.
+            tmp = tempfile.NamedTemporaryFile(
+                "wb",
+                buffering=DOWNLOAD_WRITE_BUFFER,
+                dir=pdf_path.parent,
+                prefix=f"{pdf_path.name}.",
+                suffix=".part",
+                delete=False,
+            )
+            tmp_path = Path(tmp.name)
+            total_size = 0
+            head = b""
+            try:
+                with tmp as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        # Validate PDF magic before writing anything out
+                        if len(head) < len(PDF_MAGIC):
+                            head += chunk
+                            if len(head) < len(PDF_MAGIC):
+                                continue
+                            if not head.startswith(PDF_MAGIC):
+                                raise ValueError(f"Invalid PDF content for {arxiv_id}")
+                            chunk = head
+                        f.write(chunk)
+                        total_size += len(chunk)
+
+                    if not head.startswith(PDF_MAGIC):
+                        raise ValueError(f"Invalid PDF content for {arxiv_id}")
+                    # Data must be on disk before the rename makes it visible;
+                    # fsync can block for milliseconds, so keep it off the loop
+                    await asyncio.to_thread(_sync_file, f)
+
+                os.replace(tmp_path, pdf_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            logger.info("pdf_downloaded", arxiv_id=arxiv_id, size=total_size)
 
         return pdf_path
 
@@ -150,7 +218,19 @@ class ArxivDownloader:
         Raises:
             Various exceptions on download failure
         """
-        pdf_path = await self._download_pdf(metadata.id)
+        pdf_path = self._get_pdf_path(metadata.id)
+
+        # Skip if already downloaded (before any retry or rate limiting)
+        try:
+            downloaded = pdf_path.stat().st_size > 0
+        except FileNotFoundError:
+            downloaded = False
+
+        if downloaded:
+            logger.debug("pdf_exists", arxiv_id=metadata.id, path=str(pdf_path))
+        else:
+            pdf_path = await self._download_pdf(metadata.id)
+
         return ArxivPaper(
             metadata=metadata,
             pdf_path=pdf_path,
@@ -162,33 +242,59 @@ class ArxivDownloader:
         papers: list[PaperMetadata],
         *,
         skip_errors: bool = True,
+        concurrency: int = DOWNLOAD_BATCH_CONCURRENCY,
     ) -> list[ArxivPaper]:
-        """Download PDFs for multiple papers sequentially.
+        """Download PDFs for multiple papers concurrently.
 
-        Note: Sequential due to arXiv rate limits. For parallel downloading
-        from multiple sources, use separate sessions.
+        Requests to the same host are spaced by that host's rate limiter, so
+        with several mirrors the waits on one overlap with downloads from the
+        others. A single mirror behaves like a sequential download.
 
         Args:
             papers: List of paper metadata
             skip_errors: If True, continue on individual failures
+            concurrency: Maximum number of downloads in flight at once
 
         Returns:
-            List of successfully downloaded papers
+            List of successfully downloaded papers, in input order
         """
-        results: list[ArxivPaper] = []
-
-        for i, metadata in enumerate(papers):
-            try:
-                paper = await self.download(metadata)
-                results.append(paper)
+        completed = 0
+        outcomes: list[ArxivPaper | BaseException | None] = [None] * len(papers)
+        pending = iter(enumerate(papers))
+
+        async def _worker() -> None:
+            nonlocal completed
+            # Workers share one iterator, so each paper is downloaded once
+            for index, metadata in pending:
+                try:
+                    outcomes[index] = await self.download(metadata)
+                except Exception as e:
+                    if not skip_errors:
+                        raise
+                    outcomes[index] = e
+                completed += 1
+                if completed % 10 == 0:
+                    logger.info("download_progress", completed=completed, total=len(papers))
+
+        workers = [
+            asyncio.create_task(_worker()) for _ in range(min(concurrency, len(papers)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the other downloads; their .part files are cleaned up on cancel
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
 
-                if (i + 1) % 10 == 0:
-                    logger.info("download_progress", completed=i + 1, total=len(papers))
-
-            except Exception as e:
-                logger.error("download_failed", arxiv_id=metadata.id, error=str(e))
-                if not skip_errors:
-                    raise
+        results: list[ArxivPaper] = []
+        for metadata, outcome in zip(papers, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("download_failed", arxiv_id=metadata.id, error=str(outcome))
+                continue
+            if outcome is not None:
+                results.append(outcome)
 
         return results
 
@@ -198,6 +304,7 @@ async def download_papers(
     output_dir: Path,
     *,
     skip_errors: bool = True,
+    mirrors: Sequence[str] = ARXIV_MIRRORS,
 ) -> list[ArxivPaper]:
     """Convenience function to download multiple papers.
 
@@ -205,11 +312,12 @@ async def download_papers(
         papers: List of paper metadata
         output_dir: Directory for downloaded PDFs
         skip_errors: If True, continue on individual failures
+        mirrors: Hosts to spread downloads across
 
     Returns:
         List of successfully downloaded papers
     """
-    downloader = ArxivDownloader(output_dir)
+    downloader = ArxivDownloader(output_dir, mirrors=mirrors)
     try:
         return await downloader.download_batch(papers, skip_errors=skip_errors)
     finally:
@@ -11,14 +11,90 @@ API Docs: https://api.semanticscholar.org/api-docs/
 """
 
 import asyncio
+from collections import OrderedDict, defaultdict
 from typing import Any
 
 import aiohttp
-from semanticscholar import SemanticScholar
 from semanticscholar.Paper import Paper
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from packages.ingestion.models import Citation, CitationIntent, PaperMetadata
+from packages.ingestion.pdf_downloader import RateLimiter
+
+# Keep-alive connection pool shared by every request a client makes
+S2_MAX_CONNECTIONS = 32
+S2_MAX_CONNECTIONS_PER_HOST = 10
+S2_DNS_CACHE_SECONDS = 300
+
+# Papers kept in the per-client LRU cache (bounds memory for long sessions)
+PAPER_CACHE_SIZE = 1024
+
+# Single-paper requests kept in flight (S2 allows 10 req/sec with a key, 1 without)
+S2_MAX_CONCURRENT_WITH_KEY = 10
+S2_MAX_CONCURRENT_WITHOUT_KEY = 1
+
+# /paper/batch accepts at most 500 IDs per request
+S2_BATCH_SIZE = 500
+
+# Attempts for rate-limited (429) and transient (5xx/network) failures,
+# matching the semanticscholar client's rate-limit retries
+S2_MAX_ATTEMPTS = 10
+S2_MAX_RETRY_AFTER_SECONDS = 60
+
+S2_RECOMMENDATIONS_URL = "https://api.semanticscholar.org/recommendations/v1"
+
+# Paper fields requested from the API (enough for paper_to_metadata)
+S2_PAPER_FIELDS = (
+    "paperId",
+    "externalIds",
+    "title",
+    "abstract",
+    "venue",
+    "year",
+    "authors",
+    "citationCount",
+    "influentialCitationCount",
+    "tldr",
+)
+
+# Fields of the citing/cited paper for the citations and references endpoints
+S2_CITATION_FIELDS = ("paperId", "title", "year", "authors", "citationCount")
+S2_REFERENCE_FIELDS = ("paperId", "title", "year", "authors", "externalIds")
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether a request failure is worth retrying (rate limit or transient)."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+_backoff = wait_exponential(multiplier=1, min=2, max=30)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After if it sent one, else back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, aiohttp.ClientResponseError) and exc.headers:
+        try:
+            return min(float(exc.headers["Retry-After"]), S2_MAX_RETRY_AFTER_SECONDS)
+        except (KeyError, ValueError):
+            pass
+    return _backoff(retry_state)
+
+
+_retry_transient = retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(S2_MAX_ATTEMPTS),
+    reraise=True,
+)
 
 
 class S2Client:
@@ -32,29 +108,75 @@ class S2Client:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts (for compatibility)
         """
-        self.client = SemanticScholar(api_key=api_key, timeout=timeout)
         self.api_key = api_key
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
         self.base_url = "https://api.semanticscholar.org/graph/v1"
         self.session: aiohttp.ClientSession | None = None
         self.headers = {"x-api-key": api_key} if api_key else {}
+        # arXiv ID -> Paper, most recently used last
+        self._paper_cache: OrderedDict[str, Paper | None] = OrderedDict()
+        # Per-ID locks so concurrent lookups of one paper share a single fetch
+        self._paper_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def __aenter__(self) -> "S2Client":
         """Context manager entry."""
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        self._get_session()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         """Context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
 
     async def close(self) -> None:
-        """Close the client session."""
+        """Close the client session and its connection pool."""
         if self.session:
             await self.session.close()
             self.session = None
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session.
+
+        One session (and so one keep-alive connection pool) serves every
+        request until close(), so TLS handshakes and DNS lookups are reused.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=S2_MAX_CONNECTIONS,
+                limit_per_host=S2_MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=S2_DNS_CACHE_SECONDS,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        return self.session
+
+    @_retry_transient
+    async def _get_json(self, url: str, params: dict[str, Any]) -> Any:
+        """GET a Semantic Scholar endpoint and decode the JSON body.
+
+        Rate-limited (429) and server-error responses are retried, waiting
+        for Retry-After when the server sends it.
+
+        Args:
+            url: Full endpoint URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON, or None if the resource does not exist
+
+        Raises:
+            aiohttp.ClientResponseError: On other HTTP errors, or once retries
+                are exhausted
+        """
+        async with self._get_session().get(url, params=params) as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            return await response.json()
+
     async def get(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
         """Make GET request using session.
 
@@ -65,9 +187,7 @@ class S2Client:
         Returns:
             Response object
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
-        return await self.session.get(url, **kwargs)
+        return await self._get_session().get(url, **kwargs)
 
     async def post(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
         """Make POST request using session.
@@ -79,14 +199,54 @@ class S2Client:
         Returns:
             Response object
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
-        return await self.session.post(url, **kwargs)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+        return await self._get_session().post(url, **kwargs)
+
+    async def _get_paper_cached(self, arxiv_id: str) -> Paper | None:
+        """Fetch a paper by arXiv ID, reusing earlier results.
+
+        Repeated lookups of one paper are fetched once per client.
+        Failures are not cached.
+
+        Args:
+            arxiv_id: ArXiv identifier
+
+        Returns:
+            Paper object or None if not found
+        """
+        if arxiv_id in self._paper_cache:
+            self._paper_cache.move_to_end(arxiv_id)
+            return self._paper_cache[arxiv_id]
+
+        async with self._paper_locks[arxiv_id]:
+            # Another task may have fetched it while we waited
+            if arxiv_id in self._paper_cache:
+                self._paper_cache.move_to_end(arxiv_id)
+                return self._paper_cache[arxiv_id]
+
+            try:
+                data = await self._get_json(
+                    f"{self.base_url}/paper/ARXIV:{arxiv_id}",
+                    {"fields": ",".join(S2_PAPER_FIELDS)},
+                )
+            finally:
+                self._paper_locks.pop(arxiv_id, None)
+
+            paper = Paper(data) if data else None
+            self._remember_paper(arxiv_id, paper)
+            return paper
+
+    def _remember_paper(self, arxiv_id: str, paper: Paper | None) -> None:
+        """Store a lookup result in the LRU paper cache.
+
+        Args:
+            arxiv_id: ArXiv identifier
+            paper: Paper object, or None if S2 has no match
+        """
+        self._paper_cache[arxiv_id] = paper
+        self._paper_cache.move_to_end(arxiv_id)
+        if len(self._paper_cache) > PAPER_CACHE_SIZE:
+            self._paper_cache.popitem(last=False)
+
     async def get_paper_by_arxiv_id(self, arxiv_id: str) -> Paper | None:
         """Fetch paper metadata from Semantic Scholar by arXiv ID.
 
@@ -96,27 +256,16 @@ class S2Client:
         Returns:
             Paper object or None if not found
 
+        Raises:
+            aiohttp.ClientError: If the request still fails after retries, so
+                rate-limited papers are not mistaken for missing ones
+
         Rate Limits:
             - Without API key: 1 request/sec
             - With API key: 10 requests/sec
         """
-        try:
-            # Run sync S2 client in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            paper = await loop.run_in_executor(
-                None,
-                self.client.get_paper,
-                f"ARXIV:{arxiv_id}",
-            )
-            return paper
-        except Exception as e:
-            print(f"Failed to fetch paper {arxiv_id}: {e}")
-            return None
+        return await self._get_paper_cached(arxiv_id)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def get_paper_citations(
         self, arxiv_id: str, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -130,24 +279,23 @@ class S2Client:
             List of citation dicts with context and citing paper metadata
         """
         try:
-            loop = asyncio.get_event_loop()
-            paper = await loop.run_in_executor(
-                None,
-                self.client.get_paper,
-                f"ARXIV:{arxiv_id}",
+            data = await self._get_json(
+                f"{self.base_url}/paper/ARXIV:{arxiv_id}/citations",
+                {"fields": ",".join(S2_CITATION_FIELDS), "limit": limit},
             )
-            if not paper or not paper.citations:
+            if not data or not data.get("data"):
                 return []
 
             citations = []
-            for cite in paper.citations[:limit]:
+            for item in data["data"][:limit]:
+                cite = item.get("citingPaper") or {}
                 citations.append(
                     {
-                        "citing_paper_id": cite.paperId,
-                        "title": cite.title,
-                        "year": cite.year,
-                        "authors": [a.name for a in cite.authors] if cite.authors else [],
-                        "citation_count": cite.citationCount or 0,
+                        "citing_paper_id": cite.get("paperId"),
+                        "title": cite.get("title"),
+                        "year": cite.get("year"),
+                        "authors": [a["name"] for a in cite.get("authors") or []],
+                        "citation_count": cite.get("citationCount") or 0,
                     }
                 )
             return citations
@@ -156,10 +304,6 @@ class S2Client:
             print(f"Failed to fetch citations for {arxiv_id}: {e}")
             return []
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def get_paper_references(
         self, arxiv_id: str, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -173,25 +317,25 @@ class S2Client:
             List of reference dicts with metadata
         """
         try:
-            loop = asyncio.get_event_loop()
-            paper = await loop.run_in_executor(
-                None,
-                self.client.get_paper,
-                f"ARXIV:{arxiv_id}",
+            data = await self._get_json(
+                f"{self.base_url}/paper/ARXIV:{arxiv_id}/references",
+                {"fields": ",".join(S2_REFERENCE_FIELDS), "limit": limit},
             )
-            if not paper or not paper.references:
+            if not data or not data.get("data"):
                 return []
 
             references = []
-            for ref in paper.references[:limit]:
+            for item in data["data"][:limit]:
+                ref = item.get("citedPaper") or {}
+                external_ids = ref.get("externalIds") or {}
                 references.append(
                     {
-                        "paper_id": ref.paperId,
-                        "title": ref.title,
-                        "year": ref.year,
-                        "authors": [a.name for a in ref.authors] if ref.authors else [],
-                        "arxiv_id": self._extract_arxiv_id(ref.externalIds or {}),
-                        "doi": ref.externalIds.get("DOI") if ref.externalIds else None,
+                        "paper_id": ref.get("paperId"),
+                        "title": ref.get("title"),
+                        "year": ref.get("year"),
+                        "authors": [a["name"] for a in ref.get("authors") or []],
+                        "arxiv_id": self._extract_arxiv_id(external_ids),
+                        "doi": external_ids.get("DOI"),
                     }
                 )
             return references
@@ -224,12 +368,13 @@ class S2Client:
             ]
 
         try:
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.client.search_paper(query, limit=limit, fields=fields),
+            data = await self._get_json(
+                f"{self.base_url}/paper/search",
+                {"query": query, "limit": limit, "fields": ",".join(fields)},
             )
-            return results if results else []
+            if not data or not data.get("data"):
+                return []
+            return [Paper(item) for item in data["data"]]
 
         except Exception as e:
             print(f"Search failed for query '{query}': {e}")
@@ -279,7 +424,7 @@ class S2Client:
         arxiv_id = external_ids.get("ArXiv")
         if arxiv_id:
             # Remove 'arXiv:' prefix if present
-            return arxiv_id.replace("arXiv:", "")
+            return arxiv_id.removeprefix("arXiv:")
         return None
 
     async def get_recommendations(self, arxiv_id: str, limit: int = 10) -> list[Paper]:
@@ -293,42 +438,118 @@ class S2Client:
             List of recommended Paper objects
         """
         try:
-            loop = asyncio.get_event_loop()
-            paper = await loop.run_in_executor(
-                None,
-                self.client.get_paper,
-                f"ARXIV:{arxiv_id}",
+            # The recommendations API resolves arXiv IDs itself
+            data = await self._get_json(
+                f"{S2_RECOMMENDATIONS_URL}/papers/forpaper/ARXIV:{arxiv_id}",
+                {"fields": ",".join(Paper.SEARCH_FIELDS), "limit": limit},
             )
-            if not paper:
+            if not data or not data.get("recommendedPapers"):
                 return []
-
-            # Get recommendations via similar papers
-            recommendations = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_recommended_papers(paper.paperId, limit=limit),
-            )
-            return recommendations if recommendations else []
+            return [Paper(item) for item in data["recommendedPapers"]]
 
         except Exception as e:
             print(f"Failed to get recommendations for {arxiv_id}: {e}")
             return []
 
+    @_retry_transient
+    async def _fetch_paper_batch(self, arxiv_ids: list[str]) -> list[Paper | None]:
+        """Fetch up to S2_BATCH_SIZE papers in one /paper/batch request.
+
+        Args:
+            arxiv_ids: ArXiv identifiers
+
+        Returns:
+            One entry per ID, in order; None where S2 has no match
+        """
+        async with self._get_session().post(
+            f"{self.base_url}/paper/batch",
+            params={"fields": ",".join(S2_PAPER_FIELDS)},
+            json={"ids": [f"ARXIV:{arxiv_id}" for arxiv_id in arxiv_ids]},
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return [Paper(item) if item else None for item in data]
+
     async def batch_fetch_papers(
-        self, arxiv_ids: list[str], delay: float = 0.1
+        self, arxiv_ids: list[str], delay: float = 0.1, batch_size: int = S2_BATCH_SIZE
     ) -> list[Paper]:
-        """Fetch multiple papers with rate limiting.
+        """Fetch multiple papers via the /paper/batch endpoint.
+
+        A null entry in a batch response means S2 has no such paper, so it
+        is cached as missing and not retried. Only IDs in batch requests that
+        failed outright (after the transient-error retries) fall back to
+        single-paper lookups. Batch results populate the paper cache.
+
+        Args:
+            arxiv_ids: List of arXiv IDs
+            delay: Delay between fallback requests in seconds (0.1s = 10 req/sec)
+            batch_size: IDs per batch request (at most S2_BATCH_SIZE)
+
+        Returns:
+            List of successfully fetched Papers, in input order
+        """
+        fetched: list[Paper | None] = []
+        # Indexes of IDs whose batch request failed, to retry one by one
+        missing: list[int] = []
+        for start in range(0, len(arxiv_ids), batch_size):
+            chunk = arxiv_ids[start : start + batch_size]
+            try:
+                papers = await self._fetch_paper_batch(chunk)
+                results = list(zip(chunk, papers, strict=True))
+            except Exception as e:
+                print(f"Batch fetch failed for {len(chunk)} papers: {e}")
+                missing.extend(range(start, start + len(chunk)))
+                fetched.extend([None] * len(chunk))
+                continue
+            for arxiv_id, paper in results:
+                self._remember_paper(arxiv_id, paper)
+            fetched.extend(papers)
+
+        if missing:
+            singles = await self.fetch_papers_concurrently(
+                [arxiv_ids[i] for i in missing], delay=delay
+            )
+            for i, paper in zip(missing, singles, strict=True):
+                fetched[i] = paper
+
+        return [paper for paper in fetched if paper]
+
+    async def fetch_papers_concurrently(
+        self, arxiv_ids: list[str], delay: float = 0.1
+    ) -> list[Paper | None]:
+        """Fetch papers one request each, keeping several requests in flight.
+
+        Concurrency is capped by the API-key tier and request starts are
+        spaced by ``delay``, so throughput approaches the rate limit rather
+        than 1 / (latency + delay).
 
         Args:
             arxiv_ids: List of arXiv IDs
-            delay: Delay between requests in seconds (0.1s = 10 req/sec)
+            delay: Minimum interval between request starts in seconds
 
         Returns:
-            List of successfully fetched Papers
+            One entry per ID, in order; None where the fetch failed
         """
-        papers = []
-        for arxiv_id in arxiv_ids:
-            paper = await self.get_paper_by_arxiv_id(arxiv_id)
-            if paper:
-                papers.append(paper)
-            await asyncio.sleep(delay)  # Rate limiting
-        return papers
\ No newline at end of file
+        semaphore = asyncio.Semaphore(
+            S2_MAX_CONCURRENT_WITH_KEY if self.api_key else S2_MAX_CONCURRENT_WITHOUT_KEY
+        )
+        rate_limiter = RateLimiter(delay)
+
+        async def _fetch_one(arxiv_id: str) -> Paper | None:
+            async with semaphore:
+                await rate_limiter.acquire()
+                return await self.get_paper_by_arxiv_id(arxiv_id)
+
+        results = await asyncio.gather(
+            *(_fetch_one(arxiv_id) for arxiv_id in arxiv_ids),
+            return_exceptions=True,
+        )
+
+        papers: list[Paper | None] = []
+        for arxiv_id, result in zip(arxiv_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"Failed to fetch paper {arxiv_id} after retries: {result}")
+                papers.append(None)
+            else:
+                papers.append(result)
+        return papers
@@ -7,7 +7,11 @@ Splits papers into meaningful chunks while preserving:
 - Paragraph coherence
 """
 
+import re
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 import structlog
@@ -16,8 +20,35 @@ from packages.ingestion.models import ParsedPaper, Section
 
 logger = structlog.get_logger()
 
-
-@dataclass
+# Equations: display ($$...$$) and longer inline ($...$) math
+# Bodies are possessive, non-empty and uncapped: each opener pairs with the
+# next delimiter whatever the equation's length, without backtracking.
+_DISPLAY_EQ_RE = re.compile(r"\$\$((?:[^$]|\$(?!\$))++)\$\$")
+_INLINE_EQ_RE = re.compile(r"\$([^$]++)\$")
+# Short inline math is mostly noise. It is still matched (so its delimiters
+# pair correctly) and dropped afterwards.
+_INLINE_EQ_MIN_LENGTH = 4
+
+# Citation identifiers. These are separate scans rather than one alternation:
+# the DOI's literal "10." prefix and the old-style "/NNNNNNN" tail let the
+# regex engine skip ahead quickly, which a combined pattern would prevent.
+_ARXIV_RE = re.compile(r"\d{4}\.\d{4,5}(?:v\d+)?")  # 2401.12345 (optional "arXiv:" not kept)
+# Old-style IDs: a real pre-2007 archive name, an optional subject class
+# (math.AG, cond-mat.str-el), then YYMMNNN, e.g. hep-th/9901001
+_OLD_ARXIV_ARCHIVES = (
+    "acc-phys|adap-org|alg-geom|ao-sci|astro-ph|atom-ph|bayes-an|chao-dyn|chem-ph|"
+    "cmp-lg|comp-gas|cond-mat|cs|dg-ga|funct-an|gr-qc|hep-ex|hep-lat|hep-ph|hep-th|"
+    "math|math-ph|mtrl-th|nlin|nucl-ex|nucl-th|patt-sol|physics|plasm-ph|q-alg|"
+    "q-bio|q-fin|quant-ph|solv-int|stat|supr-con"
+)
+_OLD_ARXIV_RE = re.compile(
+    rf"(?<![\w.-])(?:{_OLD_ARXIV_ARCHIVES})(?:\.[A-Za-z-]+)?/\d{{7}}(?!\d)"
+)
+_OLD_ARXIV_TAIL_RE = re.compile(r"/\d{7}")
+_DOI_RE = re.compile(r"10\.\d{4,}/\S+")
+
+
+@dataclass(slots=True)
 class PaperChunk:
     """A semantic chunk of a paper."""
 
@@ -52,6 +83,18 @@ class SemanticChunker:
         "acknowledgments": ["acknowledgments", "acknowledgements"],
     }
 
+    # One pattern for every type: each branch looks ahead for any of that
+    # type's keywords, so the first matching type in SECTION_TYPES order wins
+    _SECTION_TYPE_RE = re.compile(
+        "^(?:"
+        + "|".join(
+            f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{section_type}>)"
+            for section_type, keywords in SECTION_TYPES.items()
+        )
+        + ")",
+        re.DOTALL,
+    )
+
     def __init__(
         self,
         *,
@@ -82,14 +125,10 @@ class SemanticChunker:
         Returns:
             Section type (e.g., "introduction", "methods", etc.)
         """
-        title_lower = section_title.lower().strip()
-
-        for section_type, keywords in self.SECTION_TYPES.items():
-            if any(keyword in title_lower for keyword in keywords):
-                return section_type
+        match = self._SECTION_TYPE_RE.match(section_title.lower())
 
         # Default to generic "section"
-        return "section"
+        return match.lastgroup if match else "section"
 
     def _extract_equations_from_content(self, content: str) -> list[str]:
         """Extract equation references from content.
@@ -100,18 +139,13 @@ class SemanticChunker:
         Returns:
             List of equation strings
         """
-        import re
-
-        equations = []
-
-        # Display equations
-        display_pattern = re.compile(r"\$\$(.+?)\$\$", re.DOTALL)
-        equations.extend(m.group(1).strip() for m in display_pattern.finditer(content))
-
-        # Inline equations (only longer ones to avoid noise)
-        inline_pattern = re.compile(r"\$([^$]{4,})\$")
-        equations.extend(m.group(1).strip() for m in inline_pattern.finditer(content))
-
+        # Display equations, then inline equations (only longer ones)
+        equations = [m.group(1).strip() for m in _DISPLAY_EQ_RE.finditer(content)]
+        equations.extend(
+            m.group(1).strip()
+            for m in _INLINE_EQ_RE.finditer(content)
+            if len(m.group(1)) >= _INLINE_EQ_MIN_LENGTH
+        )
         return equations
 
     def _extract_citation_ids_from_content(self, content: str) -> list[str]:
@@ -123,122 +157,161 @@ class SemanticChunker:
         Returns:
             List of citation IDs (arXiv IDs or DOIs)
         """
-        import re
+        # arXiv IDs, then DOIs; dict keys dedupe while keeping first-seen order
+        citation_ids = dict.fromkeys(_ARXIV_RE.findall(content))
+        # Old-style IDs are rare, so only run that scan when one may be present
+        if _OLD_ARXIV_TAIL_RE.search(content):
+            citation_ids.update(dict.fromkeys(_OLD_ARXIV_RE.findall(content)))
+        citation_ids.update(dict.fromkeys(_DOI_RE.findall(content)))
 
-        citation_ids = []
+        return list(citation_ids)
+
+    def _extract_all(
+        self, content: str, *, equations: list[str] | None = None
+    ) -> tuple[list[str], list[str]]:
+        """Extract equations and citation IDs from content.
+
+        The per-kind scans run back to back rather than as one alternation:
+        each pattern keeps its literal-prefix fast path that way.
+
+        Args:
+            content: Text content
+            equations: Equations already known for the content; the equation
+                scan is skipped when non-empty
+
+        Returns:
+            Tuple of (equations, citation IDs)
+        """
+        return (
+            equations or self._extract_equations_from_content(content),
+            self._extract_citation_ids_from_content(content),
+        )
 
-        # arXiv IDs
-        arxiv_pattern = re.compile(r"(?:arXiv:)?(\d{4}\.\d{4,5}(?:v\d+)?)")
-        citation_ids.extend(m.group(1) for m in arxiv_pattern.finditer(content))
+    def _build_chunk(
+        self,
+        content: str,
+        *,
+        arxiv_id: str,
+        section_type: str,
+        title: str,
+        position: int,
+        level: int,
+        equations: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> PaperChunk:
+        """Build a chunk, extracting its equations and citations.
 
-        # DOIs
-        doi_pattern = re.compile(r"10\.\d{4,}/[^\s]+")
-        citation_ids.extend(m.group(0) for m in doi_pattern.finditer(content))
+        Args:
+            content: Final chunk text
+            arxiv_id: Paper arXiv ID
+            section_type: Standard section type
+            title: Section title
+            position: Order in paper
+            level: Section level
+            equations: Equations already known for the content
+            metadata: Optional chunk metadata
 
-        return list(set(citation_ids))  # Deduplicate
+        Returns:
+            The chunk
+        """
+        equations, citations = self._extract_all(content, equations=equations)
+        return PaperChunk(
+            arxiv_id=arxiv_id,
+            section_type=section_type,
+            title=title,
+            content=content,
+            equations=equations,
+            citations=citations,
+            position=position,
+            level=level,
+            word_count=len(content.split()),
+            char_count=len(content),
+            metadata=metadata,
+        )
 
-    def _split_large_section(self, section: Section, arxiv_id: str, position: int) -> list[PaperChunk]:
+    def _split_large_section(
+        self, section: Section, arxiv_id: str, position: int, section_type: str
+    ) -> list[PaperChunk]:
         """Split large section into smaller chunks.
 
+        Paragraphs are accumulated until the next one would push the joined
+        text past max_chunk_size; each chunk's text is joined exactly once.
+        Equations the parser already found for the section are handed to
+        the chunks whose text contains them instead of being re-extracted.
+
         Args:
             section: Section to split
             arxiv_id: Paper arXiv ID
             position: Starting position
+            section_type: Standard section type, classified once by the caller
 
         Returns:
             List of chunks
         """
         chunks: list[PaperChunk] = []
 
-        # Split by paragraphs
-        paragraphs = section.content.split("\n\n")
-
-        current_content = []
-        current_length = 0
-
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-
-            para_length = len(para)
-
-            # If adding this paragraph exceeds max size, create a chunk
-            if current_content and current_length + para_length > self.max_chunk_size:
-                content = "\n\n".join(current_content)
-                section_type = self._classify_section_type(section.title)
-
-                chunks.append(
-                    PaperChunk(
-                        arxiv_id=arxiv_id,
-                        section_type=section_type,
-                        title=section.title,
-                        content=content,
-                        equations=self._extract_equations_from_content(content),
-                        citations=self._extract_citation_ids_from_content(content),
-                        position=position + len(chunks),
-                        level=section.level,
-                        word_count=len(content.split()),
-                        char_count=len(content),
-                    )
-                )
-
-                current_content = [para]
-                current_length = para_length
-            else:
-                current_content.append(para)
-                current_length += para_length + 2  # +2 for \n\n
-
-        # Don't forget remaining content
-        if current_content:
-            content = "\n\n".join(current_content)
-            section_type = self._classify_section_type(section.title)
+        parts: list[str] = []
+        total = 0  # len("\n\n".join(parts))
 
+        def flush() -> None:
+            content = "\n\n".join(parts)
             chunks.append(
-                PaperChunk(
+                self._build_chunk(
+                    content,
                     arxiv_id=arxiv_id,
                     section_type=section_type,
                     title=section.title,
-                    content=content,
-                    equations=self._extract_equations_from_content(content),
-                    citations=self._extract_citation_ids_from_content(content),
                     position=position + len(chunks),
                     level=section.level,
-                    word_count=len(content.split()),
-                    char_count=len(content),
+                    equations=[eq for eq in section.equations if eq in content],
                 )
             )
 
+        # Split by paragraphs
+        for para in section.content.split("\n\n"):
+            para = para.strip()
+            if not para:
+                continue
+
+            # If adding this paragraph exceeds max size, emit a chunk first
+            if parts and total + 2 + len(para) > self.max_chunk_size:
+                flush()
+                parts = []
+
+            total = total + 2 + len(para) if parts else len(para)
+            parts.append(para)
+
+        # Don't forget remaining content
+        if parts:
+            flush()
+
         return chunks
 
-    def chunk_paper(self, paper: ParsedPaper) -> list[PaperChunk]:
-        """Chunk a parsed paper into semantic units.
+    def iter_chunks(self, paper: ParsedPaper) -> Iterator[PaperChunk]:
+        """Yield a parsed paper's semantic chunks as they are built.
+
+        Lets consumers such as embedding or indexing start on the first
+        chunks before the rest of the paper is chunked, holding at most one
+        section's chunks at a time.
 
         Args:
             paper: Parsed paper
 
-        Returns:
-            List of chunks
+        Yields:
+            Chunks in paper order
         """
-        chunks: list[PaperChunk] = []
         position = 0
 
         # Always create abstract chunk first
         if paper.abstract:
-            chunks.append(
-                PaperChunk(
-                    arxiv_id=paper.arxiv_id,
-                    section_type="abstract",
-                    title="Abstract",
-                    content=paper.abstract,
-                    equations=self._extract_equations_from_content(paper.abstract),
-                    citations=self._extract_citation_ids_from_content(paper.abstract),
-                    position=position,
-                    level=1,
-                    word_count=len(paper.abstract.split()),
-                    char_count=len(paper.abstract),
-                    metadata={"is_abstract": True},
-                )
+            yield self._build_chunk(
+                paper.abstract,
+                arxiv_id=paper.arxiv_id,
+                section_type="abstract",
+                title="Abstract",
+                position=position,
+                level=1,
+                metadata={"is_abstract": True},
             )
             position += 1
 
@@ -252,27 +325,35 @@ class SemanticChunker:
 
             # If section is small enough, create single chunk
             if len(section.content) <= self.max_chunk_size:
-                chunks.append(
-                    PaperChunk(
-                        arxiv_id=paper.arxiv_id,
-                        section_type=section_type,
-                        title=section.title,
-                        content=section.content,
-                        equations=section.equations or self._extract_equations_from_content(section.content),
-                        citations=self._extract_citation_ids_from_content(section.content),
-                        position=position,
-                        level=section.level,
-                        word_count=len(section.content.split()),
-                        char_count=len(section.content),
-                    )
+                yield self._build_chunk(
+                    section.content,
+                    arxiv_id=paper.arxiv_id,
+                    section_type=section_type,
+                    title=section.title,
+                    position=position,
+                    level=section.level,
+                    equations=section.equations,
                 )
                 position += 1
             else:
                 # Split large section
-                section_chunks = self._split_large_section(section, paper.arxiv_id, position)
-                chunks.extend(section_chunks)
+                section_chunks = self._split_large_section(
+                    section, paper.arxiv_id, position, section_type
+                )
+                yield from section_chunks
                 position += len(section_chunks)
 
+    def chunk_paper(self, paper: ParsedPaper) -> list[PaperChunk]:
+        """Chunk a parsed paper into semantic units.
+
+        Args:
+            paper: Parsed paper
+
+        Returns:
+            List of chunks
+        """
+        chunks = list(self.iter_chunks(paper))
+
         logger.info(
             "chunked_paper",
             arxiv_id=paper.arxiv_id,
@@ -294,15 +375,15 @@ class SemanticChunker:
         if not chunks:
             return {}
 
-        section_types = [c.section_type for c in chunks]
-        char_counts = [c.char_count for c in chunks]
-        word_counts = [c.word_count for c in chunks]
+        # Counter and map() keep the per-chunk loops in C; a single Python
+        # loop accumulating every figure measured slower than these passes
+        char_counts = list(map(attrgetter("char_count"), chunks))
 
         return {
             "total_chunks": len(chunks),
-            "section_types": dict((t, section_types.count(t)) for t in set(section_types)),
+            "section_types": dict(Counter(map(attrgetter("section_type"), chunks))),
             "avg_char_count": sum(char_counts) / len(char_counts),
-            "avg_word_count": sum(word_counts) / len(word_counts),
+            "avg_word_count": sum(map(attrgetter("word_count"), chunks)) / len(chunks),
             "min_char_count": min(char_counts),
             "max_char_count": max(char_counts),
             "total_equations": sum(len(c.equations) for c in chunks),
@@ -9,6 +9,9 @@ Currently implements PyMuPDF as the baseline extractor.
 """
 
 import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -35,17 +38,19 @@ else:
 
 logger = structlog.get_logger()
 
-# Regex patterns for section detection
-SECTION_PATTERNS = [
-    # Numbered sections: "1. Introduction", "2.1 Methods"
-    re.compile(r"^(\d+\.?\d*\.?\d*)\s+(.+)$", re.MULTILINE),
-    # Unnumbered common sections
-    re.compile(
-        r"^(Abstract|Introduction|Background|Methods?|Results?|Discussion|"
-        r"Conclusions?|References|Acknowledgments?|Appendix)\s*$",
-        re.MULTILINE | re.IGNORECASE,
-    ),
-]
+# Section header detection, one header per line (surrounding whitespace
+# ignored). Numbered headers: "1. Introduction", "2.1 Methods"; unnumbered
+# headers are the common section names on a line of their own. Matches start
+# at the preceding newline: a literal prefix lets the regex engine jump from
+# line to line, so search the text with a newline prepended.
+SECTION_HEADER_PATTERN = re.compile(
+    r"\n[^\S\n]*(?:"
+    r"(?P<number>\d+\.?\d*\.?\d*)[^\S\n]+(?P<title>.+)"
+    r"|(?P<name>Abstract|Introduction|Background|Methods?|Results?|Discussion|"
+    r"Conclusions?|References|Acknowledgments?|Appendix)[^\S\n]*"
+    r")$",
+    re.MULTILINE | re.IGNORECASE,
+)
 
 # arXiv ID pattern for citation detection
 ARXIV_ID_PATTERN = re.compile(
@@ -58,13 +63,69 @@ ARXIV_ID_PATTERN = re.compile(
 DOI_PATTERN = re.compile(r"10\.\d{4,}/[^\s]+")
 
 # LaTeX equation patterns
+# Environment bodies are possessive, non-empty and uncapped. A body cannot
+# contain its own \begin or \end marker (environments don't nest), so an
+# unterminated \begin{...} fails at the next opener instead of rescanning to
+# the end of the text.
 EQUATION_PATTERNS = [
     re.compile(r"\$\$([^$]+)\$\$"),  # Display math
     re.compile(r"\$([^$]+)\$"),  # Inline math
-    re.compile(r"\\begin\{equation\}(.+?)\\end\{equation\}", re.DOTALL),
-    re.compile(r"\\begin\{align\}(.+?)\\end\{align\}", re.DOTALL),
+    re.compile(
+        r"\\begin\{equation\}((?:(?!\\(?:begin|end)\{equation\}).)++)\\end\{equation\}",
+        re.DOTALL,
+    ),
+    re.compile(
+        r"\\begin\{align\}((?:(?!\\(?:begin|end)\{align\}).)++)\\end\{align\}", re.DOTALL
+    ),
 ]
 
+# PyMuPDF is not thread-safe, even across separate documents, and parsers
+# run it from worker threads (asyncio.to_thread); only one thread may use
+# fitz at a time. Worker processes have their own copy and don't need it.
+_FITZ_LOCK = threading.Lock()
+
+# Documents shorter than this are always extracted serially; below it the
+# cost of starting worker processes outweighs the per-page work
+PARALLEL_MIN_PAGES = 64
+
+
+def _page_text(page: "fitz.Page", margin: float) -> str:
+    """Extract the text of one page, optionally clipping its margins.
+
+    Args:
+        page: PyMuPDF page
+        margin: Points trimmed from the top and bottom of the page
+
+    Returns:
+        Page text
+    """
+    # Margins are clipped natively by PyMuPDF, not filtered per block
+    clip = None
+    if margin:
+        rect = page.rect
+        clip = fitz.Rect(rect.x0, rect.y0 + margin, rect.x1, rect.y1 - margin)
+    # Extract text with layout preservation
+    return page.get_text("text", clip=clip)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int, margin: float) -> list[str]:
+    """Extract text from pages [start, stop) of a PDF in a worker process.
+
+    PyMuPDF documents cannot be shared between threads or processes, so each
+    worker opens its own handle.
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index
+        stop: Page index to stop before
+        margin: Points trimmed from the top and bottom of each page
+
+    Returns:
+        Text of each page in the range, in page order
+    """
+    with fitz.open(pdf_path) as doc:
+        return [_page_text(doc[number], margin) for number in range(start, stop)]
+
 
 class PyMuPDFExtractor:
     """Text extraction using PyMuPDF (fitz).
@@ -73,13 +134,24 @@ class PyMuPDFExtractor:
     Limited handling of complex layouts and equations.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, page_margin: float = 0.0, workers: int = 1) -> None:
+        """Initialize the extractor.
+
+        Args:
+            page_margin: Height in points trimmed from the top and bottom of
+                every page, dropping running headers, footers and page numbers
+                before any downstream regex sees them (0 keeps the full page)
+            workers: Processes used to extract documents of at least
+                PARALLEL_MIN_PAGES pages (1 extracts serially)
+        """
         if fitz is None:
             raise ImportError(
                 "PyMuPDF (fitz) is not installed. "
                 "Install it with: pip install pymupdf"
             )
         self.parser_type = ParserType.PYMUPDF
+        self.page_margin = page_margin
+        self.workers = workers
 
     def extract_text(self, pdf_path: Path) -> str:
         """Extract raw text from PDF.
@@ -93,16 +165,67 @@ class PyMuPDFExtractor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        text_parts: list[str] = []
-
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                # Extract text with layout preservation
-                text = page.get_text("text")
-                text_parts.append(text)
+        with _FITZ_LOCK, fitz.open(pdf_path) as doc:
+            page_count = doc.page_count
+            if self.workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+                return "\n\n".join(_page_text(page, self.page_margin) for page in doc)
+
+        # PyMuPDF holds the GIL and is not thread-safe, so long documents are
+        # split into contiguous page ranges, one per worker process
+        step = -(-page_count // self.workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(_extract_page_range, str(pdf_path), start, stop, self.page_margin)
+                for start, stop in ranges
+            ]
+            text_parts = [text for future in futures for text in future.result()]
 
         return "\n\n".join(text_parts)
 
+    def iter_sections(self, text: str) -> Iterator[Section]:
+        """Yield document sections as their headers are found.
+
+        Each section is produced as soon as the next header (or the end of
+        the text) bounds it, so callers can stream sections without the
+        whole list being built first.
+
+        Args:
+            text: Full document text
+
+        Yields:
+            Detected sections in document order
+        """
+        text = "\n" + text
+        previous: re.Match[str] | None = None
+
+        # Content runs from the end of one header line to the start of the next
+        for header in SECTION_HEADER_PATTERN.finditer(text):
+            if previous is not None:
+                yield self._section_from_header(text, previous, header.start())
+            previous = header
+        if previous is not None:
+            yield self._section_from_header(text, previous, len(text))
+
+    @staticmethod
+    def _section_from_header(text: str, header: re.Match[str], end: int) -> Section:
+        """Build the section a header match opens, ending at offset end.
+
+        Args:
+            text: Text the header was matched in
+            header: SECTION_HEADER_PATTERN match
+            end: Offset where the section's content ends
+
+        Returns:
+            The section
+        """
+        number = header.group("number")
+        return Section(
+            title=header.group("title").strip() if number else header.group("name"),
+            content=text[header.end() : end].strip(),
+            level=number.count(".") + 1 if number else 1,
+        )
+
     def extract_sections(self, text: str) -> list[Section]:
         """Attempt to identify document sections.
 
@@ -112,67 +235,7 @@ class PyMuPDFExtractor:
         Returns:
             List of detected sections
         """
-        sections: list[Section] = []
-        current_section: str | None = None
-        current_content: list[str] = []
-        current_level = 1
-
-        lines = text.split("\n")
-
-        for line in lines:
-            stripped = line.strip()
-            is_header = False
-
-            # Check numbered section patterns
-            match = SECTION_PATTERNS[0].match(stripped)
-            if match:
-                # Save previous section
-                if current_section:
-                    sections.append(
-                        Section(
-                            title=current_section,
-                            content="\n".join(current_content).strip(),
-                            level=current_level,
-                        )
-                    )
-
-                number = match.group(1)
-                current_section = match.group(2)
-                current_level = number.count(".") + 1
-                current_content = []
-                is_header = True
-
-            # Check unnumbered section patterns
-            if not is_header:
-                match = SECTION_PATTERNS[1].match(stripped)
-                if match:
-                    if current_section:
-                        sections.append(
-                            Section(
-                                title=current_section,
-                                content="\n".join(current_content).strip(),
-                                level=current_level,
-                            )
-                        )
-                    current_section = match.group(1)
-                    current_level = 1
-                    current_content = []
-                    is_header = True
-
-            if not is_header:
-                current_content.append(line)
-
-        # Don't forget the last section
-        if current_section:
-            sections.append(
-                Section(
-                    title=current_section,
-                    content="\n".join(current_content).strip(),
-                    level=current_level,
-                )
-            )
-
-        return sections
+        return list(self.iter_sections(text))
 
     def extract_citations(self, text: str) -> list[Citation]:
         """Extract citation references from text.
@@ -4,7 +4,9 @@ Provides caching for frequent graph queries to reduce database load
 and improve response times.
 """
 
+import asyncio
 import hashlib
+import inspect
 import json
 import os
 from typing import Any
@@ -12,11 +14,43 @@ from typing import Any
 import redis.asyncio as redis
 import structlog
 
+# orjson is much faster on large result rows and returns bytes, which redis
+# accepts as-is; it is installed with the graph/llm dependency groups, so fall
+# back to the stdlib when absent. The fallback emits the same compact form, so
+# cache keys agree whichever encoder computed them.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = structlog.get_logger()
 
+
+def _json_dumps(value: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize a value to compact UTF-8 JSON.
+
+    Args:
+        value: JSON-compatible value
+        sort_keys: Sort object keys (for deterministic output)
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, option=option)
+    return json.dumps(
+        value, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Default cache settings
 DEFAULT_REDIS_URL = "redis://localhost:6379"
 DEFAULT_TTL = 3600  # 1 hour
+SCAN_COUNT = 1000  # Keys examined per SCAN round trip
+INVALIDATE_BATCH_SIZE = 500  # Keys per UNLINK during prefix invalidation
 
 
 class CacheClient:
@@ -40,10 +74,12 @@ class CacheClient:
     async def connect(self) -> None:
         """Connect to Redis."""
         if not self._client:
+            # Values stay bytes: they go straight to the JSON decoder, so
+            # decoding each reply to str first would be a wasted full copy
             self._client = await redis.from_url(
                 self.redis_url,
                 encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
             )
             logger.info("redis_connected", url=self.redis_url)
 
@@ -65,9 +101,11 @@ class CacheClient:
         Returns:
             Cache key
         """
-        # Create deterministic hash of query + params
-        content = query + json.dumps(params or {}, sort_keys=True)
-        hash_value = hashlib.sha256(content.encode()).hexdigest()[:16]
+        # Create deterministic hash of query + params. A key needs no
+        # cryptographic strength: an 8-byte BLAKE2b digest is 16 hex chars
+        # directly and is cheaper than SHA-256 on short inputs.
+        content = query.encode() + _json_dumps(params or {}, sort_keys=True)
+        hash_value = hashlib.blake2b(content, digest_size=8).hexdigest()
         return f"arxiv:{prefix}:{hash_value}"
 
     async def get(
@@ -95,7 +133,7 @@ class CacheClient:
             cached = await self._client.get(key)  # type: ignore
             if cached:
                 logger.debug("cache_hit", key=key)
-                return json.loads(cached)
+                return _json_loads(cached)
             logger.debug("cache_miss", key=key)
             return None
         except Exception as e:
@@ -129,7 +167,7 @@ class CacheClient:
         ttl = ttl or self.default_ttl
 
         try:
-            serialized = json.dumps(value)
+            serialized = _json_dumps(value)
             await self._client.setex(key, ttl, serialized)  # type: ignore
             logger.debug("cache_set", key=key, ttl=ttl)
             return True
@@ -176,15 +214,21 @@ class CacheClient:
         pattern = f"arxiv:{prefix}:*"
 
         try:
-            keys = []
-            async for key in self._client.scan_iter(match=pattern):  # type: ignore
-                keys.append(key)
-
-            if keys:
-                count = await self._client.delete(*keys)  # type: ignore
+            # UNLINK frees values in a Redis background thread, and batching
+            # keeps both client memory and each server-side call bounded
+            count = 0
+            batch: list[Any] = []
+            async for key in self._client.scan_iter(match=pattern, count=SCAN_COUNT):  # type: ignore
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    count += await self._client.unlink(*batch)  # type: ignore
+                    batch = []
+            if batch:
+                count += await self._client.unlink(*batch)  # type: ignore
+
+            if count:
                 logger.info("cache_invalidated", prefix=prefix, count=count)
-                return count
-            return 0
+            return count
         except Exception as e:
             logger.warning("cache_invalidate_error", error=str(e), prefix=prefix)
             return 0
@@ -241,6 +285,10 @@ def cache_query(
 ):
     """Decorator to cache async function results.
 
+    Results are keyed on the function's qualified name and its bound
+    arguments. For methods the ``self``/``cls`` argument is left out of the
+    key, so all instances of a class share cached results.
+
     Args:
         prefix: Cache key prefix
         ttl: Time-to-live in seconds
@@ -254,24 +302,52 @@ def cache_query(
     from functools import wraps
 
     def decorator(func):
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+        # The receiver of a method has no stable encoding; leave it out of the key
+        first = next(iter(signature.parameters), None)
+        receiver = first if first in ("self", "cls") else None
+        # Misses currently being computed, by key (singleflight)
+        inflight: dict[str, asyncio.Task] = {}
+
+        async def load(query_str: str, args: tuple, kwargs: dict) -> Any:
+            result = await func(*args, **kwargs)
+            await cache_client.set(prefix, query_str, None, result, ttl)
+            return result
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            query_str = f"{func.__name__}:{args}:{kwargs}"
-            params = {"args": str(args), "kwargs": str(kwargs)}
+            # Key on the bound arguments with defaults applied, so f(1) and
+            # f(x=1) share an entry; the arguments are serialized once here
+            # and passed as the query, leaving no params to encode again
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_arguments = bound.arguments
+            if receiver is not None:
+                key_arguments = {k: v for k, v in key_arguments.items() if k != receiver}
+            try:
+                arguments = _json_dumps(key_arguments, sort_keys=True)
+            except (TypeError, ValueError):
+                # No stable encoding (e.g. arbitrary objects): don't cache
+                logger.debug("cache_query_uncacheable", function=name)
+                return await func(*args, **kwargs)
+            query_str = f"{name}:{arguments.decode()}"
 
             # Try to get from cache
-            cached = await cache_client.get(prefix, query_str, params)
+            cached = await cache_client.get(prefix, query_str)
             if cached is not None:
                 return cached
 
-            # Execute function
-            result = await func(*args, **kwargs)
-
-            # Cache result
-            await cache_client.set(prefix, query_str, params, result, ttl)
+            # Execute and cache, unless a concurrent miss on the same key is
+            # already doing so; then share its result instead of re-querying
+            task = inflight.get(query_str)
+            if task is None:
+                task = asyncio.ensure_future(load(query_str, args, kwargs))
+                inflight[query_str] = task
+                task.add_done_callback(lambda _: inflight.pop(query_str, None))
 
-            return result
+            # Shielded so one caller being cancelled doesn't fail the others
+            return await asyncio.shield(task)
 
         return wrapper
 
@@ -6,11 +6,16 @@ Provides embedding storage and similarity search for papers:
 - Hybrid search combining vector similarity with graph filters
 """
 
+import asyncio
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import chromadb
+from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.config import Settings
 import structlog
 
@@ -21,11 +26,175 @@ logger = structlog.get_logger()
 # Default embedding model for sentence-transformers
 DEFAULT_EMBEDDING_MODEL = "all-mpnet-base-v2"
 
+# Dynamically quantized (int8, AVX512-VNNI) ONNX weights for CPU inference
+ONNX_QINT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+ONNX_QUANTIZATION_CONFIG = "avx512_vnni"
+
+# HNSW index defaults, tuned for 100k+ paper collections
+DEFAULT_HNSW_M = 24
+DEFAULT_HNSW_CONSTRUCTION_EF = 128
+DEFAULT_HNSW_SEARCH_EF = 100
+DEFAULT_HNSW_BATCH_SIZE = 10000
+DEFAULT_HNSW_SYNC_THRESHOLD = 20000
+
+# Query strings whose embeddings are kept per client
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# Embedding backends: "auto" and "torch" run PyTorch on the best device.
+# "onnx" (int8, CPU) is opt-in only: its vectors differ numerically from the
+# PyTorch ones, so it must not be mixed into collections built with PyTorch.
+EMBEDDING_BACKENDS = ("auto", "onnx", "torch")
+
 # ChromaDB collection names
 PAPERS_COLLECTION = "papers"
 CONCEPTS_COLLECTION = "concepts"
 
 
+class OnnxEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Sentence-transformers embedding function on ONNX Runtime int8 weights.
+
+    Loads the model once with the ONNX backend and the dynamically quantized
+    AVX512-VNNI weights. When the model repository does not ship them, they
+    are exported once into ``export_dir`` and loaded from there afterwards.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        export_dir: Path | None = None,
+        batch_size: int = 64,
+    ) -> None:
+        """Initialize the ONNX embedding function.
+
+        Args:
+            model_name: sentence-transformers model name
+            export_dir: Directory for a locally exported quantized model
+            batch_size: Encoding batch size
+        """
+        self.model_name = model_name
+        self.export_dir = export_dir
+        self.batch_size = batch_size
+        self.model = self._load_model()
+
+    def _load_model(self) -> Any:
+        """Load the quantized model, exporting it first if needed."""
+        from sentence_transformers import SentenceTransformer
+
+        model_kwargs = {"file_name": ONNX_QINT8_FILE, "provider": "CPUExecutionProvider"}
+
+        if self.export_dir is not None and (self.export_dir / ONNX_QINT8_FILE).exists():
+            return SentenceTransformer(
+                str(self.export_dir), backend="onnx", model_kwargs=model_kwargs
+            )
+
+        try:
+            return SentenceTransformer(
+                self.model_name, backend="onnx", model_kwargs=model_kwargs
+            )
+        except OSError:
+            if self.export_dir is None:
+                raise
+
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        model = SentenceTransformer(self.model_name, backend="onnx")
+        model.save_pretrained(str(self.export_dir))
+        export_dynamic_quantized_onnx_model(
+            model, ONNX_QUANTIZATION_CONFIG, str(self.export_dir)
+        )
+        logger.info("onnx_model_exported", model=self.model_name, path=str(self.export_dir))
+
+        return SentenceTransformer(
+            str(self.export_dir), backend="onnx", model_kwargs=model_kwargs
+        )
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """Embed documents.
+
+        Args:
+            input: Documents to embed
+
+        Returns:
+            One normalized embedding per document
+        """
+        return self.model.encode(
+            list(input),
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        ).tolist()
+
+
+_embedding_fn_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_embedding_fn(model_name: str, backend: str) -> Any:
+    """Load and warm up an embedding function (cached per process).
+
+    Args:
+        model_name: sentence-transformers model name
+        backend: "auto", "onnx" or "torch"
+
+    Returns:
+        Chroma-compatible embedding function
+    """
+    from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+    import torch
+
+    # Detect the best available device
+    if torch.cuda.is_available():
+        device = "cuda"
+    elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        try:
+            # Test if MPS actually works
+            torch.tensor([1.0], device="mps")
+            device = "mps"
+        except RuntimeError:
+            device = "cpu"
+    else:
+        device = "cpu"
+
+    embedding_fn: Any
+    if backend == "onnx":
+        # Explicitly requested, so a missing ONNX runtime is an error
+        export_dir = Path(os.getenv("CHROMA_ONNX_DIR", "data/onnx_models"))
+        embedding_fn = OnnxEmbeddingFunction(
+            model_name=model_name,
+            export_dir=export_dir / model_name.replace("/", "__"),
+        )
+        device = "cpu"
+    else:
+        embedding_fn = SentenceTransformerEmbeddingFunction(
+            model_name=model_name,
+            device=device,
+        )
+        backend = "torch"
+
+    # Warm up so the first real batch does not pay for kernel compilation
+    embedding_fn(["warmup"])
+    logger.info("embedding_fn_initialized", model=model_name, device=device, backend=backend)
+    return embedding_fn
+
+
+def _shared_embedding_fn(model_name: str, backend: str) -> Any:
+    """Get the process-wide embedding function, loading it at most once.
+
+    Every ChromaDBClient in the process shares the loaded model instead of
+    loading its own copy.
+
+    Args:
+        model_name: sentence-transformers model name
+        backend: "auto", "onnx" or "torch"
+
+    Returns:
+        Chroma-compatible embedding function
+    """
+    # lru_cache does not stop concurrent first calls from loading twice
+    with _embedding_fn_lock:
+        return _load_embedding_fn(model_name, backend)
+
+
 class ChromaDBClient:
     """ChromaDB client for vector storage and similarity search."""
 
@@ -33,60 +202,118 @@ class ChromaDBClient:
         self,
         persist_dir: Path | None = None,
         embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        embedding_backend: str | None = None,
+        hnsw_m: int = DEFAULT_HNSW_M,
+        hnsw_construction_ef: int = DEFAULT_HNSW_CONSTRUCTION_EF,
+        hnsw_search_ef: int = DEFAULT_HNSW_SEARCH_EF,
+        hnsw_batch_size: int = DEFAULT_HNSW_BATCH_SIZE,
+        hnsw_sync_threshold: int = DEFAULT_HNSW_SYNC_THRESHOLD,
+        host: str | None = None,
+        port: int | None = None,
     ) -> None:
         """Initialize ChromaDB client.
 
         Args:
             persist_dir: Directory for persistent storage (default: data/chroma)
             embedding_model: sentence-transformers model name
+            embedding_backend: "auto", "onnx" or "torch"
+                (default: CHROMA_EMBEDDING_BACKEND or "auto"). "auto" uses
+                PyTorch; pick "onnx" only for collections built with it
+            hnsw_m: HNSW graph degree (hnsw:M)
+            hnsw_construction_ef: HNSW build-time candidate list size
+            hnsw_search_ef: HNSW query-time candidate list size
+            hnsw_batch_size: Vectors buffered in memory before indexing
+            hnsw_sync_threshold: Vectors indexed before persisting to disk
+            host: Chroma server host; when set (or CHROMA_HOST), talk to a
+                Chroma server instead of an embedded persistent store
+            port: Chroma server port (default: CHROMA_PORT or 8000)
         """
         self.persist_dir = persist_dir or Path(
             os.getenv("CHROMA_PERSIST_DIR", "data/chroma")
         )
         self.persist_dir.mkdir(parents=True, exist_ok=True)
 
+        self.host = host or os.getenv("CHROMA_HOST")
+        self.port = port or int(os.getenv("CHROMA_PORT", "8000"))
+
         self.embedding_model = embedding_model
-        self._client: chromadb.PersistentClient | None = None
+        self.embedding_backend = embedding_backend or os.getenv(
+            "CHROMA_EMBEDDING_BACKEND", "auto"
+        )
+        if self.embedding_backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"Unknown embedding backend: {self.embedding_backend}")
+        self.hnsw_m = hnsw_m
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.hnsw_batch_size = hnsw_batch_size
+        self.hnsw_sync_threshold = hnsw_sync_threshold
+        self._client: Any = None
+        self._async_client: Any = None
+        self._async_papers_collection: Any = None
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
         self._embedding_fn: Any = None
         self._papers_collection: Any = None
         self._concepts_collection: Any = None
 
-    def _get_client(self) -> chromadb.PersistentClient:
-        """Get or create ChromaDB client."""
+    def _get_client(self) -> Any:
+        """Get or create ChromaDB client (embedded, or HTTP when a host is set)."""
         if self._client is None:
-            self._client = chromadb.PersistentClient(
-                path=str(self.persist_dir),
-                settings=Settings(anonymized_telemetry=False),
-            )
-            logger.info("chromadb_initialized", path=str(self.persist_dir))
+            if self.host:
+                self._client = chromadb.HttpClient(
+                    host=self.host,
+                    port=self.port,
+                    settings=Settings(anonymized_telemetry=False),
+                )
+                logger.info("chromadb_initialized", host=self.host, port=self.port)
+            else:
+                self._client = chromadb.PersistentClient(
+                    path=str(self.persist_dir),
+                    settings=Settings(anonymized_telemetry=False),
+                )
+                logger.info("chromadb_initialized", path=str(self.persist_dir))
         return self._client
 
+    async def _get_async_papers_collection(self) -> Any:
+        """Get or create the papers collection on the Chroma server (async API)."""
+        if self._async_papers_collection is None:
+            if not self.host:
+                raise RuntimeError("Async ChromaDB access requires a server host (CHROMA_HOST)")
+            if self._async_client is None:
+                self._async_client = await chromadb.AsyncHttpClient(
+                    host=self.host,
+                    port=self.port,
+                    settings=Settings(anonymized_telemetry=False),
+                )
+            # The first call loads the embedding model; keep that off the event loop
+            embedding_fn = await asyncio.to_thread(self._get_embedding_fn)
+            self._async_papers_collection = await self._async_client.get_or_create_collection(
+                name=PAPERS_COLLECTION,
+                embedding_function=embedding_fn,
+                metadata=self._collection_metadata(),
+            )
+            logger.info("papers_collection_ready", name=PAPERS_COLLECTION, mode="async")
+        return self._async_papers_collection
+
     def _get_embedding_fn(self) -> Any:
-        """Get or create embedding function."""
+        """Get the process-wide embedding function for this client's model."""
         if self._embedding_fn is None:
-            from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
-            import torch
-
-            # Detect the best available device
-            if torch.cuda.is_available():
-                device = "cuda"
-            elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                try:
-                    # Test if MPS actually works
-                    torch.tensor([1.0], device="mps")
-                    device = "mps"
-                except RuntimeError:
-                    device = "cpu"
-            else:
-                device = "cpu"
-
-            self._embedding_fn = SentenceTransformerEmbeddingFunction(
-                model_name=self.embedding_model,
-                device=device,
+            self._embedding_fn = _shared_embedding_fn(
+                self.embedding_model, self.embedding_backend
             )
-            logger.info("embedding_fn_initialized", model=self.embedding_model, device=device)
         return self._embedding_fn
 
+    def _collection_metadata(self) -> dict[str, Any]:
+        """Build collection metadata with the HNSW index parameters."""
+        return {
+            "hnsw:space": "cosine",
+            "hnsw:M": self.hnsw_m,
+            "hnsw:construction_ef": self.hnsw_construction_ef,
+            "hnsw:search_ef": self.hnsw_search_ef,
+            "hnsw:batch_size": self.hnsw_batch_size,
+            "hnsw:sync_threshold": self.hnsw_sync_threshold,
+        }
+
     def _get_papers_collection(self) -> Any:
         """Get or create papers collection."""
         if self._papers_collection is None:
@@ -94,7 +321,7 @@ class ChromaDBClient:
             self._papers_collection = client.get_or_create_collection(
                 name=PAPERS_COLLECTION,
                 embedding_function=self._get_embedding_fn(),
-                metadata={"hnsw:space": "cosine"},
+                metadata=self._collection_metadata(),
             )
             logger.info("papers_collection_ready", name=PAPERS_COLLECTION)
         return self._papers_collection
@@ -106,11 +333,91 @@ class ChromaDBClient:
             self._concepts_collection = client.get_or_create_collection(
                 name=CONCEPTS_COLLECTION,
                 embedding_function=self._get_embedding_fn(),
-                metadata={"hnsw:space": "cosine"},
+                metadata=self._collection_metadata(),
             )
             logger.info("concepts_collection_ready", name=CONCEPTS_COLLECTION)
         return self._concepts_collection
 
+    @staticmethod
+    def _paper_document(paper: ParsedPaper) -> str:
+        """Build the embedded text for a paper (title + abstract)."""
+        return f"{paper.title}\n\n{paper.abstract}"
+
+    @staticmethod
+    def _paper_metadata(paper: ParsedPaper) -> dict[str, Any]:
+        """Build the stored metadata for a paper."""
+        return {
+            "title": paper.title,
+            "primary_category": paper.categories[0] if paper.categories else "",
+            "author_count": len(paper.authors),
+            "equation_count": len(paper.equations),
+            "citation_count": len(paper.citations),
+        }
+
+    def _embed(self, documents: list[str]) -> list[list[float]]:
+        """Embed documents with the collection's embedding function.
+
+        Args:
+            documents: Texts to embed
+
+        Returns:
+            One embedding per document as plain lists
+        """
+        embeddings = self._get_embedding_fn()(documents)
+        if hasattr(embeddings, "tolist"):
+            return embeddings.tolist()
+        return [e.tolist() if hasattr(e, "tolist") else list(e) for e in embeddings]
+
+    def tune_search_ef(self, ef: int) -> None:
+        """Retune query-time HNSW search ef without rebuilding the index.
+
+        Higher values trade query latency for recall.
+
+        Args:
+            ef: New hnsw:search_ef for both collections
+        """
+        self.hnsw_search_ef = ef
+
+        # Collection.modify rejects metadata carrying hnsw:space and replaces
+        # the whole dict, so re-apply the full metadata via get_or_create.
+        self._papers_collection = None
+        self._concepts_collection = None
+        self._get_papers_collection()
+        self._get_concepts_collection()
+        logger.info("hnsw_search_ef_tuned", ef=ef)
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed search queries, reusing embeddings of recently seen queries.
+
+        Uncached queries are embedded together in one call; the cache keeps
+        the QUERY_EMBEDDING_CACHE_SIZE most recently used query strings.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            One embedding per query, in query order
+        """
+        found: dict[str, list[float]] = {}
+        missing: list[str] = []
+        with self._query_embeddings_lock:
+            for query in dict.fromkeys(queries):
+                if query in self._query_embeddings:
+                    self._query_embeddings.move_to_end(query)
+                    found[query] = self._query_embeddings[query]
+                else:
+                    missing.append(query)
+
+        if missing:
+            embedded = dict(zip(missing, self._embed(missing), strict=True))
+            found.update(embedded)
+            with self._query_embeddings_lock:
+                self._query_embeddings.update(embedded)
+                while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                    self._query_embeddings.popitem(last=False)
+
+        return [found[query] for query in queries]
+
     def add_paper(self, paper: ParsedPaper) -> None:
         """Add a paper to the vector store.
 
@@ -121,29 +428,25 @@ class ChromaDBClient:
         """
         collection = self._get_papers_collection()
 
-        # Combine title and abstract for embedding
-        text = f"{paper.title}\n\n{paper.abstract}"
+        documents = [self._paper_document(paper)]
 
         collection.upsert(
             ids=[paper.arxiv_id],
-            documents=[text],
-            metadatas=[
-                {
-                    "title": paper.title,
-                    "primary_category": paper.categories[0] if paper.categories else "",
-                    "author_count": len(paper.authors),
-                    "equation_count": len(paper.equations),
-                    "citation_count": len(paper.citations),
-                }
-            ],
+            documents=documents,
+            embeddings=self._embed(documents),
+            metadatas=[self._paper_metadata(paper)],
         )
         logger.debug("paper_embedded", arxiv_id=paper.arxiv_id)
 
-    def add_papers_batch(self, papers: list[ParsedPaper]) -> int:
+    def add_papers_batch(self, papers: list[ParsedPaper], batch_size: int = 256) -> int:
         """Add multiple papers to the vector store.
 
+        Papers are embedded in one encode call per sub-batch and upserted
+        with precomputed embeddings; sub-batching caps peak memory.
+
         Args:
             papers: List of parsed papers
+            batch_size: Papers embedded and upserted per sub-batch
 
         Returns:
             Number of papers added
@@ -153,28 +456,113 @@ class ChromaDBClient:
 
         collection = self._get_papers_collection()
 
-        ids = [p.arxiv_id for p in papers]
-        documents = [f"{p.title}\n\n{p.abstract}" for p in papers]
-        metadatas = [
-            {
-                "title": p.title,
-                "primary_category": p.categories[0] if p.categories else "",
-                "author_count": len(p.authors),
-                "equation_count": len(p.equations),
-                "citation_count": len(p.citations),
-            }
-            for p in papers
-        ]
+        for start in range(0, len(papers), batch_size):
+            batch = papers[start : start + batch_size]
+            documents = [self._paper_document(p) for p in batch]
+            collection.upsert(
+                ids=[p.arxiv_id for p in batch],
+                documents=documents,
+                embeddings=self._embed(documents),
+                metadatas=[self._paper_metadata(p) for p in batch],
+            )
 
-        collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
         logger.info("papers_batch_embedded", count=len(papers))
         return len(papers)
 
+    async def add_papers_batch_async(
+        self,
+        papers: list[ParsedPaper],
+        batch_size: int = 256,
+    ) -> int:
+        """Add multiple papers through a Chroma server without blocking on indexing.
+
+        Embeds each sub-batch in a worker thread while the previous
+        sub-batch's upsert is still being indexed by the server.
+
+        Args:
+            papers: List of parsed papers
+            batch_size: Papers embedded and upserted per sub-batch
+
+        Returns:
+            Number of papers added
+        """
+        if not papers:
+            return 0
+
+        collection = await self._get_async_papers_collection()
+
+        pending: asyncio.Task[None] | None = None
+        try:
+            for start in range(0, len(papers), batch_size):
+                batch = papers[start : start + batch_size]
+                documents = [self._paper_document(p) for p in batch]
+                embeddings = await asyncio.to_thread(self._embed, documents)
+
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(
+                    collection.upsert(
+                        ids=[p.arxiv_id for p in batch],
+                        documents=documents,
+                        embeddings=embeddings,
+                        metadatas=[self._paper_metadata(p) for p in batch],
+                    )
+                )
+
+            if pending is not None:
+                await pending
+        finally:
+            # Embedding failed or we were cancelled: don't leave an upsert orphaned
+            if pending is not None and not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+        logger.info("papers_batch_embedded", count=len(papers), mode="async")
+        return len(papers)
+
+    @staticmethod
+    def _query_rows(
+        results: dict[str, Any],
+        index: int,
+        exclude_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Convert one query's results from a (batched) Chroma query to dicts.
+
+        Args:
+            results: Raw collection.query() results
+            index: Position of the query within the batch
+            exclude_id: Paper ID to leave out (the query paper itself)
+
+        Returns:
+            List of papers with distance, similarity, metadata and document
+        """
+        ids = results["ids"][index] if results["ids"] else []
+        distances = results["distances"][index] if results.get("distances") else None
+        metadatas = results["metadatas"][index] if results.get("metadatas") else None
+        documents = results["documents"][index] if results.get("documents") else None
+
+        papers = []
+        for i, arxiv_id in enumerate(ids):
+            if arxiv_id == exclude_id:
+                continue
+            paper = {
+                "arxiv_id": arxiv_id,
+                "distance": distances[i] if distances else None,
+                "similarity": 1 - distances[i] if distances else None,
+            }
+            if metadatas:
+                paper.update(metadatas[i])
+            if documents:
+                paper["document"] = documents[i]
+            papers.append(paper)
+        return papers
+
     def search_papers(
         self,
         query: str,
         n_results: int = 10,
         category_filter: str | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for similar papers.
 
@@ -182,10 +570,42 @@ class ChromaDBClient:
             query: Natural language search query
             n_results: Maximum results to return
             category_filter: Optional category to filter by
+            query_embedding: Precomputed embedding of the query
 
         Returns:
             List of matching papers with similarity scores
         """
+        papers = self.search_papers_batch(
+            [query],
+            n_results=n_results,
+            category_filter=category_filter,
+            query_embeddings=[query_embedding] if query_embedding is not None else None,
+        )[0]
+        logger.debug("search_complete", query=query[:50], results=len(papers))
+        return papers
+
+    def search_papers_batch(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        category_filter: str | None = None,
+        query_embeddings: list[list[float]] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search for similar papers for several queries in one Chroma call.
+
+        Args:
+            queries: Natural language search queries
+            n_results: Maximum results to return per query
+            category_filter: Optional category to filter by
+            query_embeddings: Precomputed query embeddings (default: embed
+                the queries, reusing cached embeddings)
+
+        Returns:
+            One list of matching papers per query, in query order
+        """
+        if not queries:
+            return []
+
         collection = self._get_papers_collection()
 
         where = None
@@ -193,28 +613,13 @@ class ChromaDBClient:
             where = {"primary_category": category_filter}
 
         results = collection.query(
-            query_texts=[query],
+            query_embeddings=query_embeddings or self._embed_queries(queries),
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
         )
 
-        papers = []
-        if results["ids"] and results["ids"][0]:
-            for i, arxiv_id in enumerate(results["ids"][0]):
-                paper = {
-                    "arxiv_id": arxiv_id,
-                    "distance": results["distances"][0][i] if results["distances"] else None,
-                    "similarity": 1 - results["distances"][0][i] if results["distances"] else None,
-                }
-                if results["metadatas"] and results["metadatas"][0]:
-                    paper.update(results["metadatas"][0][i])
-                if results["documents"] and results["documents"][0]:
-                    paper["document"] = results["documents"][0][i]
-                papers.append(paper)
-
-        logger.debug("search_complete", query=query[:50], results=len(papers))
-        return papers
+        return [self._query_rows(results, i) for i in range(len(queries))]
 
     def get_similar_papers(
         self,
@@ -230,39 +635,55 @@ class ChromaDBClient:
         Returns:
             List of similar papers with scores
         """
-        collection = self._get_papers_collection()
-
-        # Get the paper's embedding
-        result = collection.get(ids=[arxiv_id], include=["embeddings"])
-
-        if not result["embeddings"] or not result["embeddings"][0]:
+        similar = self.get_similar_papers_batch([arxiv_id], n_results=n_results)
+        if arxiv_id not in similar:
             logger.warning("paper_not_found", arxiv_id=arxiv_id)
             return []
+        return similar[arxiv_id]
+
+    def get_similar_papers_batch(
+        self,
+        arxiv_ids: list[str],
+        n_results: int = 10,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Find papers similar to each of several papers.
 
-        embedding = result["embeddings"][0]
+        Fetches the stored embeddings with one get() and runs one batched
+        query() for all of them.
 
-        # Query with the embedding
+        Args:
+            arxiv_ids: The reference papers' IDs
+            n_results: Maximum results to return per paper
+
+        Returns:
+            Dict of reference paper ID to its similar papers; IDs without a
+            stored embedding are omitted
+        """
+        if not arxiv_ids:
+            return {}
+
+        collection = self._get_papers_collection()
+
+        # Get the papers' embeddings (order of the returned ids is not guaranteed)
+        result = collection.get(ids=arxiv_ids, include=["embeddings"])
+        embeddings = result["embeddings"]
+        if embeddings is None or len(embeddings) == 0:
+            return {}
+
+        found_ids = list(result["ids"])
+
+        # Query with all embeddings at once
         results = collection.query(
-            query_embeddings=[embedding],
+            query_embeddings=[e.tolist() if hasattr(e, "tolist") else e for e in embeddings],
             n_results=n_results + 1,  # Include self
             include=["metadatas", "distances"],
         )
 
-        # Filter out the query paper itself
-        papers = []
-        if results["ids"] and results["ids"][0]:
-            for i, result_id in enumerate(results["ids"][0]):
-                if result_id != arxiv_id:
-                    paper = {
-                        "arxiv_id": result_id,
-                        "distance": results["distances"][0][i] if results["distances"] else None,
-                        "similarity": 1 - results["distances"][0][i] if results["distances"] else None,
-                    }
-                    if results["metadatas"] and results["metadatas"][0]:
-                        paper.update(results["metadatas"][0][i])
-                    papers.append(paper)
-
-        return papers[:n_results]
+        # Filter out each query paper itself
+        return {
+            found_id: self._query_rows(results, i, exclude_id=found_id)[:n_results]
+            for i, found_id in enumerate(found_ids)
+        }
 
     def get_stats(self) -> dict[str, int]:
         """Get collection statistics.
@@ -327,7 +748,7 @@ class ChromaDBClient:
             where = {"primary_category": category_filter}
 
         results = collection.query(
-            query_texts=[query_text],
+            query_embeddings=self._embed_queries([query_text]),
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
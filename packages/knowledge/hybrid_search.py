@@ -3,6 +3,9 @@
 Provides unified search that leverages both:
 - ChromaDB semantic similarity for relevance ranking
 - Neo4j graph structure for relationship-based filtering and expansion
+
+Queries reuse the long-lived ``neo4j_client`` driver, which connects lazily
+on first use and is closed once at process shutdown.
 """
 
 import asyncio
@@ -15,6 +18,9 @@ from packages.knowledge.neo4j_client import neo4j_client
 
 logger = structlog.get_logger()
 
+# Isolated papers analyzed per find_structural_holes call
+MAX_GAP_ANALYSIS = 10
+
 
 async def hybrid_search(
     query: str,
@@ -38,8 +44,9 @@ async def hybrid_search(
     Returns:
         List of papers with combined scores and metadata
     """
-    # Get vector search results
-    vector_results = chromadb_client.search_papers(
+    # Get vector search results (blocking Chroma call off the event loop)
+    vector_results = await asyncio.to_thread(
+        chromadb_client.search_papers,
         query,
         n_results=n_results * 2 if expand_citations else n_results,
         category_filter=category_filter,
@@ -56,17 +63,16 @@ async def hybrid_search(
 
     arxiv_ids = [r["arxiv_id"] for r in vector_results]
 
-    # Enrich with graph data
-    await neo4j_client.connect()
-    try:
+    # Enrich with graph data, expanding citations concurrently
+    if expand_citations:
+        enriched_results, expansion = await asyncio.gather(
+            _enrich_with_graph_data(arxiv_ids, vector_results),
+            _expand_citations(arxiv_ids, n_results - len(arxiv_ids)),
+        )
+        enriched_results.extend(expansion)
+    else:
         enriched_results = await _enrich_with_graph_data(arxiv_ids, vector_results)
 
-        if expand_citations:
-            enriched_results = await _expand_citations(enriched_results, n_results)
-
-    finally:
-        await neo4j_client.close()
-
     # Sort by combined score and limit
     enriched_results.sort(key=lambda x: x.get("combined_score", 0), reverse=True)
     return enriched_results[:n_results]
@@ -77,17 +83,17 @@ async def _enrich_with_graph_data(
     vector_results: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     """Add graph metadata to vector search results."""
+    # CITES/AUTHORED edges are MERGEd, so per-paper degrees equal the
+    # distinct counts; COUNT {} on a bare relationship type is planned as a
+    # GetDegree read instead of expanding the citation neighbourhoods.
     query = """
     UNWIND $ids AS id
     OPTIONAL MATCH (p:Paper {arxiv_id: id})
-    OPTIONAL MATCH (a:Author)-[:AUTHORED]->(p)
-    OPTIONAL MATCH (p)-[:CITES]->(cited:Paper)
-    OPTIONAL MATCH (citing:Paper)-[:CITES]->(p)
     RETURN id,
            p.title AS title,
-           collect(DISTINCT a.name) AS authors,
-           count(DISTINCT cited) AS outgoing_citations,
-           count(DISTINCT citing) AS incoming_citations
+           [(a:Author)-[:AUTHORED]->(p) | a.name] AS authors,
+           COUNT { (p)-[:CITES]->() } AS outgoing_citations,
+           COUNT { ()-[:CITES]->(p) } AS incoming_citations
     """
 
     async with neo4j_client.session() as session:
@@ -105,8 +111,8 @@ async def _enrich_with_graph_data(
 
         combined = {
             **vr,
-            "authors": gd.get("authors", []),
-            "outgoing_citations": gd.get("outgoing_citations", 0),
+            "authors": gd.get("authors") or [],
+            "outgoing_citations": gd.get("outgoing_citations") or 0,
             "incoming_citations": gd.get("incoming_citations", 0),
             "in_graph": gd.get("title") is not None,
         }
@@ -122,11 +128,12 @@ async def _enrich_with_graph_data(
 
 
 async def _expand_citations(
-    results: list[dict[str, Any]],
-    max_total: int,
+    arxiv_ids: list[str],
+    limit: int,
 ) -> list[dict[str, Any]]:
-    """Expand results with highly-cited related papers."""
-    arxiv_ids = [r["arxiv_id"] for r in results]
+    """Find highly-connected papers related to the matches."""
+    if limit <= 0:
+        return []
 
     query = """
     MATCH (p:Paper)-[:CITES]-(related:Paper)
@@ -143,22 +150,22 @@ async def _expand_citations(
     async with neo4j_client.session() as session:
         result = await session.run(
             query,
-            {"ids": arxiv_ids, "limit": max_total - len(results)},
+            {"ids": arxiv_ids, "limit": limit},
         )
         records = await result.data()
 
-    # Add related papers with lower scores
-    for record in records:
-        results.append({
+    # Related papers get lower scores
+    return [
+        {
             "arxiv_id": record["arxiv_id"],
             "title": record.get("title", ""),
             "similarity": 0,
             "combined_score": 0.3 + min(0.2, record["connection_count"] * 0.05),
             "source": "citation_expansion",
             "connection_count": record["connection_count"],
-        })
-
-    return results
+        }
+        for record in records
+    ]
 
 
 async def find_research_path(
@@ -185,22 +192,17 @@ async def find_research_path(
            paper.title AS title
     """
 
-    await neo4j_client.connect()
-    try:
-        async with neo4j_client.session() as session:
-            result = await session.run(
-                query,
-                {"start_id": start_arxiv_id, "end_id": end_arxiv_id, "max_hops": max_hops},
-            )
-            records = await result.data()
-
-        if not records:
-            return None
+    async with neo4j_client.session() as session:
+        result = await session.run(
+            query,
+            {"start_id": start_arxiv_id, "end_id": end_arxiv_id, "max_hops": max_hops},
+        )
+        records = await result.data()
 
-        return [{"arxiv_id": r["arxiv_id"], "title": r["title"]} for r in records]
+    if not records:
+        return None
 
-    finally:
-        await neo4j_client.close()
+    return [{"arxiv_id": r["arxiv_id"], "title": r["title"]} for r in records]
 
 
 async def find_structural_holes(
@@ -219,42 +221,38 @@ async def find_structural_holes(
     Returns:
         List of potential research gaps with suggested connections
     """
+    # Only the first MAX_GAP_ANALYSIS papers are analyzed, so stream at most
+    # that many rows (or min_cluster_size, to check the cluster threshold)
     query = """
     MATCH (p:Paper)-[:BELONGS_TO]->(:Category {id: $category})
     WHERE NOT exists((p)-[:CITES]-())
-    WITH collect(p) AS isolated_papers
-    WHERE size(isolated_papers) >= $min_size
-    RETURN [paper IN isolated_papers | {
-        arxiv_id: paper.arxiv_id,
-        title: paper.title
-    }] AS papers
+    WITH p LIMIT $limit
+    RETURN p.arxiv_id AS arxiv_id, p.title AS title
     """
 
-    await neo4j_client.connect()
-    try:
-        async with neo4j_client.session() as session:
-            result = await session.run(
-                query,
-                {"category": category, "min_size": min_cluster_size},
-            )
-            record = await result.single()
-
-        if not record:
-            return []
-
-        papers = record["papers"]
-
-        # For each isolated paper, find semantically similar papers it could cite
-        gaps = []
-        for paper in papers[:10]:  # Limit analysis
-            similar = chromadb_client.get_similar_papers(paper["arxiv_id"], n_results=3)
-            if similar:
-                gaps.append({
-                    "isolated_paper": paper,
-                    "potential_connections": similar,
-                })
-
-        return gaps
-
-    finally:
-        await neo4j_client.close()
+    async with neo4j_client.session() as session:
+        result = await session.run(
+            query,
+            {"category": category, "limit": max(MAX_GAP_ANALYSIS, min_cluster_size)},
+        )
+        papers = await result.data()
+
+    if len(papers) < min_cluster_size:
+        return []
+
+    # For each isolated paper, find semantically similar papers it could cite
+    papers = papers[:MAX_GAP_ANALYSIS]
+    similar_by_id = await asyncio.to_thread(
+        chromadb_client.get_similar_papers_batch,
+        [paper["arxiv_id"] for paper in papers],
+        n_results=3,
+    )
+
+    return [
+        {
+            "isolated_paper": paper,
+            "potential_connections": similar_by_id[paper["arxiv_id"]],
+        }
+        for paper in papers
+        if similar_by_id.get(paper["arxiv_id"])
+    ]
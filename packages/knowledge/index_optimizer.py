@@ -2,9 +2,13 @@
 
 Provides tools for creating, managing, and optimizing Neo4j indexes
 for improved query performance.
+
+Queries use the shared long-lived ``neo4j_client`` driver; the optimizer never
+closes it, since other callers (e.g. hybrid search) may have sessions open.
 """
 
 import asyncio
+import re
 from typing import Any
 
 import structlog
@@ -13,6 +17,19 @@ from packages.knowledge.neo4j_client import neo4j_client
 
 logger = structlog.get_logger()
 
+# Maximum number of query plans remembered by analyze_query_performance
+PLAN_CACHE_SIZE = 256
+
+# Plan operators worth flagging, with the suggestion for each
+_PLAN_OPERATOR_RE = re.compile(r"NodeByLabelScan|CartesianProduct|Eager")
+_PLAN_SUGGESTIONS = {
+    "NodeByLabelScan": "Consider adding an index on frequently filtered properties",
+    "CartesianProduct": (
+        "Query contains cartesian product - consider adding relationship constraints"
+    ),
+    "Eager": "Query contains eager operations - may impact memory usage",
+}
+
 
 class IndexOptimizer:
     """Utility for optimizing Neo4j indexes."""
@@ -20,6 +37,7 @@ class IndexOptimizer:
     def __init__(self) -> None:
         """Initialize index optimizer."""
         self.client = neo4j_client
+        self._plan_suggestions: dict[str, list[str]] = {}
 
     async def create_recommended_indexes(self) -> dict[str, list[str]]:
         """Create all recommended indexes for optimal query performance.
@@ -27,67 +45,61 @@ class IndexOptimizer:
         Returns:
             Dictionary with created indexes by type
         """
-        await self.client.connect()
-
-        try:
-            created_indexes = {
-                "single_property": [],
-                "composite": [],
-                "fulltext": [],
-            }
-
-            # Single property indexes
-            single_indexes = [
-                ("Paper", "arxiv_id"),
-                ("Paper", "published_date"),
-                ("Paper", "s2_id"),
-                ("Author", "name"),
-                ("Category", "id"),
-                ("Concept", "name"),
-                ("Concept", "type"),
-            ]
-
-            for label, property in single_indexes:
-                try:
-                    await self._create_index(label, [property])
-                    created_indexes["single_property"].append(f"{label}.{property}")
-                    logger.info("index_created", label=label, property=property)
-                except Exception as e:
-                    logger.warning("index_creation_failed", label=label, property=property, error=str(e))
+        created_indexes = {
+            "single_property": [],
+            "composite": [],
+            "fulltext": [],
+        }
+
+        # Single property indexes
+        single_indexes = [
+            ("Paper", "arxiv_id"),
+            ("Paper", "published_date"),
+            ("Paper", "s2_id"),
+            ("Author", "name"),
+            ("Category", "id"),
+            ("Concept", "name"),
+            ("Concept", "type"),
+        ]
 
-            # Composite indexes for common query patterns
-            composite_indexes = [
-                ("Paper", ["primary_category", "published_date"]),
-                ("Paper", ["primary_category", "arxiv_id"]),
-                ("CITES", ["intent", "position"]),
-            ]
+        for label, property in single_indexes:
+            try:
+                await self._create_index(label, [property])
+                created_indexes["single_property"].append(f"{label}.{property}")
+                logger.info("index_created", label=label, property=property)
+            except Exception as e:
+                logger.warning("index_creation_failed", label=label, property=property, error=str(e))
 
-            for label, properties in composite_indexes:
-                try:
-                    await self._create_composite_index(label, properties)
-                    created_indexes["composite"].append(f"{label}.{'+'.join(properties)}")
-                    logger.info("composite_index_created", label=label, properties=properties)
-                except Exception as e:
-                    logger.warning("composite_index_failed", label=label, properties=properties, error=str(e))
+        # Composite indexes for common query patterns
+        composite_indexes = [
+            ("Paper", ["primary_category", "published_date"]),
+            ("Paper", ["primary_category", "arxiv_id"]),
+            ("CITES", ["intent", "position"]),
+        ]
 
-            # Full-text search indexes
-            fulltext_indexes = [
-                ("papers_fulltext", ["Paper"], ["title", "abstract", "full_text"]),
-                ("concepts_fulltext", ["Concept"], ["name"]),
-            ]
+        for label, properties in composite_indexes:
+            try:
+                await self._create_composite_index(label, properties)
+                created_indexes["composite"].append(f"{label}.{'+'.join(properties)}")
+                logger.info("composite_index_created", label=label, properties=properties)
+            except Exception as e:
+                logger.warning("composite_index_failed", label=label, properties=properties, error=str(e))
 
-            for name, labels, properties in fulltext_indexes:
-                try:
-                    await self._create_fulltext_index(name, labels, properties)
-                    created_indexes["fulltext"].append(name)
-                    logger.info("fulltext_index_created", name=name)
-                except Exception as e:
-                    logger.warning("fulltext_index_failed", name=name, error=str(e))
+        # Full-text search indexes
+        fulltext_indexes = [
+            ("papers_fulltext", ["Paper"], ["title", "abstract", "full_text"]),
+            ("concepts_fulltext", ["Concept"], ["name"]),
+        ]
 
-            return created_indexes
+        for name, labels, properties in fulltext_indexes:
+            try:
+                await self._create_fulltext_index(name, labels, properties)
+                created_indexes["fulltext"].append(name)
+                logger.info("fulltext_index_created", name=name)
+            except Exception as e:
+                logger.warning("fulltext_index_failed", name=name, error=str(e))
 
-        finally:
-            await self.client.close()
+        return created_indexes
 
     async def _create_index(self, label: str, properties: list[str]) -> None:
         """Create a single or composite property index."""
@@ -132,29 +144,23 @@ class IndexOptimizer:
         Returns:
             List of index information dictionaries
         """
-        await self.client.connect()
-
-        try:
-            query = "SHOW INDEXES"
+        query = "SHOW INDEXES"
 
-            async with self.client.session() as session:
-                result = await session.run(query)
-                records = await result.data()
-
-            return [
-                {
-                    "name": r.get("name"),
-                    "type": r.get("type"),
-                    "labels": r.get("labelsOrTypes", []),
-                    "properties": r.get("properties", []),
-                    "state": r.get("state"),
-                    "population_percent": r.get("populationPercent", 0),
-                }
-                for r in records
-            ]
+        async with self.client.session() as session:
+            result = await session.run(query)
+            records = await result.data()
 
-        finally:
-            await self.client.close()
+        return [
+            {
+                "name": r.get("name"),
+                "type": r.get("type"),
+                "labels": r.get("labelsOrTypes", []),
+                "properties": r.get("properties", []),
+                "state": r.get("state"),
+                "population_percent": r.get("populationPercent", 0),
+            }
+            for r in records
+        ]
 
     async def analyze_query_performance(
         self,
@@ -170,45 +176,70 @@ class IndexOptimizer:
         Returns:
             Performance analysis with suggestions
         """
-        await self.client.connect()
-
-        try:
+        # Plans depend on the query text, not on parameter values
+        suggestions = self._plan_suggestions.get(query)
+        if suggestions is None:
             # Get query plan
             explain_query = f"EXPLAIN {query}"
 
             async with self.client.session() as session:
                 result = await session.run(explain_query, params or {})
-                plan = await result.consume()
+                summary = await result.consume()
 
-            # Analyze plan for optimization opportunities
-            analysis = {
-                "query": query,
-                "db_hits": getattr(plan.result_consumed_after, "db_hits", 0),
-                "suggestions": [],
-            }
+            # Analyze plan operators for optimization opportunities
+            operators = set(_PLAN_OPERATOR_RE.findall(str(summary.plan)))
+            suggestions = [
+                text for operator, text in _PLAN_SUGGESTIONS.items() if operator in operators
+            ]
 
-            # Check for missing indexes
-            if "NodeByLabelScan" in str(plan):
-                analysis["suggestions"].append(
-                    "Consider adding an index on frequently filtered properties"
-                )
+            if len(self._plan_suggestions) >= PLAN_CACHE_SIZE:
+                self._plan_suggestions.pop(next(iter(self._plan_suggestions)))
+            self._plan_suggestions[query] = suggestions
 
-            # Check for cartesian products
-            if "CartesianProduct" in str(plan):
-                analysis["suggestions"].append(
-                    "Query contains cartesian product - consider adding relationship constraints"
-                )
+        return {
+            "query": query,
+            "db_hits": 0,  # EXPLAIN plans are not executed
+            "suggestions": list(suggestions),
+        }
 
-            # Check for eager operations
-            if "Eager" in str(plan):
-                analysis["suggestions"].append(
-                    "Query contains eager operations - may impact memory usage"
-                )
+    async def has_paper_arxiv_id_index(self) -> bool:
+        """Check whether Paper.arxiv_id lookups are backed by an index.
+
+        Any non-failed index (including a uniqueness constraint's) whose
+        leading property is Paper.arxiv_id counts.
+
+        Returns:
+            True if such an index exists
+        """
+        indexes = await self.list_indexes()
+        return any(
+            index["labels"] == ["Paper"]
+            and (index["properties"] or [])[:1] == ["arxiv_id"]
+            and index["state"] != "FAILED"
+            for index in indexes
+        )
+
+    async def ensure_paper_arxiv_id_index(self) -> bool:
+        """Make sure Paper.arxiv_id is indexed, creating indexes if needed.
+
+        Hybrid search enrichment matches papers by arxiv_id for every
+        result; without an index each lookup is a NodeByLabelScan.
+
+        Returns:
+            True if the index is present afterwards
+        """
+        if await self.has_paper_arxiv_id_index():
+            return True
 
-            return analysis
+        await self.create_recommended_indexes()
+        if await self.has_paper_arxiv_id_index():
+            return True
 
-        finally:
-            await self.client.close()
+        logger.warning(
+            "paper_arxiv_id_index_missing",
+            detail="Paper lookups by arxiv_id will fall back to label scans",
+        )
+        return False
 
     async def optimize_database(self) -> dict[str, Any]:
         """Run comprehensive database optimization.
@@ -216,37 +247,31 @@ class IndexOptimizer:
         Returns:
             Optimization results
         """
-        await self.client.connect()
+        results = {
+            "indexes_created": await self.create_recommended_indexes(),
+            "statistics_analyzed": False,
+            "constraints_verified": False,
+        }
 
+        # Analyze database statistics
         try:
-            results = {
-                "indexes_created": await self.create_recommended_indexes(),
-                "statistics_analyzed": False,
-                "constraints_verified": False,
-            }
-
-            # Analyze database statistics
-            try:
-                async with self.client.session() as session:
-                    await session.run("CALL db.stats.retrieve('GRAPH COUNTS')")
-                results["statistics_analyzed"] = True
-                logger.info("database_statistics_analyzed")
-            except Exception as e:
-                logger.warning("statistics_analysis_failed", error=str(e))
-
-            # Verify constraints
-            try:
-                constraints = await self._list_constraints()
-                results["constraints_verified"] = True
-                results["constraints_count"] = len(constraints)
-                logger.info("constraints_verified", count=len(constraints))
-            except Exception as e:
-                logger.warning("constraint_verification_failed", error=str(e))
+            async with self.client.session() as session:
+                await session.run("CALL db.stats.retrieve('GRAPH COUNTS')")
+            results["statistics_analyzed"] = True
+            logger.info("database_statistics_analyzed")
+        except Exception as e:
+            logger.warning("statistics_analysis_failed", error=str(e))
 
-            return results
+        # Verify constraints
+        try:
+            constraints = await self._list_constraints()
+            results["constraints_verified"] = True
+            results["constraints_count"] = len(constraints)
+            logger.info("constraints_verified", count=len(constraints))
+        except Exception as e:
+            logger.warning("constraint_verification_failed", error=str(e))
 
-        finally:
-            await self.client.close()
+        return results
 
     async def _list_constraints(self) -> list[dict[str, Any]]:
         """List all database constraints."""
@@ -275,42 +300,36 @@ class IndexOptimizer:
         Returns:
             List of dropped (or would-be-dropped) index names
         """
-        await self.client.connect()
+        # Get index usage statistics
+        query = """
+        CALL db.stats.retrieve('INDEX USAGE')
+        YIELD data
+        RETURN data
+        """
 
-        try:
-            # Get index usage statistics
-            query = """
-            CALL db.stats.retrieve('INDEX USAGE')
-            YIELD data
-            RETURN data
-            """
+        async with self.client.session() as session:
+            result = await session.run(query)
+            records = await result.data()
 
-            async with self.client.session() as session:
-                result = await session.run(query)
-                records = await result.data()
-
-            # Find unused indexes
-            unused_indexes = []
-            for record in records:
-                data = record.get("data", {})
-                if data.get("usageCount", 0) == 0:
-                    index_name = data.get("indexName")
-                    if index_name and not index_name.startswith("__"):
-                        unused_indexes.append(index_name)
-
-            if not dry_run and unused_indexes:
-                for index_name in unused_indexes:
-                    try:
-                        async with self.client.session() as session:
-                            await session.run(f"DROP INDEX {index_name}")
-                        logger.info("index_dropped", name=index_name)
-                    except Exception as e:
-                        logger.warning("index_drop_failed", name=index_name, error=str(e))
-
-            return unused_indexes
-
-        finally:
-            await self.client.close()
+        # Find unused indexes
+        unused_indexes = []
+        for record in records:
+            data = record.get("data", {})
+            if data.get("usageCount", 0) == 0:
+                index_name = data.get("indexName")
+                if index_name and not index_name.startswith("__"):
+                    unused_indexes.append(index_name)
+
+        if not dry_run and unused_indexes:
+            for index_name in unused_indexes:
+                try:
+                    async with self.client.session() as session:
+                        await session.run(f"DROP INDEX {index_name}")
+                    logger.info("index_dropped", name=index_name)
+                except Exception as e:
+                    logger.warning("index_drop_failed", name=index_name, error=str(e))
+
+        return unused_indexes
 
 
 # Global optimizer instance
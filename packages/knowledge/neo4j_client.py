@@ -7,6 +7,7 @@ Provides async Neo4j operations for the arxiv-cosci knowledge graph:
 - Category nodes for organization
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
@@ -35,17 +36,27 @@ class Neo4jClient:
             os.getenv("NEO4J_PASSWORD", "password"),
         )
         self.driver: AsyncDriver | None = None
+        # Serializes driver creation so concurrent cold sessions share one driver
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Establish connection to Neo4j."""
-        if not self.driver:
+        if self.driver:
+            return
+
+        async with self._connect_lock:
+            # Another task may have connected while we waited
+            if self.driver:
+                return
+            driver = AsyncGraphDatabase.driver(self.uri, auth=self.auth)
             try:
-                self.driver = AsyncGraphDatabase.driver(self.uri, auth=self.auth)
-                await self.driver.verify_connectivity()
-                logger.info("neo4j_connected", uri=self.uri)
+                await driver.verify_connectivity()
             except Exception as e:
                 logger.error("neo4j_connection_failed", error=str(e))
+                await driver.close()
                 raise
+            self.driver = driver
+            logger.info("neo4j_connected", uri=self.uri)
 
     async def close(self) -> None:
         """Close connection."""
@@ -54,6 +65,15 @@ class Neo4jClient:
             self.driver = None
             logger.info("neo4j_closed")
 
+    async def __aenter__(self) -> "Neo4jClient":
+        """Open the long-lived driver for the lifetime of an ``async with`` block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the driver when the ``async with`` block exits."""
+        await self.close()
+
     async def verify_connection(self) -> bool:
         """Verify the connection to Neo4j is working.
         
@@ -258,7 +258,10 @@ async def main():
     ]
     
     collector = BatchCollector(target_count=1000)
-    await collector.run(seed_ids)
+    try:
+        await collector.run(seed_ids)
+    finally:
+        await collector.s2_client.close()
 
 
 if __name__ == "__main__":
@@ -279,6 +279,7 @@ class TestBatchFetchFromS2:
 
         with patch("packages.ingestion.batch_processor.S2Client") as mock_client_class:
             mock_client = MagicMock()
+            mock_client.__aenter__.return_value = mock_client
             mock_client_class.return_value = mock_client
 
             async def mock_get_paper(arxiv_id):
@@ -302,6 +303,7 @@ class TestBatchFetchFromS2:
 
         with patch("packages.ingestion.batch_processor.S2Client") as mock_client_class:
             mock_client = MagicMock()
+            mock_client.__aenter__.return_value = mock_client
             mock_client_class.return_value = mock_client
 
             async def mock_get_paper(arxiv_id):
@@ -66,7 +66,7 @@ class TestCacheClient:
             mock_from_url.assert_called_once_with(
                 "redis://localhost:6379",
                 encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
             )
 
     @pytest.mark.asyncio
@@ -84,7 +84,7 @@ class TestCacheClient:
     async def test_get_cache_hit(self, cache_client_instance):
         """Test getting cached value."""
         mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value='{"result": "cached data"}')
+        mock_client.get = AsyncMock(return_value=b'{"result": "cached data"}')
         cache_client_instance._client = mock_client
 
         result = await cache_client_instance.get(
@@ -143,6 +143,22 @@ class TestCacheClient:
         call_args = mock_client.setex.call_args
         assert call_args[0][1] == 1800  # TTL
 
+    @pytest.mark.asyncio
+    async def test_set_round_trips_through_get(self, cache_client_instance):
+        """Test values are stored as compact JSON bytes and read back."""
+        mock_client = AsyncMock()
+        mock_client.setex = AsyncMock()
+        cache_client_instance._client = mock_client
+        value = {"papers": [{"id": "2401.00001", "score": 0.5, "title": "Schrödinger"}]}
+
+        await cache_client_instance.set("papers", "MATCH (p:Paper) RETURN p", {}, value)
+
+        stored = mock_client.setex.call_args[0][2]
+        assert isinstance(stored, bytes)
+        assert stored.startswith(b'{"papers":[{"id":"2401.00001",')
+        mock_client.get = AsyncMock(return_value=stored)
+        assert await cache_client_instance.get("papers", "MATCH (p:Paper) RETURN p", {}) == value
+
     @pytest.mark.asyncio
     async def test_set_with_default_ttl(self, cache_client_instance):
         """Test setting cache with default TTL."""
@@ -198,25 +214,51 @@ class TestCacheClient:
         mock_client = AsyncMock()
         
         # Mock scan_iter to return some keys
-        async def mock_scan_iter(match):
+        async def mock_scan_iter(match, count=None):
             for key in ["arxiv:papers:abc123", "arxiv:papers:def456"]:
                 yield key
         
         mock_client.scan_iter = mock_scan_iter
-        mock_client.delete = AsyncMock(return_value=2)
+        mock_client.unlink = AsyncMock(return_value=2)
         cache_client_instance._client = mock_client
 
         count = await cache_client_instance.invalidate_prefix("papers")
 
         assert count == 2
-        mock_client.delete.assert_called_once()
+        mock_client.unlink.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_prefix_unlinks_in_batches(self, cache_client_instance):
+        """Test large prefixes are unlinked in bounded batches."""
+        from packages.knowledge.cache_client import INVALIDATE_BATCH_SIZE
+
+        mock_client = AsyncMock()
+        total = INVALIDATE_BATCH_SIZE * 2 + 3
+
+        async def mock_scan_iter(match, count=None):
+            for i in range(total):
+                yield f"arxiv:papers:{i}"
+
+        mock_client.scan_iter = mock_scan_iter
+        mock_client.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+        cache_client_instance._client = mock_client
+
+        count = await cache_client_instance.invalidate_prefix("papers")
+
+        assert count == total
+        assert [len(c.args) for c in mock_client.unlink.call_args_list] == [
+            INVALIDATE_BATCH_SIZE,
+            INVALIDATE_BATCH_SIZE,
+            3,
+        ]
+        mock_client.delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_invalidate_prefix_no_keys(self, cache_client_instance):
         """Test invalidating prefix with no matching keys."""
         mock_client = AsyncMock()
         
-        async def mock_scan_iter(match):
+        async def mock_scan_iter(match, count=None):
             return
             yield  # Make it a generator
         
@@ -323,6 +365,86 @@ class TestCacheQueryDecorator:
             mock_cache.get.assert_called_once()
             mock_cache.set.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cache_query_decorator_keys_on_bound_arguments(self):
+        """Test positional, keyword and defaulted calls share one cache key."""
+        with patch("packages.knowledge.cache_client.cache_client") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            @cache_query("papers")
+            async def search_papers(query: str, limit: int = 10) -> list:
+                return []
+
+            await search_papers("quantum")
+            await search_papers("quantum", 10)
+            await search_papers(limit=10, query="quantum")
+
+            keys = {c.args[1] for c in mock_cache.get.call_args_list}
+            assert len(keys) == 1
+            assert keys.pop().endswith('search_papers:{"limit":10,"query":"quantum"}')
+
+    @pytest.mark.asyncio
+    async def test_cache_query_decorator_coalesces_concurrent_misses(self):
+        """Test concurrent misses on one key run the function once."""
+        import asyncio
+
+        with patch("packages.knowledge.cache_client.cache_client") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+            calls = 0
+
+            @cache_query("papers")
+            async def get_paper(arxiv_id: str) -> dict:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return {"id": arxiv_id}
+
+            results = await asyncio.gather(
+                *(get_paper("2401.00001") for _ in range(5)), get_paper("2401.00002")
+            )
+
+            assert results[:5] == [{"id": "2401.00001"}] * 5
+            assert results[5] == {"id": "2401.00002"}
+            assert calls == 2
+            assert mock_cache.set.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_query_decorator_skips_unserializable_arguments(self):
+        """Test arguments without a stable encoding bypass the cache."""
+        with patch("packages.knowledge.cache_client.cache_client") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            @cache_query("papers")
+            async def describe(obj: object) -> str:
+                return "fresh"
+
+            assert await describe(object()) == "fresh"
+            mock_cache.get.assert_not_called()
+            mock_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_query_decorator_caches_methods(self):
+        """Test decorated methods are cached, keyed without the instance."""
+        with patch("packages.knowledge.cache_client.cache_client") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            mock_cache.set = AsyncMock()
+
+            class PaperStore:
+                @cache_query("papers")
+                async def get_paper(self, arxiv_id: str) -> dict:
+                    return {"id": arxiv_id}
+
+            assert await PaperStore().get_paper("2401.00001") == {"id": "2401.00001"}
+            await PaperStore().get_paper(arxiv_id="2401.00001")
+
+            keys = {c.args[1] for c in mock_cache.get.call_args_list}
+            assert len(keys) == 1
+            assert keys.pop().endswith('PaperStore.get_paper:{"arxiv_id":"2401.00001"}')
+            assert mock_cache.set.call_count == 2
+
     @pytest.mark.asyncio
     async def test_cache_query_decorator_preserves_function_name(self):
         """Test that decorator preserves function metadata."""
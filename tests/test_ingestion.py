@@ -56,6 +56,24 @@ class TestPaperMetadata:
 
         assert metadata.author_list == ["John Doe", "Jane Smith"]
 
+    def test_author_list_tracks_updates(self) -> None:
+        """Test author_list reflects copies and reassigned authors."""
+        metadata = PaperMetadata(
+            id="2401.12345",
+            title="Test Paper",
+            authors="John Doe, Jane Smith",
+            categories="quant-ph",
+            abstract="",
+            update_date="2024-01-15",
+        )
+        assert metadata.author_list == ["John Doe", "Jane Smith"]
+
+        copied = metadata.model_copy(update={"authors": "Alice Roe"})
+        assert copied.author_list == ["Alice Roe"]
+
+        metadata.authors = "Bob Poe"
+        assert metadata.author_list == ["Bob Poe"]
+
     def test_category_normalization(self) -> None:
         """Test that comma-separated categories are normalized."""
         metadata = PaperMetadata(
@@ -241,6 +259,147 @@ class TestKaggleLoader:
         finally:
             temp_path.unlink()
 
+    def test_stream_validate_and_raw(self, tmp_path: Path) -> None:
+        """Test validated and raw streaming variants."""
+        from packages.ingestion.kaggle_loader import (
+            stream_kaggle_metadata,
+            stream_kaggle_records_raw,
+        )
+
+        temp_path = tmp_path / "snapshot.json"
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "id": "2401.00001",
+                    "title": "Quantum Paper",
+                    "authors": "Author",
+                    "categories": "quant-ph,hep-th",
+                    "abstract": "Abstract",
+                    "update_date": "2024-01-15",
+                    "journal-ref": "Phys. Rev. 1",
+                }
+            )
+            + "\n"
+        )
+
+        fast = next(stream_kaggle_metadata(temp_path))
+        assert fast.journal_ref == "Phys. Rev. 1"
+        assert fast.category_list == ["quant-ph", "hep-th"]
+
+        validated = next(stream_kaggle_metadata(temp_path, validate=True))
+        assert validated.category_list == ["quant-ph", "hep-th"]
+
+        raw = list(stream_kaggle_records_raw(temp_path))
+        assert raw == [json.loads(temp_path.read_text())]
+
+    def test_stream_fast_path_skips_missing_fields(self, tmp_path: Path) -> None:
+        """Test the unvalidated path still rejects records missing required keys."""
+        from packages.ingestion.kaggle_loader import stream_kaggle_metadata
+
+        complete = {
+            "id": "2401.00001",
+            "title": "Quantum Paper",
+            "authors": "Author",
+            "categories": "quant-ph",
+            "abstract": "Abstract",
+            "update_date": "2024-01-15",
+        }
+        incomplete = {k: v for k, v in complete.items() if k != "title"}
+        incomplete["id"] = "2401.00002"
+
+        temp_path = tmp_path / "snapshot.json"
+        temp_path.write_text("\n".join(json.dumps(r) for r in (incomplete, complete)) + "\n")
+
+        papers = list(stream_kaggle_metadata(temp_path))
+        assert [p.id for p in papers] == ["2401.00001"]
+
+    def test_stream_parallel_matches_sequential(self, tmp_path: Path) -> None:
+        """Test that parallel streaming yields the same papers in order."""
+        from packages.ingestion.kaggle_loader import (
+            stream_kaggle_metadata,
+            stream_kaggle_metadata_parallel,
+        )
+
+        categories = ["hep-th", "cs.AI", "math.QA cs.LG", "quant-ph"]
+        temp_path = tmp_path / "snapshot.json"
+        temp_path.write_text(
+            "".join(
+                json.dumps(
+                    {
+                        "id": f"2401.{i:05d}",
+                        "title": "Paper " * (i % 7 + 1),
+                        "authors": "Author",
+                        "categories": categories[i % len(categories)],
+                        "abstract": "Abstract",
+                        "update_date": "2024-01-15",
+                    }
+                )
+                + "\n"
+                for i in range(200)
+            )
+        )
+
+        expected = [p.id for p in stream_kaggle_metadata(temp_path)]
+        parallel = [
+            p.id for p in stream_kaggle_metadata_parallel(temp_path, workers=2, chunk_size=1000)
+        ]
+        assert parallel == expected
+
+        limited = list(
+            stream_kaggle_metadata_parallel(temp_path, workers=2, chunk_size=1000, limit=10)
+        )
+        assert [p.id for p in limited] == expected[:10]
+
+    def test_stream_gzip_snapshot(self, tmp_path: Path) -> None:
+        """Test streaming a gzip-compressed snapshot."""
+        import gzip
+
+        from packages.ingestion.kaggle_loader import stream_kaggle_metadata
+
+        temp_path = tmp_path / "snapshot.json.gz"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            for i, categories in enumerate(["hep-th", "cs.AI", "math.QA"]):
+                f.write(
+                    json.dumps(
+                        {
+                            "id": f"2401.0000{i}",
+                            "title": "Paper",
+                            "authors": "Author",
+                            "categories": categories,
+                            "abstract": "Abstract",
+                            "update_date": "2024-01-15",
+                        }
+                    )
+                    + "\n"
+                )
+
+        papers = list(stream_kaggle_metadata(temp_path))
+        assert [p.id for p in papers] == ["2401.00000", "2401.00002"]
+
+    def test_create_subset_copies_raw_lines(self, tmp_path: Path) -> None:
+        """Test that create_subset writes matching records verbatim."""
+        from packages.ingestion.kaggle_loader import create_subset
+
+        records = [
+            {"id": "2401.00001", "categories": "hep-th quant-ph"},
+            {"id": "2401.00002", "categories": "cs.AI"},
+            {"id": "2401.00003", "categories": "math.QA"},
+            {"id": "2401.00004", "categories": "quant-ph,math-ph"},
+        ]
+        lines = [
+            json.dumps({**r, "title": "T", "authors": "A", "abstract": "X", "update_date": "2024"})
+            for r in records
+        ]
+        input_path = tmp_path / "snapshot.json"
+        input_path.write_text("\n".join(lines) + "\n")
+
+        output_path = tmp_path / "subset.json"
+        assert create_subset(input_path, output_path) == 3
+        assert output_path.read_text().splitlines() == [lines[0], lines[2], lines[3]]
+
+        assert create_subset(input_path, output_path, categories=["quant-ph"]) == 2
+        assert output_path.read_text().splitlines() == [lines[0], lines[3]]
+
 
 class TestTextExtractor:
     """Tests for text_extractor module."""
@@ -294,6 +453,121 @@ These are the results.
         assert len(sections) >= 3
         assert any(s.title == "Introduction" for s in sections)
 
+    def test_extract_equations_keeps_long_environments(self) -> None:
+        """Test environment bodies are not length-capped and never nest."""
+        from packages.ingestion.text_extractor import PyMuPDFExtractor
+
+        long_body = "a_1" + " + a_1" * 3000
+        text = (
+            f"\\begin{{equation}}{long_body}\\end{{equation}} "
+            "\\begin{equation} stray \\begin{equation}F = ma\\end{equation}"
+        )
+
+        equations = PyMuPDFExtractor().extract_equations(text)
+
+        assert equations == [long_body, "F = ma"]
+
+    def test_section_levels_and_content(self) -> None:
+        """Test header levels and the content sliced between headers."""
+        from packages.ingestion.text_extractor import PyMuPDFExtractor
+
+        text = "Preamble\n  Abstract  \nShort summary.\n2.1 Setup\nLine one.\n\nLine two.\n2024\n"
+
+        sections = PyMuPDFExtractor().extract_sections(text)
+
+        assert [(s.title, s.content, s.level) for s in sections] == [
+            ("Abstract", "Short summary.", 1),
+            ("Setup", "Line one.\n\nLine two.\n2024", 2),
+        ]
+
+    def test_extract_text_trims_page_margins(self, tmp_path: Path) -> None:
+        """Test page_margin drops running headers and page numbers."""
+        import fitz
+
+        from packages.ingestion.text_extractor import PyMuPDFExtractor
+
+        pdf_path = tmp_path / "paper.pdf"
+        with fitz.open() as doc:
+            for number in (1, 2):
+                page = doc.new_page()
+                page.insert_text((72, 30), "Running header")
+                page.insert_text((72, 400), f"Body of page {number}")
+                page.insert_text((300, 820), str(number))
+            doc.save(pdf_path)
+
+        full = PyMuPDFExtractor().extract_text(pdf_path)
+        trimmed = PyMuPDFExtractor(page_margin=50).extract_text(pdf_path)
+
+        assert "Running header" in full
+        assert "Running header" not in trimmed
+        assert trimmed.split() == ["Body", "of", "page", "1", "Body", "of", "page", "2"]
+
+    def test_extract_text_in_worker_processes_keeps_page_order(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test multi-process extraction matches serial extraction."""
+        import fitz
+
+        from packages.ingestion import text_extractor
+        from packages.ingestion.text_extractor import PyMuPDFExtractor
+
+        pdf_path = tmp_path / "paper.pdf"
+        with fitz.open() as doc:
+            for number in range(5):
+                doc.new_page().insert_text((72, 400), f"Page {number}")
+            doc.save(pdf_path)
+        monkeypatch.setattr(text_extractor, "PARALLEL_MIN_PAGES", 1)
+
+        serial = PyMuPDFExtractor().extract_text(pdf_path)
+        parallel = PyMuPDFExtractor(workers=2).extract_text(pdf_path)
+
+        assert parallel == serial
+        assert parallel.split() == [w for n in range(5) for w in ("Page", str(n))]
+
+    def test_extract_text_serializes_fitz_across_threads(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test concurrent extractions never run PyMuPDF on two threads at once."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        import fitz
+
+        from packages.ingestion import text_extractor
+        from packages.ingestion.text_extractor import PyMuPDFExtractor
+
+        pdf_path = tmp_path / "paper.pdf"
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 400), "Body")
+            doc.save(pdf_path)
+
+        in_fitz = 0
+        peak = 0
+        counter_lock = threading.Lock()
+        page_text = text_extractor._page_text
+
+        def slow_page_text(page: fitz.Page, margin: float) -> str:
+            nonlocal in_fitz, peak
+            with counter_lock:
+                in_fitz += 1
+                peak = max(peak, in_fitz)
+            time.sleep(0.02)
+            try:
+                return page_text(page, margin)
+            finally:
+                with counter_lock:
+                    in_fitz -= 1
+
+        monkeypatch.setattr(text_extractor, "_page_text", slow_page_text)
+
+        extractor = PyMuPDFExtractor()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            texts = list(pool.map(extractor.extract_text, [pdf_path] * 4))
+
+        assert peak == 1
+        assert all(text.strip() == "Body" for text in texts)
+
 
 @pytest.mark.asyncio
 class TestPDFDownloader:
@@ -328,3 +602,164 @@ class TestPDFDownloader:
             # Old format
             path = downloader._get_pdf_path("hep-th/9901001")
             assert "hep-th_9901001" in str(path)
+
+    async def test_download_pdf_streams_to_disk(self) -> None:
+        """Test PDFs are streamed to disk and non-PDF bodies are rejected."""
+        import asyncio
+
+        from aiohttp import web
+
+        from packages.ingestion.pdf_downloader import ArxivDownloader
+
+        body = b"%PDF-1.4\n" + b"x" * 200_000
+
+        async def handler(request: web.Request) -> web.Response:
+            if "bad" in request.path:
+                return web.Response(body=b"<html>captcha</html>")
+            return web.Response(body=body)
+
+        app = web.Application()
+        app.router.add_get("/pdf/{name}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                downloader = ArxivDownloader(
+                    Path(tmpdir), rate_limit=0, mirrors=[f"http://127.0.0.1:{port}"]
+                )
+                try:
+                    path = await downloader._download_pdf("2401.12345")
+                    assert path.read_bytes() == body
+
+                    # Duplicate IDs in one batch download concurrently
+                    paths = await asyncio.gather(
+                        *(downloader._download_pdf("2401.54321") for _ in range(3))
+                    )
+                    assert {p.read_bytes() for p in paths} == {body}
+
+                    with pytest.raises(ValueError):
+                        await downloader._download_pdf("bad.00001")
+                    assert not list(Path(tmpdir).rglob("*.part"))
+                    assert not downloader._get_pdf_path("bad.00001").exists()
+                finally:
+                    await downloader.close()
+        finally:
+            await runner.cleanup()
+
+    async def test_download_skips_existing_pdf(self) -> None:
+        """Test an existing PDF is returned without a download attempt."""
+        from unittest.mock import AsyncMock, patch
+
+        from packages.ingestion.models import PaperMetadata
+        from packages.ingestion.pdf_downloader import ArxivDownloader
+
+        metadata = PaperMetadata(
+            id="2401.12345",
+            title="Test",
+            authors="Author",
+            categories="quant-ph",
+            abstract="",
+            update_date="2024-01-15",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = ArxivDownloader(Path(tmpdir))
+            existing = downloader._get_pdf_path(metadata.id)
+            existing.write_bytes(b"%PDF-1.4")
+
+            with patch.object(downloader, "_download_pdf", AsyncMock()) as mock_download:
+                paper = await downloader.download(metadata)
+
+        mock_download.assert_not_called()
+        assert paper.pdf_path == existing
+
+    async def test_download_batch_spreads_across_mirrors(self) -> None:
+        """Test batch download uses every mirror and keeps input order."""
+        from unittest.mock import patch
+
+        from packages.ingestion.models import PaperMetadata
+        from packages.ingestion.pdf_downloader import ArxivDownloader
+
+        papers = [
+            PaperMetadata(
+                id=f"2401.{i:05d}",
+                title="Test",
+                authors="Author",
+                categories="quant-ph",
+                abstract="",
+                update_date="2024-01-15",
+            )
+            for i in range(20)
+        ]
+        mirrors = ["https://arxiv.org/", "https://export.arxiv.org"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = ArxivDownloader(Path(tmpdir), mirrors=mirrors)
+            used = {downloader._get_mirror(paper.id) for paper in papers}
+            assert used == {"https://arxiv.org", "https://export.arxiv.org"}
+
+            async def fake_download_pdf(arxiv_id: str) -> Path:
+                if arxiv_id == "2401.00003":
+                    raise FileNotFoundError(arxiv_id)
+                return Path(tmpdir) / f"{arxiv_id}.pdf"
+
+            with patch.object(downloader, "_download_pdf", fake_download_pdf):
+                results = await downloader.download_batch(papers)
+
+        assert [paper.arxiv_id for paper in results] == [
+            paper.id for paper in papers if paper.id != "2401.00003"
+        ]
+
+    async def test_download_batch_bounds_and_cancels(self) -> None:
+        """Test batch download caps in-flight downloads and stops on failure."""
+        import asyncio
+        from unittest.mock import patch
+
+        from packages.ingestion.models import PaperMetadata
+        from packages.ingestion.pdf_downloader import ArxivDownloader
+
+        papers = [
+            PaperMetadata(
+                id=f"2401.{i:05d}",
+                title="Test",
+                authors="Author",
+                categories="quant-ph",
+                abstract="",
+                update_date="2024-01-15",
+            )
+            for i in range(30)
+        ]
+        in_flight = 0
+        peak = 0
+        started = 0
+
+        async def fake_download_pdf(arxiv_id: str) -> Path:
+            nonlocal in_flight, peak, started
+            started += 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if arxiv_id == "2401.00005":
+                    raise ConnectionError(arxiv_id)
+                return Path(tmpdir) / f"{arxiv_id}.pdf"
+            finally:
+                in_flight -= 1
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = ArxivDownloader(Path(tmpdir))
+            with patch.object(downloader, "_download_pdf", fake_download_pdf):
+                results = await downloader.download_batch(papers, concurrency=4)
+                assert peak == 4
+                assert len(results) == 29
+
+                started = 0
+                with pytest.raises(ConnectionError):
+                    await downloader.download_batch(papers, skip_errors=False, concurrency=4)
+
+        assert in_flight == 0
+        assert started < len(papers)
@@ -80,6 +80,31 @@ class TestChromaDBClient:
             stats = client.get_stats()
             assert stats["papers"] == 5
 
+    def test_batch_add_papers_in_sub_batches(self) -> None:
+        """Test batch adding papers across several sub-batches."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir))
+
+            papers = [
+                ParsedPaper(
+                    arxiv_id=f"2401.0000{i}",
+                    title=f"Paper {i}",
+                    abstract=f"Abstract for paper {i}.",
+                    authors=["Author"],
+                    categories=["quant-ph"],
+                    parser_used=ParserType.PYMUPDF,
+                )
+                for i in range(5)
+            ]
+
+            assert client.add_papers_batch(papers, batch_size=2) == 5
+
+            stored = client._get_papers_collection().get(ids=["2401.00004"], include=["embeddings"])
+            assert len(stored["embeddings"][0]) > 0
+            assert client.get_stats()["papers"] == 5
+
     def test_category_filter(self) -> None:
         """Test searching with category filter."""
         from packages.knowledge.chromadb_client import ChromaDBClient
@@ -111,6 +136,178 @@ class TestChromaDBClient:
             assert len(results) == 1
             assert results[0]["arxiv_id"] == "2401.00001"
 
+    def test_torch_embedding_backend(self) -> None:
+        """Test forcing the PyTorch embedding backend."""
+        from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir), embedding_backend="torch")
+            assert isinstance(client._get_embedding_fn(), SentenceTransformerEmbeddingFunction)
+
+    def test_auto_embedding_backend_uses_torch(self) -> None:
+        """Test "auto" never switches to ONNX, so vectors match existing collections."""
+        from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir), embedding_backend="auto")
+            assert isinstance(client._get_embedding_fn(), SentenceTransformerEmbeddingFunction)
+
+    def test_batched_search_and_similarity(self) -> None:
+        """Test batched text queries and batched similar-paper lookups."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir))
+
+            papers = [
+                ParsedPaper(
+                    arxiv_id=f"2401.0000{i}",
+                    title=title,
+                    abstract=f"About {title.lower()}.",
+                    authors=["A"],
+                    categories=["quant-ph"],
+                    parser_used=ParserType.PYMUPDF,
+                )
+                for i, title in enumerate(["Quantum Entanglement", "Black Holes", "Knot Theory"])
+            ]
+            client.add_papers_batch(papers)
+
+            batches = client.search_papers_batch(["entanglement", "knots"], n_results=1)
+            assert [b[0]["arxiv_id"] for b in batches] == ["2401.00000", "2401.00002"]
+
+            similar = client.get_similar_papers_batch(
+                ["2401.00000", "2401.00001", "missing"], n_results=2
+            )
+            assert set(similar) == {"2401.00000", "2401.00001"}
+            for arxiv_id, rows in similar.items():
+                assert len(rows) == 2
+                assert arxiv_id not in [r["arxiv_id"] for r in rows]
+
+    def test_hnsw_metadata_and_search_ef_tuning(self) -> None:
+        """Test HNSW parameters land in collection metadata and can be retuned."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir), hnsw_m=32)
+
+            metadata = client._get_papers_collection().metadata
+            assert metadata["hnsw:space"] == "cosine"
+            assert metadata["hnsw:M"] == 32
+            assert metadata["hnsw:search_ef"] == 100
+
+            client.tune_search_ef(200)
+            metadata = client._get_papers_collection().metadata
+            assert metadata["hnsw:space"] == "cosine"
+            assert metadata["hnsw:search_ef"] == 200
+
+    def test_clients_share_embedding_fn(self) -> None:
+        """Test clients in one process reuse a single loaded model."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as dir_a, tempfile.TemporaryDirectory() as dir_b:
+            client_a = ChromaDBClient(persist_dir=Path(dir_a))
+            client_b = ChromaDBClient(persist_dir=Path(dir_b))
+            assert client_a._get_embedding_fn() is client_b._get_embedding_fn()
+
+    async def test_async_batch_requires_server(self) -> None:
+        """Test the async batch path refuses to run against an embedded store."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir))
+            paper = ParsedPaper(
+                arxiv_id="2401.00001",
+                title="Paper",
+                abstract="Abstract.",
+                authors=["A"],
+                categories=["quant-ph"],
+                parser_used=ParserType.PYMUPDF,
+            )
+            with pytest.raises(RuntimeError):
+                await client.add_papers_batch_async([paper])
+
+    async def test_async_batch_cancels_upsert_when_embedding_fails(self) -> None:
+        """Test a failed embed does not leave the previous upsert running."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir))
+            papers = [
+                ParsedPaper(
+                    arxiv_id=f"2401.0000{i}",
+                    title="Paper",
+                    abstract="Abstract.",
+                    authors=["A"],
+                    categories=["quant-ph"],
+                    parser_used=ParserType.PYMUPDF,
+                )
+                for i in range(2)
+            ]
+            upsert_cancelled = asyncio.Event()
+
+            async def slow_upsert(**kwargs: object) -> None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    upsert_cancelled.set()
+                    raise
+
+            collection = MagicMock()
+            collection.upsert = slow_upsert
+            calls = iter([[[0.0]], RuntimeError("embed failed")])
+
+            def embed(documents: list[str]) -> list[list[float]]:
+                result = next(calls)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            with (
+                patch.object(client, "_get_async_papers_collection", return_value=collection),
+                patch.object(client, "_embed", side_effect=embed),
+                pytest.raises(RuntimeError, match="embed failed"),
+            ):
+                await client.add_papers_batch_async(papers, batch_size=1)
+
+            assert upsert_cancelled.is_set()
+
+    def test_query_embeddings_are_cached(self) -> None:
+        """Test repeated search queries are embedded only once."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = ChromaDBClient(persist_dir=Path(tmpdir))
+            embedded: list[list[str]] = []
+            embed = client._embed
+
+            def counting_embed(documents: list[str]) -> list[list[float]]:
+                embedded.append(list(documents))
+                return embed(documents)
+
+            client._embed = counting_embed  # type: ignore[method-assign]
+
+            first = client._embed_queries(["quantum", "gravity", "quantum"])
+            second = client._embed_queries(["gravity", "knots"])
+
+            assert embedded == [["quantum", "gravity"], ["knots"]]
+            assert first[0] == first[2]
+            assert second[0] == first[1]
+
+    def test_unknown_embedding_backend(self) -> None:
+        """Test rejecting an unknown embedding backend."""
+        from packages.knowledge.chromadb_client import ChromaDBClient
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                ChromaDBClient(persist_dir=Path(tmpdir), embedding_backend="tpu")
+
 
 class TestNeo4jClient:
     """Tests for Neo4jClient that don't require a running database."""
@@ -153,6 +350,50 @@ class TestNeo4jClient:
         assert client.uri == "bolt://localhost:7688"
         assert client.auth == ("user", "pass")
 
+    async def test_client_async_context_reuses_driver(self) -> None:
+        """Test the driver opens once for an async with block and closes on exit."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from neo4j import AsyncGraphDatabase
+
+        from packages.knowledge.neo4j_client import Neo4jClient
+
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock()
+        driver.close = AsyncMock()
+
+        with patch.object(AsyncGraphDatabase, "driver", return_value=driver) as make_driver:
+            async with Neo4jClient() as client:
+                await client.connect()
+                assert client.driver is driver
+
+        make_driver.assert_called_once()
+        driver.close.assert_awaited_once()
+        assert client.driver is None
+
+    async def test_concurrent_connects_share_one_driver(self) -> None:
+        """Test cold concurrent sessions create a single driver."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from neo4j import AsyncGraphDatabase
+
+        from packages.knowledge.neo4j_client import Neo4jClient
+
+        async def slow_verify() -> None:
+            await asyncio.sleep(0.01)
+
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock(side_effect=slow_verify)
+        driver.close = AsyncMock()
+
+        with patch.object(AsyncGraphDatabase, "driver", return_value=driver) as make_driver:
+            client = Neo4jClient()
+            await asyncio.gather(client.connect(), client.connect(), client.connect())
+
+        make_driver.assert_called_once()
+        assert client.driver is driver
+
 
 class TestParsedPaperForIngestion:
     """Test ParsedPaper model for ingestion compatibility."""
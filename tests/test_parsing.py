@@ -92,6 +92,35 @@ def sample_grobid_xml():
 </TEI>"""
 
 
+@pytest.fixture
+def grobid_xml_with_references():
+    """Grobid TEI XML with in-text references and a bibliography."""
+    return """<?xml version="1.0" encoding="UTF-8"?>
+<TEI xmlns="http://www.tei-c.org/ns/1.0">
+    <text>
+        <body>
+            <div>
+                <head>Introduction</head>
+                <p>Prior work <ref type="bibr" target="#b0">[1]</ref> and <ref type="bibr" target="#b1">[2]</ref>.</p>
+                <p>Unresolved <ref type="bibr" target="#b9">[9]</ref> and a <ref type="figure" target="#f0">figure</ref>.</p>
+            </div>
+        </body>
+        <back>
+            <listBibl>
+                <biblStruct xml:id="b0">
+                    <analytic><title>First Reference</title></analytic>
+                    <idno type="arXiv">2001.00001</idno>
+                    <idno type="DOI">10.1000/xyz</idno>
+                </biblStruct>
+                <biblStruct xml:id="b1">
+                    <analytic><title>Second Reference</title></analytic>
+                </biblStruct>
+            </listBibl>
+        </back>
+    </text>
+</TEI>"""
+
+
 class TestMarkerParser:
     """Tests for Marker PDF parser integration."""
 
@@ -146,6 +175,23 @@ class TestMarkerParser:
 
         assert result is None
 
+    def test_get_shared_marker_reuses_parser_per_config(self):
+        """Test parsers are shared between equal configs only."""
+        from packages.ingestion import marker_parser
+        from packages.ingestion.marker_parser import MarkerConfig, MarkerParser, get_shared_marker
+
+        with (
+            patch.dict(marker_parser._SHARED_PARSERS, clear=True),
+            patch.object(MarkerParser, "_check_marker_available"),
+        ):
+            first = get_shared_marker(MarkerConfig(max_pages=10))
+            same = get_shared_marker(MarkerConfig(max_pages=10))
+            other = get_shared_marker(MarkerConfig(max_pages=20))
+
+        assert first is same
+        assert other is not first
+        assert other.config.max_pages == 20
+
 
 class TestGrobidParser:
     """Tests for Grobid citation extraction."""
@@ -194,6 +240,135 @@ class TestGrobidParser:
 
         assert result is None
 
+    def test_extract_citations_from_tei(self, grobid_xml_with_references):
+        """Test streaming citation extraction resolves refs against the bibliography."""
+        from packages.ingestion.grobid_parser import GrobidParser
+
+        citations = GrobidParser()._extract_citations_from_tei(grobid_xml_with_references)
+
+        assert len(citations) == 2
+        assert citations[0].arxiv_id == "2001.00001"
+        assert citations[0].doi == "10.1000/xyz"
+        assert "First Reference" in citations[0].raw_text
+        assert citations[0].context == citations[1].context
+        assert "Prior work" in citations[0].context
+        assert citations[1].arxiv_id is None
+
+    def test_extract_citations_keeps_context_around_nested_refs(self):
+        """Test a ref inside <hi> does not erase its paragraph's context or reorder refs."""
+        from packages.ingestion.grobid_parser import GrobidParser
+
+        tei_xml = """<TEI xmlns="http://www.tei-c.org/ns/1.0"><text>
+<body><div><p>First claim<ref type="bibr" target="#b0">[1]</ref>and<hi>emph<ref
+ type="bibr" target="#b1">[2]</ref></hi>tail<ref type="bibr" target="#b0">[1]</ref>.</p></div></body>
+<back><listBibl>
+<biblStruct xml:id="b0"><title>First</title></biblStruct>
+<biblStruct xml:id="b1"><title>Second</title></biblStruct>
+</listBibl></back></text></TEI>"""
+
+        citations = GrobidParser()._extract_citations_from_tei(tei_xml)
+
+        assert [c.raw_text for c in citations] == ["First", "Second", "First"]
+        assert citations[0].context == "First claim[1]andemph[2]tail[1]."
+        assert citations[1].context == "emph[2]"
+        assert citations[2].context == citations[0].context
+
+    async def test_parse_papers_with_grobid_bounds_concurrency(self, sample_pdf_path):
+        """Test batch Grobid parsing caps in-flight requests and skips failures."""
+        import asyncio
+
+        from packages.ingestion.grobid_parser import GrobidParser, parse_papers_with_grobid
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+
+        papers = [
+            ArxivPaper(
+                metadata=PaperMetadata(
+                    id=f"2401.0000{i}",
+                    title="Test",
+                    authors="Author",
+                    categories="quant-ph",
+                    abstract="",
+                    update_date="2024-01-15",
+                ),
+                pdf_path=sample_pdf_path,
+            )
+            for i in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def fake_parse(self, paper, output_dir=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if paper.arxiv_id.endswith("5"):
+                raise RuntimeError("Grobid failed")
+            return "<TEI/>", {"citations": []}
+
+        with patch.object(GrobidParser, "parse", fake_parse):
+            results = await parse_papers_with_grobid(papers, concurrency=2)
+
+        assert peak == 2
+        assert len(results) == 5
+        assert "2401.00005" not in results
+
+    async def test_parse_uses_tei_cache(self, sample_pdf_path, sample_grobid_xml, tmp_path):
+        """Test that a cached TEI result skips the Grobid call."""
+        from packages.ingestion.grobid_parser import GrobidConfig, GrobidParser
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+
+        paper = ArxivPaper(
+            metadata=PaperMetadata(
+                id="2401.00001",
+                title="Test",
+                authors="Author",
+                categories="quant-ph",
+                abstract="",
+                update_date="2024-01-15",
+            ),
+            pdf_path=sample_pdf_path,
+        )
+        parser = GrobidParser(GrobidConfig(cache_dir=tmp_path / "tei_cache"))
+        parser.check_service_health = AsyncMock(return_value=True)
+        parser.process_pdf = AsyncMock(return_value=sample_grobid_xml)
+
+        first, _ = await parser.parse(paper)
+        second, _ = await parser.parse(paper)
+
+        assert first == second == sample_grobid_xml
+        parser.process_pdf.assert_awaited_once()
+        assert len(list((tmp_path / "tei_cache").iterdir())) == 1
+
+    async def test_parse_survives_tei_cache_write_failure(
+        self, sample_pdf_path, sample_grobid_xml, tmp_path
+    ):
+        """Test that a failed cache write still returns the parsed TEI."""
+        from packages.ingestion.grobid_parser import GrobidConfig, GrobidParser
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+
+        paper = ArxivPaper(
+            metadata=PaperMetadata(
+                id="2401.00001",
+                title="Test",
+                authors="Author",
+                categories="quant-ph",
+                abstract="",
+                update_date="2024-01-15",
+            ),
+            pdf_path=sample_pdf_path,
+        )
+        parser = GrobidParser(GrobidConfig(cache_dir=tmp_path / "tei_cache"))
+        parser.check_service_health = AsyncMock(return_value=True)
+        parser.process_pdf = AsyncMock(return_value=sample_grobid_xml)
+
+        with patch("pathlib.Path.replace", side_effect=OSError("disk full")):
+            tei_xml, _ = await parser.parse(paper)
+
+        assert tei_xml == sample_grobid_xml
+        assert list((tmp_path / "tei_cache").iterdir()) == []
+
 
 class TestLatexExtractor:
     """Tests for LaTeX extraction from parsed content."""
@@ -260,6 +435,101 @@ class TestLatexExtractor:
         assert extract_theorems("") == []
         assert extract_constants("") == []
 
+    def test_display_equations_in_document_order(self):
+        """Test that all display forms are found in one pass, in order."""
+        from packages.ingestion.latex_extractor import LaTeXExtractor
+
+        text = (
+            "\\begin{align} y = 2 \\end{align}\n"
+            "$$E = mc^2$$ (1)\n"
+            "\\[ a^2 + b^2 = c^2 \\]\n"
+            "\\begin{equation}F = ma\\end{equation}\n"
+            "$$E = mc^2$$\n"
+        )
+
+        equations = LaTeXExtractor().extract_display_equations(text)
+
+        assert [eq.content for eq in equations] == [
+            "y = 2",
+            "E = mc^2",
+            "a^2 + b^2 = c^2",
+            "F = ma",
+        ]
+        assert equations[1].number == "1"
+
+    def test_inline_equations_may_wrap_lines(self):
+        """Test inline math broken across a line still pairs its own delimiters."""
+        from packages.ingestion.latex_extractor import LaTeXExtractor
+
+        text = (
+            "The energy $E = m c^2 +\n V(x)$ is conserved and $p_\\mu$ "
+            "denotes momentum, with $\\alpha \\beta$ couplings."
+        )
+
+        equations = LaTeXExtractor().extract_inline_equations(text)
+
+        assert [eq.content for eq in equations] == [
+            "E = m c^2 +\n V(x)",
+            "p_\\mu",
+            "\\alpha \\beta",
+        ]
+
+    def test_named_equations_and_constants(self):
+        """Test keyword extraction for named equations and constants."""
+        from packages.ingestion.latex_extractor import LaTeXExtractor
+
+        text = (
+            "Solving the schrodinger  equation with \\hbar set to one, "
+            "the Boltzmann constant enters the Boltzmann equation."
+        )
+
+        entities = LaTeXExtractor().extract_all(text)
+
+        assert [e.name for e in entities["named_equations"]] == [
+            "Schrödinger equation",
+            "Boltzmann equation",
+        ]
+        assert [e.name for e in entities["constants"]] == [
+            "reduced Planck constant",
+            "Boltzmann constant",
+        ]
+
+    def test_extract_all_cache_returns_independent_copies(self):
+        """Test memoized results can be modified without affecting later calls."""
+        from packages.ingestion import latex_extractor
+        from packages.ingestion.latex_extractor import LaTeXExtractor
+
+        text = "Prose. " * 200 + "$$E = mc^2$$ and $p_\\mu p^\\mu$."
+
+        first = LaTeXExtractor().extract_all(text)
+        first["display_equations"][0].content = "mutated"
+        first["inline_equations"][0].metadata["display"] = True
+        second = LaTeXExtractor().extract_all(text)
+
+        assert second["display_equations"][0].content == "E = mc^2"
+        assert second["inline_equations"][0].metadata == {"display": False}
+        assert all(
+            isinstance(key[1], bytes) and len(key[1]) == 16
+            for key in latex_extractor._EXTRACT_ALL_CACHE
+        )
+
+    def test_numbered_theorems_stop_at_blank_line(self):
+        """Test that numbered statements end at the next blank line."""
+        from packages.ingestion.latex_extractor import LaTeXExtractor
+
+        text = (
+            "Theorem 2.1: Every bounded sequence\nhas a convergent subsequence.\n\n"
+            "Unrelated text. Lemma 3. A small result.\n\n"
+            "More prose."
+        )
+
+        theorems = LaTeXExtractor().extract_theorems(text)
+
+        assert [(t.type, t.number, t.content) for t in theorems] == [
+            ("theorem", "2.1", "Every bounded sequence\nhas a convergent subsequence."),
+            ("lemma", "3", "A small result."),
+        ]
+
 
 class TestSemanticChunker:
     """Tests for semantic chunking by section."""
@@ -321,6 +591,131 @@ Content 2
         assert 2 in levels  # Sections
         assert 3 in levels  # Subsections
 
+    def test_extract_citation_ids_ordered_and_deduped(self):
+        """Test citation IDs cover new/old arXiv styles and DOIs in order."""
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        content = (
+            "See arXiv:2301.00001v2 and hep-th/9901001, then 2301.00001v2 again "
+            "and doi 10.1103/PhysRevD.1.1 plus hep-th/9901001."
+        )
+
+        ids = SemanticChunker()._extract_citation_ids_from_content(content)
+
+        assert ids == ["2301.00001v2", "hep-th/9901001", "10.1103/PhysRevD.1.1"]
+
+    def test_extract_old_style_ids_need_a_real_archive(self):
+        """Test old-style IDs keep subject classes and ignore URL path segments."""
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        content = (
+            "Links arxiv.org/abs/1234567 and arxiv.org/pdf/1234567 are not IDs, "
+            "but math.AG/0309136, arxiv.org/abs/hep-ph/9905221 and "
+            "cond-mat.str-el/0101001 are."
+        )
+
+        ids = SemanticChunker()._extract_citation_ids_from_content(content)
+
+        assert ids == ["math.AG/0309136", "hep-ph/9905221", "cond-mat.str-el/0101001"]
+
+    def test_extract_equations_pairs_long_display_math(self):
+        """Test a long display equation still pairs with its own closing '$$'."""
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        long_eq = "a + " * 1000 + "b"
+        content = f"$${long_eq}$$ so that $$E = mc^2$$ holds"
+
+        equations = SemanticChunker()._extract_equations_from_content(content)
+
+        assert equations[:2] == [long_eq, "E = mc^2"]
+
+    def test_extract_equations_pairs_short_inline_and_skips_empty_display(self):
+        """Test short inline math keeps its delimiters and '$$$$' yields nothing."""
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        chunker = SemanticChunker()
+        long_inline = "x_" + "i + x_" * 100 + "n"
+
+        assert chunker._extract_equations_from_content("Empty $$$$ block") == []
+        assert chunker._extract_equations_from_content(
+            f"Let $x$ and $y$ satisfy ${long_inline}$ here"
+        ) == [long_inline]
+
+    def test_classify_section_type_follows_type_order(self):
+        """Test the first type in SECTION_TYPES order wins, not the leftmost keyword."""
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        chunker = SemanticChunker()
+
+        assert chunker._classify_section_type("Discussion of Results") == "results"
+        assert chunker._classify_section_type("Summary") == "abstract"
+        assert chunker._classify_section_type("MATERIALS AND METHODS") == "methods"
+        assert chunker._classify_section_type("Related Work") == "section"
+
+    def test_iter_chunks_streams_same_chunks_as_chunk_paper(self):
+        """Test iter_chunks yields lazily and matches chunk_paper."""
+        import types
+
+        from packages.ingestion.models import Section
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        paper = ParsedPaper(
+            arxiv_id="2401.00001",
+            title="T",
+            abstract="An abstract.",
+            authors=["A"],
+            categories=["quant-ph"],
+            full_text="",
+            sections=[
+                Section(title="Introduction", content="i" * 150, level=1),
+                Section(title="Methods", content="\n\n".join(["m" * 90] * 3), level=1),
+            ],
+            parser_used=ParserType.MARKER,
+        )
+        chunker = SemanticChunker(max_chunk_size=200)
+
+        stream = chunker.iter_chunks(paper)
+
+        assert isinstance(stream, types.GeneratorType)
+        assert next(stream).section_type == "abstract"
+        assert list(chunker.iter_chunks(paper)) == chunker.chunk_paper(paper)
+        assert [c.position for c in chunker.chunk_paper(paper)] == [0, 1, 2, 3]
+
+    def test_split_large_section_respects_max_chunk_size(self):
+        """Test split chunks never exceed max_chunk_size, separators included."""
+        from packages.ingestion.models import Section
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        # Three 49-char paragraphs joined by "\n\n" are exactly 151 chars
+        section = Section(title="Methods", content="\n\n".join(["p" * 49] * 7), level=1)
+
+        chunks = SemanticChunker(max_chunk_size=150)._split_large_section(
+            section, "2401.00001", 0, "methods"
+        )
+
+        assert [c.char_count for c in chunks] == [100, 100, 100, 49]
+        assert [c.position for c in chunks] == [0, 1, 2, 3]
+        assert all(c.section_type == "methods" for c in chunks)
+
+    def test_split_large_section_reuses_known_equations(self):
+        """Test split chunks take the section's equations instead of rescanning."""
+        from packages.ingestion.models import Section
+        from packages.ingestion.semantic_chunker import SemanticChunker
+
+        section = Section(
+            title="Theory",
+            content="First $$E = mc^2$$ part.\n\nSecond $$H = p^2/2m$$ and $x + y$ part.",
+            level=1,
+            equations=["E = mc^2", "H = p^2/2m"],
+        )
+        chunker = SemanticChunker(max_chunk_size=40)
+
+        with patch.object(chunker, "_extract_equations_from_content") as rescan:
+            chunks = chunker._split_large_section(section, "2401.00001", 0, "theory")
+
+        assert [c.equations for c in chunks] == [["E = mc^2"], ["H = p^2/2m"]]
+        rescan.assert_not_called()
+
 
 class TestParsingPipeline:
     """Tests for the complete parsing pipeline."""
@@ -409,6 +804,189 @@ class TestParsingPipeline:
         mock_equations.assert_called()
         mock_theorems.assert_called()
 
+    async def test_parse_batch_bounds_concurrency(self, sample_pdf_path):
+        """Test batch parsing overlaps papers, caps concurrency and keeps order."""
+        import asyncio
+
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+        from packages.ingestion.parsing_pipeline import (
+            ParsingPipeline,
+            ParsingPipelineConfig,
+            ParsingQuality,
+            ParsingQualityBatch,
+            parse_batch,
+        )
+
+        papers = [
+            ArxivPaper(
+                metadata=PaperMetadata(
+                    id=f"2401.0000{i}",
+                    title="Test",
+                    authors="Author",
+                    categories="quant-ph",
+                    abstract="",
+                    update_date="2024-01-15",
+                ),
+                pdf_path=sample_pdf_path,
+            )
+            for i in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def fake_parse(self, paper):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if paper.arxiv_id.endswith("3"):
+                raise RuntimeError("parse failed")
+            quality = ParsingQuality(
+                arxiv_id=paper.arxiv_id,
+                marker_success=paper.arxiv_id.endswith("0"),
+                grobid_success=True,
+                pymupdf_fallback=False,
+                section_count=4,
+                equation_count=2,
+                citation_count=10,
+                reference_count=0,
+                parse_time_seconds=0.5,
+                warnings=[],
+                errors=[],
+            )
+            return paper.arxiv_id, quality
+
+        config = ParsingPipelineConfig(use_marker=False, use_grobid=False)
+        quality_batch = ParsingQualityBatch()
+        with patch.object(ParsingPipeline, "parse", fake_parse):
+            results = await parse_batch(papers, config, concurrency=3, quality_batch=quality_batch)
+
+        assert peak == 3
+        assert [arxiv_id for arxiv_id, _ in results] == [
+            "2401.00000",
+            "2401.00001",
+            "2401.00002",
+            "2401.00004",
+            "2401.00005",
+        ]
+        summary = quality_batch.summary()
+        assert summary["papers"] == 5
+        assert summary["marker_success_rate"] == pytest.approx(0.2)
+        assert summary["mean_sections"] == 4
+        assert summary["total_parse_time"] == pytest.approx(2.5)
+
+    async def test_parse_batch_cancels_siblings_before_close(self, sample_pdf_path):
+        """Test a failure without skip_errors stops other parses before closing."""
+        import asyncio
+
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+        from packages.ingestion.parsing_pipeline import (
+            ParsingPipeline,
+            ParsingPipelineConfig,
+            parse_batch,
+        )
+
+        papers = [
+            ArxivPaper(
+                metadata=PaperMetadata(
+                    id=f"2401.0000{i}",
+                    title="Test",
+                    authors="Author",
+                    categories="quant-ph",
+                    abstract="",
+                    update_date="2024-01-15",
+                ),
+                pdf_path=sample_pdf_path,
+            )
+            for i in range(4)
+        ]
+        in_flight = 0
+        in_flight_at_close = None
+
+        async def fake_parse(self, paper):
+            nonlocal in_flight
+            if paper.arxiv_id.endswith("0"):
+                raise RuntimeError("parse failed")
+            in_flight += 1
+            try:
+                await asyncio.sleep(10)
+            finally:
+                in_flight -= 1
+
+        async def fake_close(self):
+            nonlocal in_flight_at_close
+            in_flight_at_close = in_flight
+
+        config = ParsingPipelineConfig(use_marker=False, use_grobid=False)
+        with (
+            patch.object(ParsingPipeline, "parse", fake_parse),
+            patch.object(ParsingPipeline, "close", fake_close),
+            pytest.raises(RuntimeError),
+        ):
+            await parse_batch(papers, config, skip_errors=False, concurrency=4)
+
+        assert in_flight_at_close == 0
+
+    async def test_latex_skipped_when_marker_found_equations(self, sample_pdf_path):
+        """Test the LaTeX rescan is skipped only when Marker covered all display math."""
+        from packages.ingestion.models import ArxivPaper, PaperMetadata
+        from packages.ingestion.parsing_pipeline import ParsingPipeline, ParsingPipelineConfig
+
+        paper = ArxivPaper(
+            metadata=PaperMetadata(
+                id="2401.00001",
+                title="Test",
+                authors="Author",
+                categories="quant-ph",
+                abstract="",
+                update_date="2024-01-15",
+            ),
+            pdf_path=sample_pdf_path,
+        )
+        pipeline = ParsingPipeline(ParsingPipelineConfig(use_marker=False, use_grobid=False))
+        pipeline.config.use_marker = True
+        pipeline.marker_parser = MagicMock()
+
+        cases = [
+            (["E=mc^2"], "$$a+b$$", False),
+            ([], "$$a+b$$", True),
+            (["E=mc^2"], "$$a+b$$ \\begin{equation}x=1\\end{equation}", True),
+            (["E=mc^2"], "$$a+b$$ \\[y=2\\]", True),
+        ]
+        for marker_equations, full_text, expect_latex in cases:
+            pipeline.marker_parser.parse.return_value = ParsedPaper(
+                arxiv_id="2401.00001",
+                title="Test",
+                abstract="",
+                authors=["Author"],
+                categories=["quant-ph"],
+                full_text=full_text,
+                equations=list(marker_equations),
+                parser_used=ParserType.MARKER,
+            )
+            with patch.object(pipeline, "_run_latex", return_value={}) as mock_latex:
+                await pipeline.parse(paper)
+            assert mock_latex.called is expect_latex
+
+    def test_merge_citations_dedupes_and_keeps_order(self):
+        """Test citation merge drops duplicates across and within parsers."""
+        from packages.ingestion.models import Citation
+        from packages.ingestion.parsing_pipeline import _merge_citations
+
+        existing = [
+            Citation(raw_text="Ref A"),
+            Citation(raw_text="Ref A"),
+            Citation(raw_text="Ref B"),
+        ]
+        new = [Citation(raw_text="Ref B"), Citation(raw_text="Ref C", doi="10.1/c")]
+
+        first = existing[0]
+        _merge_citations(existing, new)
+
+        assert [c.raw_text for c in existing] == ["Ref A", "Ref B", "Ref C"]
+        assert existing[0] is first
+
 
 class TestParsingQualityMetrics:
     """Tests for parsing quality assessment."""
@@ -486,3 +486,245 @@ class TestRateLimiting:
 
                 # Should sleep for at least the Retry-After duration
                 assert any(call[0][0] >= 5 for call in mock_sleep.call_args_list)
+
+
+class TestPaperCache:
+    """Tests for the per-client paper cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self, mock_s2_response):
+        """Test concurrent lookups of one paper fetch it once."""
+        import asyncio
+
+        client = S2Client()
+
+        with patch.object(
+            client, "_get_json", AsyncMock(return_value=mock_s2_response)
+        ) as mock_get:
+            papers = await asyncio.gather(
+                *(client.get_paper_by_arxiv_id("2401.12345") for _ in range(3))
+            )
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/paper/ARXIV:2401.12345")
+        assert all(paper.title == mock_s2_response["title"] for paper in papers)
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays bounded."""
+        from packages.ingestion import s2_client
+
+        client = S2Client()
+
+        with (
+            patch.object(s2_client, "PAPER_CACHE_SIZE", 2),
+            patch.object(client, "_get_json", AsyncMock(return_value={"paperId": "x"})) as mock_get,
+        ):
+            for arxiv_id in ["2401.00001", "2401.00002", "2401.00001", "2401.00003"]:
+                await client.get_paper_by_arxiv_id(arxiv_id)
+
+        assert list(client._paper_cache) == ["2401.00001", "2401.00003"]
+        assert mock_get.call_count == 3
+
+
+class TestBatchFetch:
+    """Tests for /paper/batch fetching."""
+
+    @pytest.mark.asyncio
+    async def test_batch_fetch_papers_chunks_and_falls_back(self, mock_s2_response):
+        """Test IDs are posted in chunks and only failed batches are fetched singly."""
+        import aiohttp
+
+        client = S2Client()
+        session = MagicMock()
+        responses = [[mock_s2_response, None], aiohttp.ClientError("batch down")]
+
+        def fake_post(url, params=None, json=None):
+            outcome = responses.pop(0)
+            response = AsyncMock()
+            response.raise_for_status = MagicMock()
+            if isinstance(outcome, Exception):
+                response.raise_for_status.side_effect = outcome
+            else:
+                response.json = AsyncMock(return_value=outcome)
+            ctx = MagicMock()
+            ctx.__aenter__ = AsyncMock(return_value=response)
+            ctx.__aexit__ = AsyncMock(return_value=False)
+            return ctx
+
+        session.post.side_effect = fake_post
+        fallback = {"paperId": "fallback", "title": "Fallback"}
+
+        with (
+            patch.object(client, "_get_session", return_value=session),
+            patch.object(client, "_get_json", AsyncMock(return_value=fallback)) as mock_get,
+        ):
+            papers = await client.batch_fetch_papers(
+                ["2401.00001", "2401.00002", "2401.00003"], delay=0, batch_size=2
+            )
+
+        assert session.post.call_count == 2
+        assert session.post.call_args_list[0].kwargs["json"] == {
+            "ids": ["ARXIV:2401.00001", "ARXIV:2401.00002"]
+        }
+        # The null entry means "not found": cached as missing, never retried
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/paper/ARXIV:2401.00003")
+        assert [p.title for p in papers] == [mock_s2_response["title"], "Fallback"]
+        assert client._paper_cache["2401.00002"] is None
+        assert client._paper_cache["2401.00001"].title == mock_s2_response["title"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_papers_concurrently_caps_in_flight(self):
+        """Test single-paper fetches overlap up to the API-key limit."""
+        import asyncio
+
+        client = S2Client(api_key="test_key_123")
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(arxiv_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if arxiv_id.endswith("7") else MagicMock(paperId=arxiv_id)
+
+        arxiv_ids = [f"2401.{i:05d}" for i in range(25)]
+        with patch.object(client, "get_paper_by_arxiv_id", side_effect=fake_get):
+            papers = await client.fetch_papers_concurrently(arxiv_ids, delay=0)
+
+        assert 1 < peak <= 10
+        assert [p.paperId if p else None for p in papers] == [
+            None if a.endswith("7") else a for a in arxiv_ids
+        ]
+
+
+class TestRestEndpoints:
+    """Tests for responses decoded straight from the REST API."""
+
+    @pytest.mark.asyncio
+    async def test_get_paper_references_uses_references_endpoint(self):
+        """Test references come from /references without fetching the paper."""
+        client = S2Client()
+        response = {
+            "data": [
+                {
+                    "citedPaper": {
+                        "paperId": "ref1",
+                        "title": "Cited Work",
+                        "year": 2020,
+                        "authors": [{"name": "Dana Lee"}],
+                        "externalIds": {"ArXiv": "2001.00001", "DOI": "10.1/x"},
+                    }
+                },
+                {"citedPaper": {"paperId": None, "title": "Unresolved"}},
+            ]
+        }
+
+        with patch.object(client, "_get_json", AsyncMock(return_value=response)) as mock_get:
+            references = await client.get_paper_references("2401.12345", limit=10)
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/paper/ARXIV:2401.12345/references")
+        assert references[0] == {
+            "paper_id": "ref1",
+            "title": "Cited Work",
+            "year": 2020,
+            "authors": ["Dana Lee"],
+            "arxiv_id": "2001.00001",
+            "doi": "10.1/x",
+        }
+        assert references[1]["authors"] == []
+        assert references[1]["arxiv_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self):
+        """Test every request shares one pooled session."""
+        async with S2Client(api_key="test_key_123") as client:
+            session = client.session
+            assert session is not None
+            assert client._get_session() is session
+            assert session.headers["x-api-key"] == "test_key_123"
+            assert session.connector.limit_per_host == 10
+
+        assert client.session is None
+        assert session.closed
+
+
+def _http_response(status, body=None, headers=None):
+    """Build a mocked aiohttp response context for session.get()."""
+    import aiohttp
+
+    response = AsyncMock()
+    response.status = status
+    response.json = AsyncMock(return_value=body)
+    if status >= 400:
+        response.raise_for_status = MagicMock(
+            side_effect=aiohttp.ClientResponseError(
+                MagicMock(), (), status=status, headers=headers or {}
+            )
+        )
+    else:
+        response.raise_for_status = MagicMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=response)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return ctx
+
+
+class TestRetries:
+    """Tests for rate-limit and server-error retries."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_honours_retry_after(self, mock_s2_response):
+        """Test a 429 is retried after the server's Retry-After delay."""
+        client = S2Client()
+        session = MagicMock()
+        session.get.side_effect = [
+            _http_response(429, headers={"Retry-After": "3"}),
+            _http_response(200, mock_s2_response),
+        ]
+
+        with (
+            patch.object(client, "_get_session", return_value=session),
+            patch("asyncio.sleep", AsyncMock()) as mock_sleep,
+        ):
+            paper = await client.get_paper_by_arxiv_id("2401.12345")
+
+        assert paper.title == mock_s2_response["title"]
+        assert session.get.call_count == 2
+        mock_sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_persistent_server_error_is_not_reported_as_missing(self):
+        """Test exhausted retries raise instead of returning None."""
+        import aiohttp
+
+        from packages.ingestion.s2_client import S2_MAX_ATTEMPTS
+
+        client = S2Client()
+        session = MagicMock()
+        session.get.side_effect = lambda *args, **kwargs: _http_response(503)
+
+        with (
+            patch.object(client, "_get_session", return_value=session),
+            patch("asyncio.sleep", AsyncMock()),
+            pytest.raises(aiohttp.ClientResponseError),
+        ):
+            await client.get_paper_by_arxiv_id("2401.12345")
+
+        assert session.get.call_count == S2_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_retried(self):
+        """Test a 404 maps to None without retrying."""
+        client = S2Client()
+        session = MagicMock()
+        session.get.side_effect = lambda *args, **kwargs: _http_response(404)
+
+        with patch.object(client, "_get_session", return_value=session):
+            assert await client.get_paper_by_arxiv_id("9999.99999") is None
+
+        assert session.get.call_count == 1